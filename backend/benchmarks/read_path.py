@@ -0,0 +1,103 @@
+"""
+Benchmark: ORM hydration vs the Core read path for the pending-orders list.
+
+Usage:
+    uv run python benchmarks/read_path.py [--orders 2000] [--items 4] [--repeat 5]
+
+Seeds a temporary SQLite database, then times and measures allocations for
+loading every pending order (with items) and building the API responses.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, selectinload, sessionmaker
+
+from backend.database import Base
+from backend.models.order import Order, OrderItem, OrderStatus
+from backend.queries import fetch_orders_by_status
+from backend.schemas.order import OrderResponse
+
+
+def seed(session: Session, order_count: int, items_per_order: int) -> None:
+    for i in range(order_count):
+        order = Order(table_number=i % 30 + 1, status=OrderStatus.PENDING)
+        for j in range(items_per_order):
+            OrderItem(name=f"Dish {j}", amount=j + 1, price_cents=150 + j, order=order)
+        session.add(order)
+    session.commit()
+
+
+def orm_path(session: Session) -> list[OrderResponse]:
+    orders = (
+        session.query(Order)
+        .options(selectinload(Order.items))
+        .filter(Order.status == OrderStatus.PENDING)
+        .order_by(Order.created_at.asc())
+        .all()
+    )
+    return [OrderResponse.from_order(order) for order in orders]
+
+
+def core_path(session: Session) -> list[OrderResponse]:
+    records = fetch_orders_by_status(session, OrderStatus.PENDING)
+    return [OrderResponse.from_order(r, total_cents=r.total_cents) for r in records]
+
+
+def measure(
+    factory: Callable[[], Session], fn: Callable[[Session], list], repeat: int
+) -> tuple[float, int, int]:
+    """Return (best seconds, allocated blocks, peak bytes) for one call of fn."""
+    best = float("inf")
+    for _ in range(repeat):
+        with factory() as session:
+            start = time.perf_counter()
+            fn(session)
+            best = min(best, time.perf_counter() - start)
+
+    with factory() as session:
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        result = fn(session)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+        del result
+    return best, blocks, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as session:
+            seed(session, args.orders, args.items)
+
+        rows = args.orders * (args.items + 1)
+        print(f"{args.orders} pending orders x {args.items} items ({rows} rows)")
+        print(f"{'path':<6} {'best ms':>9} {'us/row':>8} {'alloc blocks':>13} {'peak KiB':>9}")
+        for name, fn in (("orm", orm_path), ("core", core_path)):
+            best, blocks, peak = measure(factory, fn, args.repeat)
+            print(f"{name:<6} {best * 1000:>9.1f} {best * 1e6 / rows:>8.2f} {blocks:>13} {peak / 1024:>9.0f}")
+    finally:
+        engine.dispose()
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Request body size limit, enforced before the body is parsed or validated."""
+
+import logging
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.request_context import resolve_operation_id
+
+logger = logging.getLogger(__name__)
+
+
+def _replay(messages: list[Message], receive: Receive) -> Receive:
+    """Return a receive callable that yields ``messages`` before ``receive``."""
+    pending = list(messages)
+
+    async def replay_receive() -> Message:
+        if pending:
+            return pending.pop(0)
+        return await receive()
+
+    return replay_receive
+
+
+class BodySizeLimitMiddleware:
+    """
+    ASGI middleware that answers 413 for request bodies over ``max_bytes``.
+
+    A declared ``Content-Length`` is checked before anything is read. Bodies
+    without one (chunked uploads) are read here, at most ``max_bytes`` of
+    them, and handed to the app once complete, so an oversized order never
+    reaches JSON decoding or Pydantic validation.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int, path_prefix: str = "/api/") -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = next(
+            (value for name, value in scope["headers"] if name == b"content-length"), None
+        )
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > self.max_bytes:
+                await self._reject(scope, receive, send, int(content_length))
+                return
+            await self.app(scope, receive, send)
+            return
+
+        # No usable Content-Length (chunked upload): read and count the body
+        # here, then replay it. Failing while FastAPI reads the body would be
+        # reported as a 400 parse error instead of a 413.
+        chunks: list[bytes] = []
+        received = 0
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                # Client went away; let the app see the disconnect
+                await self.app(scope, _replay([message], receive), send)
+                return
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if received > self.max_bytes:
+                await self._reject(scope, receive, send, received)
+                return
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+
+        body = {"type": "http.request", "body": b"".join(chunks), "more_body": False}
+        await self.app(scope, _replay([body], receive), send)
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send, size: int) -> None:
+        logger.warning(
+            "Request body too large",
+            extra={
+                "operation_id": resolve_operation_id(scope),
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+            },
+        )
+        response = JSONResponse(
+            status_code=413,
+            content={"detail": f"Request body exceeds {self.max_bytes} bytes"},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,105 @@
+"""Append-only order change log used by the incremental sync feed."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from backend.database import SessionLocal
+from backend.models.order import Order, OrderChange, OrderChangeType
+from backend.schemas.order import OrderResponse
+from backend.tenancy import live_tenant_databases
+
+logger = logging.getLogger(__name__)
+
+
+def record_order_change(db: Session, order: Order, change: OrderChangeType) -> None:
+    """
+    Stage a change log entry for an order in the caller's transaction.
+
+    The entry is committed (or rolled back) together with the mutation itself.
+    CREATED entries carry a full order snapshot so a syncing client never has
+    to re-fetch the order; status changes only carry the new status.
+
+    Args:
+        db: Database session holding the pending mutation
+        order: Order being mutated (flushed, so it has an id)
+        change: Kind of mutation
+    """
+    payload = None
+    if change == OrderChangeType.CREATED:
+        payload = OrderResponse.from_order(order).model_dump(mode="json")
+
+    db.add(
+        OrderChange(
+            order_id=order.id,
+            change=change,
+            status=order.status,
+            payload=payload,
+        )
+    )
+
+
+def oldest_retained_seq(db: Session) -> int | None:
+    """Return the smallest sequence number still present in the log."""
+    return db.scalar(select(func.min(OrderChange.seq)))
+
+
+def compact_order_changes(db: Session, retention: timedelta) -> int:
+    """
+    Delete change log entries older than the retention window.
+
+    The newest entry is always kept so the log never becomes empty once
+    written; that keeps the "cursor too old" check in the feed reliable.
+
+    Args:
+        db: Database session
+        retention: How long entries are kept
+
+    Returns:
+        Number of deleted entries
+    """
+    newest = db.scalar(select(func.max(OrderChange.seq)))
+    if newest is None:
+        return 0
+
+    cutoff = datetime.now(timezone.utc) - retention
+    result = db.execute(
+        delete(OrderChange).where(
+            OrderChange.changed_at < cutoff,
+            OrderChange.seq < newest,
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+def _compact_once(retention: timedelta) -> int:
+    session_factories = [SessionLocal]
+    session_factories += [database.session_factory for database in live_tenant_databases()]
+    deleted = 0
+    for session_factory in session_factories:
+        db = session_factory()
+        try:
+            deleted += compact_order_changes(db, retention)
+        finally:
+            db.close()
+    return deleted
+
+
+async def run_change_log_compaction(interval_seconds: int, retention: timedelta) -> None:
+    """
+    Periodically compact the change log until cancelled.
+
+    Covers the default database and every tenant database that is open;
+    tenants evicted from the registry are compacted once they are used again.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            deleted = await asyncio.to_thread(_compact_once, retention)
+            logger.info("Compacted order change log", extra={"deleted": deleted})
+        except Exception as e:
+            logger.error("Failed to compact order change log", exc_info=e)
@@ -1,3 +1,6 @@
+from typing import Literal
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,9 +22,152 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    # python -m backend.server: worker processes (0 = one per usable CPU, but
+    # one on SQLite); in-process caches, limits and stats are per worker, so
+    # only raise it deliberately. "auto" picks uvloop/httptools when installed.
+    # limit_concurrency answers 503 beyond that many open connections/tasks
+    # per worker (unset = no limit).
+    server_workers: int = 1
+    server_loop: Literal["auto", "uvloop", "asyncio"] = "auto"
+    server_http: Literal["auto", "httptools", "h11"] = "auto"
+    server_backlog: int = 2048
+    server_keep_alive_seconds: int = 5
+    server_limit_concurrency: int | None = None
+    server_h11_max_incomplete_event_size: int = 16 * 1024
+    # Import the app and create the schema once in the supervisor before
+    # starting workers, so configuration errors fail fast
+    server_preload: bool = True
+    # Worker threads for sync endpoints and dependencies (AnyIO's default
+    # limiter, 40 unless set); waits for a thread are measured per operation
+    threadpool_size: int = 40
 
     # Database
     database_url: str = "sqlite:///./restaurant.db"
+    # Order storage: "sqlalchemy" (database_url) or "memory" (non-durable)
+    order_repository: Literal["sqlalchemy", "memory"] = "sqlalchemy"
+
+    # Multi-restaurant tenancy: the tenant comes from tenant_header, else the
+    # subdomain of tenant_base_domain, else default_tenant. A "{tenant}"
+    # placeholder in the URL template gives each tenant its own database;
+    # without it tenants share the server and get a schema each. Requires the
+    # sqlalchemy repository. Change-log compaction, maintenance and readiness
+    # cover the tenant databases currently open (up to tenant_max_engines).
+    # Only tenant_allowlist ids are served (404 otherwise) unless
+    # tenant_auto_create accepts any valid id; every new id creates a database.
+    tenancy_enabled: bool = False
+    tenant_header: str = "X-Tenant-ID"
+    tenant_base_domain: str | None = None
+    default_tenant: str | None = None
+    tenant_allowlist: list[str] = []
+    tenant_auto_create: bool = False
+    tenant_database_url_template: str = "sqlite:///./data/tenants/{tenant}.db"
+    tenant_max_engines: int = 32
+
+    # Readiness probe (/health/ready): result cache and not-ready thresholds
+    health_cache_ttl_seconds: float = 2.0
+    health_max_db_latency_ms: float = 500.0
+    health_max_writer_queue: int = 8
+    health_min_free_disk_mb: int = 50
+
+    # SQLite maintenance (PRAGMA optimize/ANALYZE, incremental vacuum, WAL
+    # checkpoints) during quiet windows, as "HH:MM-HH:MM" in business_timezone
+    maintenance_enabled: bool = True
+    maintenance_windows: list[str] = ["03:00-05:00"]
+    maintenance_check_interval_seconds: int = 60
+    maintenance_time_budget_ms: int = 200
+    maintenance_analysis_limit: int = 1000
+    maintenance_vacuum_pages: int = 256
+
+    # Query statistics and slow-query log
+    query_stats_enabled: bool = True
+    slow_query_threshold_ms: float = 100.0
+    query_stats_max_fingerprints: int = 500
+    query_stats_sample_size: int = 1024
+
+    # Tracing (sampled requests get a Server-Timing header and optional export)
+    tracing_sample_rate: float = 0.1
+    tracing_server_timing: bool = True
+    tracing_export_path: str | None = None
+    tracing_export_max_bytes: int = 50 * 1024 * 1024
+
+    # Change feed
+    change_feed_default_limit: int = 100
+    change_feed_max_limit: int = 1000
+    change_log_retention_hours: int = 24
+    change_log_compact_interval_seconds: int = 300
+
+    # Pending list: concurrent identical requests share one query and its JSON;
+    # the result is also reused for this many milliseconds (0 = only in-flight)
+    pending_orders_coalescing: bool = True
+    pending_orders_ttl_ms: int = 500
+
+    # Post-commit job queue (order events today; notifications, printing and
+    # analytics later): bounded size, worker tasks, retries with exponential
+    # backoff, and how long shutdown waits for queued jobs
+    jobs_queue_size: int = 1000
+    jobs_workers: int = 2
+    jobs_max_attempts: int = 3
+    jobs_retry_base_seconds: float = 0.5
+    jobs_retry_max_seconds: float = 30.0
+    jobs_drain_timeout_seconds: float = 10.0
+
+    # Order ingestion: request bodies over this many bytes get 413 before they
+    # are parsed; orders with more lines get 422 before the lines are validated.
+    # Lines with the same name and price are merged into one with the summed amount.
+    max_request_body_bytes: int = 64 * 1024
+    order_max_items: int = 100
+    order_merge_duplicate_items: bool = True
+
+    # Single-order read cache (GET /orders/{id}); 0 entries disables it. Hits
+    # are checked against the order's current version; the TTL frees memory.
+    order_cache_max_entries: int = 10_000
+    order_cache_ttl_seconds: float = 60.0
+
+    # Streaming export (rows buffered per cursor fetch, bytes per response chunk)
+    export_batch_size: int = 1000
+    export_chunk_bytes: int = 64 * 1024
+
+    # Bulk importer (python -m backend.importer): orders per transaction
+    import_chunk_size: int = 5000
+
+    # Dashboard summary ("today" for revenue, as an IANA timezone name)
+    business_timezone: str = "UTC"
+
+    # Prep-time report (GET /reports/prep-times): days covered without from/to
+    prep_time_report_default_days: int = 30
+
+    # Admin endpoints (X-Admin-Token header); unset leaves them open
+    admin_token: str | None = None
+
+    # Rate limiting (token bucket per client and operation_id). Off by default:
+    # a venue's tablets usually share one NAT address, so the per-IP limits
+    # below are sized for a whole restaurant rather than one device
+    rate_limit_enabled: bool = False
+    rate_limit_default_rate: float = 20.0
+    rate_limit_default_burst: int = 40
+    # operation_id -> (tokens per second, burst); a rate of 0 disables the limit
+    rate_limits: dict[str, tuple[float, int]] = {
+        "create_order": (10.0, 50),
+        "list_pending_orders": (20.0, 100),
+    }
+    # Only these keys (sent in rate_limit_key_header) get a bucket of their
+    # own; other clients are limited by IP
+    rate_limit_key_header: str = "X-API-Key"
+    rate_limit_api_keys: list[str] = []
+    # Behind proxies (Railway, nginx) take the client IP from X-Forwarded-For:
+    # the entry added by the outermost trusted proxy, trusted_proxy_hops from
+    # the right. The Docker image turns this on; without it every client
+    # behind the proxy shares one bucket.
+    rate_limit_trust_forwarded_for: bool = False
+    rate_limit_trusted_proxy_hops: int = 1
+    rate_limit_idle_seconds: int = 300
+    rate_limit_max_buckets: int = 10_000
+
+    # Profiling (sampled requests, or X-Profile: 1 with a valid X-Admin-Token)
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = 0.01
+    profiling_dir: str = "./profiles"
+    profiling_max_bytes: int = 100 * 1024 * 1024
 
     # Logging
     log_level: str = "INFO"
@@ -32,5 +178,23 @@ class Settings(BaseSettings):
     cors_allow_methods: list[str] = ["*"]
     cors_allow_headers: list[str] = ["*"]
 
+    @model_validator(mode="after")
+    def check_tenancy_storage(self) -> "Settings":
+        """
+        Reject tenancy on the in-memory repository, which has no per-tenant
+        storage, and tenancy open to arbitrary tenant ids unless opted into.
+        """
+        if self.tenancy_enabled and self.order_repository == "memory":
+            raise ValueError(
+                "TENANCY_ENABLED requires ORDER_REPOSITORY=sqlalchemy; "
+                "the in-memory repository would share orders between tenants"
+            )
+        if self.tenancy_enabled and not self.tenant_allowlist and not self.tenant_auto_create:
+            raise ValueError(
+                "TENANCY_ENABLED requires a non-empty TENANT_ALLOWLIST, or "
+                "TENANT_AUTO_CREATE=true to create a database for any tenant id"
+            )
+        return self
+
 
 settings = Settings()
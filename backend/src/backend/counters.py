@@ -0,0 +1,268 @@
+"""
+Dashboard counters maintained in the same transaction as every status change.
+
+Reading the summary never scans ``orders``: per-status counts and daily
+revenue live in tiny counter tables that mutations bump, and the oldest
+active order is an index lookup on ``(status, created_at)``. The kitchen
+prep list works the same way: ``prep_list`` holds one row per dish with the
+quantity still owed by active orders.
+"""
+
+import logging
+from collections.abc import Mapping
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Connection, Insert, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.models.order import ACTIVE_STATUSES, Order, OrderItem, OrderStatus
+from backend.models.summary import DailyRevenue, OrderStatusCount, PrepListItem
+
+logger = logging.getLogger(__name__)
+
+status_counts = OrderStatusCount.__table__
+daily_revenue = DailyRevenue.__table__
+prep_list = PrepListItem.__table__
+
+
+def business_day(now: datetime | None = None) -> date:
+    """Return the current date in the restaurant's timezone."""
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(ZoneInfo(settings.business_timezone)).date()
+
+
+def _bump_status(db: Session | Connection, order_status: OrderStatus, delta: int) -> None:
+    result = db.execute(
+        update(status_counts)
+        .where(status_counts.c.status == order_status)
+        .values(count=status_counts.c.count + delta)
+    )
+    if result.rowcount == 0:
+        db.execute(insert(status_counts).values(status=order_status, count=delta))
+
+
+def add_revenue(db: Session | Connection, day: date, cents: int, completed_orders: int = 1) -> None:
+    """Stage an increment of a business day's revenue in the caller's transaction."""
+    result = db.execute(
+        update(daily_revenue)
+        .where(daily_revenue.c.day == day)
+        .values(
+            revenue_cents=daily_revenue.c.revenue_cents + cents,
+            completed_orders=daily_revenue.c.completed_orders + completed_orders,
+        )
+    )
+    if result.rowcount == 0:
+        db.execute(
+            insert(daily_revenue).values(
+                day=day, revenue_cents=cents, completed_orders=completed_orders
+            )
+        )
+
+
+def apply_status_deltas(db: Session | Connection, deltas: Mapping[OrderStatus, int]) -> None:
+    """Stage several status count changes at once (e.g. for a bulk insert)."""
+    for order_status, delta in deltas.items():
+        if delta:
+            _bump_status(db, order_status, delta)
+
+
+def record_status_change(
+    db: Session,
+    old_status: OrderStatus | None,
+    new_status: OrderStatus,
+    total_cents: int = 0,
+) -> None:
+    """
+    Stage counter updates for an order transition in the caller's transaction.
+
+    Args:
+        db: Database session holding the pending mutation
+        old_status: Previous status, or None for a newly created order
+        new_status: Status the order moves to
+        total_cents: Order total, added to today's revenue on completion
+    """
+    if old_status == new_status:
+        return
+    if old_status is not None:
+        _bump_status(db, old_status, -1)
+    _bump_status(db, new_status, 1)
+    if new_status == OrderStatus.COMPLETED:
+        add_revenue(db, business_day(), total_cents)
+
+
+def apply_prep_deltas(db: Session | Connection, deltas: Mapping[str, int]) -> None:
+    """Stage quantity changes per dish; dishes that reach zero are removed."""
+    drained = []
+    for name, delta in deltas.items():
+        if not delta:
+            continue
+        result = db.execute(
+            update(prep_list)
+            .where(prep_list.c.name == name)
+            .values(quantity=prep_list.c.quantity + delta)
+        )
+        if result.rowcount == 0 and delta > 0:
+            db.execute(insert(prep_list).values(name=name, quantity=delta))
+        elif delta < 0:
+            drained.append(name)
+    if drained:
+        db.execute(delete(prep_list).where(prep_list.c.name.in_(drained), prep_list.c.quantity <= 0))
+
+
+def order_prep_quantities(db: Session, order_id: int) -> dict[str, int]:
+    """Sum an order's item amounts per dish name."""
+    rows = db.execute(
+        select(OrderItem.name, func.sum(OrderItem.amount))
+        .where(OrderItem.order_id == order_id)
+        .group_by(OrderItem.name)
+    ).all()
+    return dict(rows)
+
+
+def record_prep_change(
+    db: Session,
+    order_id: int,
+    old_status: OrderStatus | None,
+    new_status: OrderStatus,
+    quantities: Mapping[str, int] | None = None,
+) -> None:
+    """
+    Stage prep list updates for an order transition in the caller's transaction.
+
+    Only transitions into or out of the active statuses touch the prep list;
+    moving between active statuses (e.g. pending to in_progress) does not.
+
+    Args:
+        db: Database session holding the pending mutation
+        order_id: Order being mutated
+        old_status: Previous status, or None for a newly created order
+        new_status: Status the order moves to
+        quantities: The order's quantities per dish, if already known
+    """
+    was_active = old_status in ACTIVE_STATUSES
+    is_active = new_status in ACTIVE_STATUSES
+    if was_active == is_active:
+        return
+    if quantities is None:
+        quantities = order_prep_quantities(db, order_id)
+    sign = 1 if is_active else -1
+    apply_prep_deltas(db, {name: sign * quantity for name, quantity in quantities.items()})
+
+
+def order_total_cents(db: Session, order_id: int) -> int:
+    """Compute an order's total in SQL without loading its items."""
+    return db.scalar(
+        select(func.coalesce(func.sum(OrderItem.amount * OrderItem.price_cents), 0)).where(
+            OrderItem.order_id == order_id
+        )
+    )
+
+
+def _seed(db: Session, statement: Insert, rows: list[dict]) -> bool:
+    """Insert seed rows and commit; False if another process seeded the table first."""
+    try:
+        db.execute(statement, rows)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+    return True
+
+
+def backfill_status_counts(db: Session) -> bool:
+    """
+    Seed the status counters from ``orders`` if they have never been written.
+
+    Runs one grouped COUNT at startup so databases created before the counter
+    tables existed start out consistent. Revenue of past days is not
+    reconstructed. Safe to run from several processes at once: whoever
+    inserts second backs off.
+
+    Returns:
+        True if the counters were seeded
+    """
+    if db.scalar(select(func.count()).select_from(status_counts)):
+        return False
+    rows = db.execute(select(Order.status, func.count()).group_by(Order.status)).all()
+    if not rows:
+        return False
+    if not _seed(db, insert(status_counts), [{"status": s, "count": n} for s, n in rows]):
+        return False
+    logger.info("Backfilled order status counters", extra={"statuses": len(rows)})
+    return True
+
+
+def backfill_prep_list(db: Session) -> bool:
+    """
+    Seed the prep list from active orders if it is empty.
+
+    An empty table is also the correct state when nothing is active; the
+    grouped SUM then returns no rows and nothing is written. Concurrent
+    callers are handled as in ``backfill_status_counts``.
+
+    Returns:
+        True if the prep list was seeded
+    """
+    if db.scalar(select(func.count()).select_from(prep_list)):
+        return False
+    rows = db.execute(
+        select(OrderItem.name, func.sum(OrderItem.amount))
+        .join(Order, Order.id == OrderItem.order_id)
+        .where(Order.status.in_(ACTIVE_STATUSES))
+        .group_by(OrderItem.name)
+    ).all()
+    if not rows:
+        return False
+    if not _seed(db, insert(prep_list), [{"name": name, "quantity": n} for name, n in rows]):
+        return False
+    logger.info("Backfilled kitchen prep list", extra={"dishes": len(rows)})
+    return True
+
+
+def read_prep_list(db: Session) -> list[tuple[str, int]]:
+    """Read ``(name, quantity)`` per dish owed by active orders, largest first."""
+    rows = db.execute(
+        select(prep_list.c.name, prep_list.c.quantity)
+        .where(prep_list.c.quantity > 0)
+        .order_by(prep_list.c.quantity.desc(), prep_list.c.name)
+    ).all()
+    return [(name, quantity) for name, quantity in rows]
+
+
+def read_summary(db: Session) -> dict:
+    """
+    Read the dashboard summary from the counters.
+
+    Returns:
+        Mapping with ``counts`` per status, ``oldest_active_created_at``,
+        ``day``, ``revenue_cents`` and ``completed_orders``
+    """
+    counts = {s: 0 for s in OrderStatus}
+    counts.update(db.execute(select(status_counts.c.status, status_counts.c.count)).all())
+
+    # One MIN per status so each is a single seek on ix_orders_status_created_at
+    oldest_per_status = select(
+        *(
+            select(func.min(Order.created_at)).where(Order.status == s).scalar_subquery()
+            for s in ACTIVE_STATUSES
+        )
+    )
+    oldest = [ts for ts in db.execute(oldest_per_status).one() if ts is not None]
+
+    day = business_day()
+    revenue = db.execute(
+        select(daily_revenue.c.revenue_cents, daily_revenue.c.completed_orders).where(
+            daily_revenue.c.day == day
+        )
+    ).first()
+
+    return {
+        "counts": counts,
+        "oldest_active_created_at": min(oldest) if oldest else None,
+        "day": day,
+        "revenue_cents": revenue.revenue_cents if revenue else 0,
+        "completed_orders": revenue.completed_orders if revenue else 0,
+    }
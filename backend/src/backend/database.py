@@ -1,11 +1,21 @@
 """Database configuration and session management."""
 
+import logging
+import threading
+import time
 from collections.abc import Generator
 
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from backend.config import settings
+from backend.query_stats import fingerprint, fingerprint_id, query_stats
+from backend.request_context import current_operation_id
+from backend.tracing import SPAN_KIND_CLIENT, is_tracing, record_span
+
+slow_query_logger = logging.getLogger("backend.slow_query")
 
 
 class Base(DeclarativeBase):
@@ -14,34 +24,167 @@ class Base(DeclarativeBase):
     pass
 
 
+def use_wal(engine: Engine) -> Engine:
+    """
+    Put every connection of a file-backed SQLite ``engine`` in WAL mode.
+
+    Readers then no longer block the writer (and vice versa), and the
+    maintenance scheduler's checkpoint job has a WAL to fold back. Other
+    databases and in-memory SQLite are returned unchanged.
+    """
+    if engine.dialect.name != "sqlite" or engine.url.database in (None, "", ":memory:"):
+        return engine
+
+    @event.listens_for(engine, "connect")
+    def _enable_wal(dbapi_connection, connection_record) -> None:
+        dbapi_connection.execute("PRAGMA journal_mode = WAL")
+
+    return engine
+
+
 # Create database engine
 DATABASE_URL = settings.database_url
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+engine = use_wal(
+    create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    )
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def get_db() -> Generator[Session, None, None]:
+class WriterGauge:
+    """
+    Number of connections with an open write transaction.
+
+    SQLite admits one writer at a time, so everything above 1 is queued on
+    ``busy_timeout``. A connection enters the gauge with its first DML
+    statement and leaves it on commit or rollback.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active = 0
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def enter(self) -> None:
+        with self._lock:
+            self._active += 1
+
+    def leave(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+
+writer_gauge = WriterGauge()
+
+_WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info["query_start_time"] = time.perf_counter()
+    if "in_write" not in conn.info and statement.lstrip()[:7].upper().startswith(_WRITE_STATEMENTS):
+        conn.info["in_write"] = True
+        writer_gauge.enter()
+    if is_tracing():
+        conn.info["query_start_ns"] = time.time_ns()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query_time(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Aggregate statement timings by fingerprint and log slow statements."""
+    start_ns = conn.info.pop("query_start_ns", None)
+    start = conn.info.pop("query_start_time", None)
+    if not settings.query_stats_enabled:
+        start = None
+    if start_ns is None and start is None:
+        return
+    # Normalised once for both the span and the statistics
+    normalized = fingerprint(statement)
+
+    if start_ns is not None:
+        record_span(
+            "db.query",
+            start_ns,
+            time.time_ns(),
+            SPAN_KIND_CLIENT,
+            **{"db.system": conn.dialect.name, "db.statement": normalized},
+        )
+
+    if start is None:
+        return
+    duration_ms = (time.perf_counter() - start) * 1000
+    query_stats.record(normalized, duration_ms)
+
+    if duration_ms >= settings.slow_query_threshold_ms:
+        slow_query_logger.warning(
+            "Slow query",
+            extra={
+                "duration_ms": round(duration_ms, 3),
+                # DBAPIs report -1 when the count is unknown (e.g. SQLite SELECTs)
+                "row_count": cursor.rowcount if cursor.rowcount >= 0 else None,
+                "route": current_operation_id.get(),
+                "fingerprint": normalized,
+                "fingerprint_id": fingerprint_id(normalized),
+                "executemany": executemany,
+            },
+        )
+
+
+@event.listens_for(Engine, "commit")
+@event.listens_for(Engine, "rollback")
+def _end_write(conn) -> None:
+    if conn.info.pop("in_write", False):
+        writer_gauge.leave()
+
+
+def get_db(request: Request) -> Generator[Session, None, None]:
     """
     Dependency to get database session.
 
+    With tenancy enabled (and orders stored in the database) the session is
+    bound to the requesting tenant's database (see ``backend.tenancy``).
+
     Yields:
         Database session that will be automatically closed after use.
     """
-    db = SessionLocal()
+    session_factory = SessionLocal
+    if settings.tenancy_enabled and settings.order_repository == "sqlalchemy":
+        # Imported here: backend.tenancy builds on this module
+        from backend.tenancy import tenant_sessionmaker
+
+        session_factory = tenant_sessionmaker(request)
+    db = session_factory()
     try:
         yield db
     finally:
         db.close()
 
 
-def init_db() -> None:
-    """Initialize database tables."""
+def init_db(bind: Engine | None = None) -> None:
+    """
+    Initialize database tables (on the default engine unless ``bind`` is given)
+    and upgrade tables left by earlier releases (see ``backend.migrations``).
+    """
     # Import models to register them with Base.metadata
-    from backend.models import order  # noqa: F401
+    import backend.models  # noqa: F401
+    from backend.migrations import upgrade_schema
 
-    Base.metadata.create_all(bind=engine)
+    with (bind or engine).connect() as conn:
+        if conn.dialect.name == "sqlite" and not conn.exec_driver_sql(
+            "SELECT count(*) FROM sqlite_master"
+        ).scalar():
+            # Only possible before the first table exists; lets the maintenance
+            # scheduler return free pages with PRAGMA incremental_vacuum. A WAL
+            # database already has a header, so VACUUM applies the setting
+            conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.exec_driver_sql("VACUUM")
+        Base.metadata.create_all(bind=conn)
+        upgrade_schema(conn)
+        conn.commit()
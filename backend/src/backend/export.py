@@ -0,0 +1,95 @@
+"""Incremental NDJSON/CSV encoders for the streaming order export."""
+
+import csv
+import enum
+import io
+from collections.abc import Iterable, Iterator
+
+from backend.queries import OrderRecord
+from backend.schemas.order import OrderResponse, cents_to_decimal
+
+
+class ExportFormat(str, enum.Enum):
+    """Supported export encodings."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+# One CSV row per order item; orders without items get one row with empty item columns
+CSV_HEADER = (
+    "order_id",
+    "table_number",
+    "status",
+    "created_at",
+    "order_total",
+    "item_id",
+    "item_name",
+    "amount",
+    "price",
+)
+
+
+def _ndjson_lines(orders: Iterable[OrderRecord]) -> Iterator[str]:
+    for order in orders:
+        yield OrderResponse.from_order(order, total_cents=order.total_cents).model_dump_json()
+        yield "\n"
+
+
+def _csv_lines(orders: Iterable[OrderRecord]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    def flush() -> str:
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+    writer.writerow(CSV_HEADER)
+    yield flush()
+    for order in orders:
+        head = (
+            order.id,
+            order.table_number,
+            order.status.value,
+            order.created_at.isoformat(),
+            f"{cents_to_decimal(order.total_cents):.2f}",
+        )
+        if not order.items:
+            writer.writerow((*head, "", "", "", ""))
+        for item in order.items:
+            writer.writerow(
+                (*head, item.id, item.name, item.amount, f"{cents_to_decimal(item.price_cents):.2f}")
+            )
+        yield flush()
+
+
+def encode_export(
+    orders: Iterable[OrderRecord],
+    export_format: ExportFormat,
+    chunk_bytes: int = 64 * 1024,
+) -> Iterator[bytes]:
+    """
+    Encode orders incrementally, yielding chunks of roughly ``chunk_bytes``.
+
+    Rows are encoded one order at a time and coalesced into chunks so the
+    response is neither one write per row nor one giant buffer.
+    """
+    lines = _ndjson_lines(orders) if export_format == ExportFormat.NDJSON else _csv_lines(orders)
+    pending: list[str] = []
+    size = 0
+    for line in lines:
+        pending.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield "".join(pending).encode()
+            pending.clear()
+            size = 0
+    if pending:
+        yield "".join(pending).encode()
@@ -0,0 +1,438 @@
+"""
+Chunked bulk import of historical orders.
+
+Usage:
+    python -m backend.importer orders.ndjson [more files...] [--chunk-size 5000]
+
+Reads CSV or NDJSON files (the same layouts ``GET /api/v1/orders/export``
+writes), validates every order with ``OrderImport``/``OrderItemCreate`` and
+inserts them in chunks with one ``executemany`` per table. Each chunk commits
+together with the dashboard counters and the file's progress row, so an
+interrupted import resumes after the last committed chunk when re-run.
+
+Order ids are allocated from ``MAX(orders.id)``; run the importer while the
+API is not accepting writes. Only orders, items and the dashboard counters
+are written: the change log and prep-time statistics are not backfilled.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy import (
+    Connection,
+    Engine,
+    create_engine,
+    event,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.pool import NullPool
+
+from backend.config import settings
+from backend.counters import (
+    add_revenue,
+    apply_prep_deltas,
+    apply_status_deltas,
+    business_day,
+)
+from backend.database import init_db, use_wal
+from backend.logging_config import configure_logging
+from backend.models.import_progress import ImportProgress
+from backend.models.order import ACTIVE_STATUSES, Order, OrderItem, OrderStatus
+from backend.schemas.order import OrderImport, OrderItemCreate
+
+logger = logging.getLogger(__name__)
+
+orders = Order.__table__
+order_items = OrderItem.__table__
+import_progress = ImportProgress.__table__
+
+FORMATS = ("csv", "ndjson")
+
+# Per-connection pragmas trading crash durability for write speed. A process
+# crash is still safe (the journal is kept); an OS crash or power loss during
+# the import may corrupt the file, so back it up first (scripts/backup-db.sh).
+FAST_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",
+)
+
+
+@dataclass(slots=True)
+class ImportedOrder:
+    """A validated order ready to insert."""
+
+    table_number: int
+    status: OrderStatus
+    created_at: datetime
+    items: list[OrderItemCreate]
+
+
+@dataclass
+class ImportStats:
+    """Counters of one file's import."""
+
+    records: int = 0
+    orders: int = 0
+    items: int = 0
+    rejected: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Inserted order and item rows per second."""
+        return (self.orders + self.items) / self.elapsed if self.elapsed else 0.0
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    if value in (None, ""):
+        return datetime.now(timezone.utc)
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        # Stored timestamps are UTC; offsets are only ever added on input
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def parse_order(raw: dict[str, Any] | str) -> ImportedOrder:
+    """
+    Validate one source record (a parsed record or an NDJSON line).
+
+    ``table_number`` and ``items`` go through ``OrderImport``, so history is
+    not subject to the live item limit or line merging; ``status`` defaults
+    to completed (history) and ``created_at`` to now.
+
+    Raises:
+        ValidationError: If the order or an item is invalid
+        ValueError: If the line is not a JSON object, or the status or
+            timestamp cannot be parsed
+    """
+    if isinstance(raw, str):
+        # Decoded here, not in the reader, so a bad line is rejected on its own
+        raw = json.loads(raw)
+        if not isinstance(raw, dict):
+            raise ValueError("record is not a JSON object")
+    order = OrderImport.model_validate(
+        {"table_number": raw.get("table_number"), "items": raw.get("items")}
+    )
+    return ImportedOrder(
+        table_number=order.table_number,
+        status=OrderStatus(raw.get("status") or OrderStatus.COMPLETED.value),
+        created_at=_parse_timestamp(raw.get("created_at")),
+        items=order.items,
+    )
+
+
+def read_ndjson(path: Path) -> Iterator[tuple[int, str]]:
+    """Yield ``(line number, line)`` for each non-empty line; ``parse_order`` decodes it."""
+    with path.open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.strip():
+                yield line_number, line
+
+
+def read_csv(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Yield ``(line number, record)`` per order from a one-row-per-item CSV.
+
+    Consecutive rows sharing an ``order_id`` form one order; without that
+    column every row is its own order.
+    """
+    with path.open(encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        current_key: str | None = None
+        current: dict[str, Any] | None = None
+        start_line = 0
+        for row in reader:
+            key = row.get("order_id") or None
+            if current is None or key is None or key != current_key:
+                if current is not None:
+                    yield start_line, current
+                current_key = key
+                start_line = reader.line_num
+                current = {
+                    "table_number": row.get("table_number"),
+                    "status": row.get("status"),
+                    "created_at": row.get("created_at"),
+                    "items": [],
+                }
+            current["items"].append(
+                {"name": row.get("item_name"), "amount": row.get("amount"), "price": row.get("price")}
+            )
+        if current is not None:
+            yield start_line, current
+
+
+def detect_format(path: Path) -> str:
+    """Guess the file format from its extension."""
+    return "csv" if path.suffix.lower() == ".csv" else "ndjson"
+
+
+def _save_progress(conn: Connection, source: str, records_done: int) -> None:
+    values = {"records_done": records_done, "updated_at": datetime.now(timezone.utc)}
+    result = conn.execute(
+        update(import_progress).where(import_progress.c.source == source).values(**values)
+    )
+    if result.rowcount == 0:
+        conn.execute(insert(import_progress).values(source=source, **values))
+
+
+def _insert_chunk(conn: Connection, chunk: list[ImportedOrder]) -> int:
+    """Insert a chunk of orders with one executemany per table; return the item count."""
+    next_id = conn.scalar(select(func.coalesce(func.max(orders.c.id), 0))) + 1
+    order_rows = []
+    item_rows = []
+    status_deltas: Counter[OrderStatus] = Counter()
+    revenue: defaultdict[date, list[int]] = defaultdict(lambda: [0, 0])
+    prep: Counter[str] = Counter()
+
+    for order_id, order in enumerate(chunk, start=next_id):
+        order_rows.append(
+            {
+                "id": order_id,
+                "table_number": order.table_number,
+                "status": order.status,
+                "created_at": order.created_at,
+            }
+        )
+        total_cents = 0
+        for item in order.items:
+            item_rows.append(
+                {
+                    "order_id": order_id,
+                    "name": item.name,
+                    "amount": item.amount,
+                    "price_cents": item.price_cents,
+                }
+            )
+            total_cents += item.amount * item.price_cents
+            if order.status in ACTIVE_STATUSES:
+                prep[item.name] += item.amount
+        status_deltas[order.status] += 1
+        if order.status == OrderStatus.COMPLETED:
+            # Completion time is unknown for history; book it on the creation day
+            day_total = revenue[business_day(order.created_at)]
+            day_total[0] += total_cents
+            day_total[1] += 1
+
+    conn.execute(insert(orders), order_rows)
+    conn.execute(insert(order_items), item_rows)
+    apply_status_deltas(conn, status_deltas)
+    apply_prep_deltas(conn, prep)
+    for day, (cents, completed) in revenue.items():
+        add_revenue(conn, day, cents, completed)
+    return len(item_rows)
+
+
+class OrderImporter:
+    """Imports order files into one database, chunk by chunk."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        chunk_size: int = 5000,
+        progress: Callable[[Path, ImportStats], None] | None = None,
+        error: Callable[[Path, int, str], None] | None = None,
+    ) -> None:
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.error = error
+
+    def import_file(self, path: Path, file_format: str | None = None, restart: bool = False) -> ImportStats:
+        """
+        Import one file, resuming after its last committed chunk.
+
+        Args:
+            path: CSV or NDJSON file
+            file_format: ``csv`` or ``ndjson``; detected from the extension if None
+            restart: Ignore saved progress and start from the first record
+                (already imported orders are not removed)
+
+        Returns:
+            Counters for this run
+        """
+        source = str(path.resolve())
+        reader = read_csv if (file_format or detect_format(path)) == "csv" else read_ndjson
+        stats = ImportStats()
+        started = time.perf_counter()
+
+        with self.engine.connect() as conn:
+            done = 0
+            if not restart:
+                with conn.begin():
+                    done = conn.scalar(
+                        select(import_progress.c.records_done).where(
+                            import_progress.c.source == source
+                        )
+                    ) or 0
+
+            chunk: list[ImportedOrder] = []
+            for line_number, raw in reader(path):
+                stats.records += 1
+                if stats.records <= done:
+                    stats.skipped += 1
+                    continue
+                try:
+                    chunk.append(parse_order(raw))
+                except (ValidationError, ValueError, TypeError) as e:
+                    stats.rejected += 1
+                    if self.error is not None:
+                        self.error(path, line_number, str(e))
+                if len(chunk) >= self.chunk_size:
+                    self._commit_chunk(conn, source, chunk, stats, started)
+                    chunk = []
+
+            # Always commit the tail so rejected-only tails still advance progress
+            self._commit_chunk(conn, source, chunk, stats, started)
+
+        logger.info(
+            "Imported order file",
+            extra={
+                "path": source,
+                "orders": stats.orders,
+                "items": stats.items,
+                "rejected": stats.rejected,
+                "skipped": stats.skipped,
+                "rows_per_second": round(stats.rows_per_second),
+            },
+        )
+        return stats
+
+    def _commit_chunk(
+        self,
+        conn: Connection,
+        source: str,
+        chunk: list[ImportedOrder],
+        stats: ImportStats,
+        started: float,
+    ) -> None:
+        with conn.begin():
+            items = _insert_chunk(conn, chunk) if chunk else 0
+            _save_progress(conn, source, stats.records)
+        stats.orders += len(chunk)
+        stats.items += items
+        stats.elapsed = time.perf_counter() - started
+        if self.progress is not None:
+            self.progress(Path(source), stats)
+
+
+def create_import_engine(database_url: str, fast_pragmas: bool = True) -> Engine:
+    """
+    Create a dedicated engine so relaxed pragmas never reach the app's pool.
+
+    The target is initialised like the app's database first (WAL mode,
+    ``auto_vacuum``, tables) on a plain connection: ``init_db`` cannot run
+    inside the ``BEGIN IMMEDIATE`` transactions the import engine opens.
+    """
+    setup_engine = use_wal(create_engine(database_url, poolclass=NullPool))
+    try:
+        init_db(setup_engine)
+    finally:
+        setup_engine.dispose()
+
+    engine = use_wal(create_engine(database_url, poolclass=NullPool))
+    if engine.dialect.name == "sqlite":
+
+        @event.listens_for(engine, "connect")
+        def _configure_connection(dbapi_connection, connection_record) -> None:
+            # Let SQLAlchemy's begin() own transactions (pysqlite legacy mode)
+            dbapi_connection.isolation_level = None
+            if fast_pragmas:
+                for pragma in FAST_SQLITE_PRAGMAS:
+                    dbapi_connection.execute(pragma)
+
+        @event.listens_for(engine, "begin")
+        def _begin_immediate(conn) -> None:
+            # Take the write lock up front so MAX(id) stays valid for the chunk
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+def _print_progress(path: Path, stats: ImportStats) -> None:
+    print(
+        f"{path.name}: {stats.records:,} records, {stats.orders:,} orders, "
+        f"{stats.items:,} items, {stats.rejected:,} rejected, "
+        f"{stats.rows_per_second:,.0f} rows/s",
+        file=sys.stderr,
+    )
+
+
+def _print_error(path: Path, line_number: int, message: str) -> None:
+    first_line = message.splitlines()[0] if message else ""
+    print(f"{path.name}:{line_number}: rejected: {first_line}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.importer",
+        description=(
+            "Bulk import historical orders from CSV or NDJSON files. Orders, items and "
+            "dashboard counters are imported; change-log entries and prep-time statistics "
+            "are not."
+        ),
+    )
+    parser.add_argument("files", nargs="+", type=Path, help="CSV or NDJSON files to import")
+    parser.add_argument("--format", choices=FORMATS, help="File format (default: from extension)")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.import_chunk_size,
+        help="Orders per transaction (default: %(default)s)",
+    )
+    parser.add_argument("--database-url", default=settings.database_url, help="Target database")
+    parser.add_argument("--restart", action="store_true", help="Ignore saved progress")
+    parser.add_argument(
+        "--durable",
+        action="store_true",
+        help="Keep default SQLite durability pragmas (slower)",
+    )
+    args = parser.parse_args(argv)
+
+    configure_logging(level=settings.log_level)
+    importer = OrderImporter(
+        create_import_engine(args.database_url, fast_pragmas=not args.durable),
+        chunk_size=args.chunk_size,
+        progress=_print_progress,
+        error=_print_error,
+    )
+    exit_code = 0
+    for path in args.files:
+        if not path.is_file():
+            print(f"{path}: no such file", file=sys.stderr)
+            exit_code = 1
+            continue
+        try:
+            stats = importer.import_file(path, args.format, restart=args.restart)
+        except Exception as e:
+            print(f"{path.name}: import failed, re-run to resume: {e}", file=sys.stderr)
+            exit_code = 1
+            continue
+        print(
+            f"{path.name}: done, {stats.orders:,} orders and {stats.items:,} items "
+            f"in {stats.elapsed:.1f}s ({stats.rows_per_second:,.0f} rows/s); "
+            f"{stats.rejected:,} rejected, {stats.skipped:,} skipped (already imported)",
+            file=sys.stderr,
+        )
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+In-process queue for post-commit side effects.
+
+Route handlers commit their write, submit follow-up work (logging order
+events today; notifications, ticket printing and analytics later) and
+return. Worker tasks on the event loop run each job in a thread, retrying
+failures with exponential backoff, so a slow printer or webhook never adds
+to request latency or holds a request thread.
+
+The queue is bounded: when it is full new jobs are dropped and counted
+rather than growing memory without limit. It lives in process memory, so
+jobs still queued when the process dies are lost; on a normal shutdown
+``stop()`` drains it within a timeout. Before ``start()`` (CLI tools, tests
+without a lifespan) jobs run inline; after ``stop()`` they are rejected.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Job:
+    """A named call with its arguments and attempt count."""
+
+    name: str
+    fn: Callable[..., Any]
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+
+
+class JobQueue:
+    """Bounded queue drained by worker tasks with retry and backoff."""
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        workers: int = 2,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 0.5,
+        retry_max_seconds: float = 30.0,
+    ) -> None:
+        self.max_size = max_size
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[Job] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._stopped = False
+        # Submitted but not finished (queued, running or backing off)
+        self._pending = 0
+        self._submitted = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._retried = 0
+        self._dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        queue: asyncio.Queue[Job] = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._worker(queue), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        with self._lock:
+            self._queue = queue
+            self._loop = asyncio.get_running_loop()
+            self._stopped = False
+
+    def submit(self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+        """
+        Queue ``fn(*args, **kwargs)``; safe to call from any thread.
+
+        Returns:
+            False if the job was dropped because the queue is full or stopped
+        """
+        job = Job(name, fn, args, kwargs)
+        with self._lock:
+            # Read once: stop() may clear them from the event loop thread
+            loop, queue, stopped = self._loop, self._queue, self._stopped
+            if loop is None and not stopped:
+                accepted = None
+            elif loop is None or self._pending >= self.max_size:
+                self._dropped += 1
+                accepted = False
+            else:
+                self._pending += 1
+                self._submitted += 1
+                accepted = True
+        if accepted is None:
+            self._run_inline(job)
+            return True
+        if not accepted:
+            reason = "stopped" if loop is None else "full"
+            logger.warning(f"Job queue {reason}; dropping job", extra={"job": name})
+            return False
+        if _running_loop() is loop:
+            queue.put_nowait(job)
+            return True
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, job)
+        except RuntimeError:
+            # The loop closed between the check and the hand-off
+            with self._lock:
+                self._pending -= 1
+                self._dropped += 1
+            logger.warning("Job queue stopped; dropping job", extra={"job": name})
+            return False
+        return True
+
+    async def stop(self, timeout_seconds: float) -> None:
+        """Stop accepting jobs, wait up to ``timeout_seconds`` for the rest, then cancel."""
+        with self._lock:
+            if self._loop is None:
+                return
+            queue, tasks = self._queue, self._tasks
+            # Later submissions are rejected
+            self._loop = None
+            self._stopped = True
+        # Let puts scheduled from other threads land before waiting
+        await asyncio.sleep(0)
+        try:
+            await asyncio.wait_for(queue.join(), timeout_seconds)
+        except TimeoutError:
+            logger.warning(
+                "Job queue not drained before shutdown",
+                extra={"abandoned": self._pending, "timeout_seconds": timeout_seconds},
+            )
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> dict:
+        """Return counters for the admin endpoint."""
+        with self._lock:
+            return {
+                "running": self.running,
+                "workers": self.workers,
+                "max_size": self.max_size,
+                "pending": self._pending,
+                "submitted": self._submitted,
+                "succeeded": self._succeeded,
+                "failed": self._failed,
+                "retried": self._retried,
+                "dropped": self._dropped,
+            }
+
+    def retry_delay(self, attempts: int) -> float:
+        """Backoff before the next attempt after ``attempts`` failures."""
+        return min(self.retry_base_seconds * 2 ** (attempts - 1), self.retry_max_seconds)
+
+    async def _worker(self, queue: asyncio.Queue[Job]) -> None:
+        while True:
+            job = await queue.get()
+            try:
+                await self._execute(job)
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                queue.task_done()
+
+    async def _execute(self, job: Job) -> None:
+        while True:
+            job.attempts += 1
+            try:
+                await asyncio.to_thread(job.fn, *job.args, **job.kwargs)
+            except Exception as e:
+                if job.attempts >= self.max_attempts:
+                    with self._lock:
+                        self._failed += 1
+                    logger.error(
+                        "Job failed",
+                        exc_info=e,
+                        extra={"job": job.name, "attempts": job.attempts},
+                    )
+                    return
+                delay = self.retry_delay(job.attempts)
+                with self._lock:
+                    self._retried += 1
+                logger.warning(
+                    "Job failed; retrying",
+                    extra={"job": job.name, "attempts": job.attempts, "retry_in_seconds": delay},
+                )
+                await asyncio.sleep(delay)
+            else:
+                with self._lock:
+                    self._succeeded += 1
+                return
+
+    def _run_inline(self, job: Job) -> None:
+        job.attempts = 1
+        try:
+            job.fn(*job.args, **job.kwargs)
+        except Exception as e:
+            with self._lock:
+                self._failed += 1
+            logger.error("Job failed", exc_info=e, extra={"job": job.name, "attempts": 1})
+        else:
+            with self._lock:
+                self._succeeded += 1
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+job_queue = JobQueue(
+    max_size=settings.jobs_queue_size,
+    workers=settings.jobs_workers,
+    max_attempts=settings.jobs_max_attempts,
+    retry_base_seconds=settings.jobs_retry_base_seconds,
+    retry_max_seconds=settings.jobs_retry_max_seconds,
+)
@@ -1,15 +1,28 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from backend.body_limit import BodySizeLimitMiddleware
+from backend.changes import run_change_log_compaction
 from backend.config import settings
-from backend.database import init_db
+from backend.counters import backfill_prep_list, backfill_status_counts
+from backend.database import SessionLocal, engine, init_db
+from backend.jobs import job_queue
 from backend.logging_config import configure_logging
-from backend.routes import health, orders
+from backend.maintenance import create_scheduler
+from backend.profiling import ProfilingMiddleware, profile_store
+from backend.rate_limit import RateLimitMiddleware, rate_limiter
+from backend.request_context import RequestContextMiddleware
+from backend.routes import admin, health, kitchen, orders, reports, tables
+from backend.tenancy import live_tenant_engines, tenant_registry
+from backend.threadpool import install as install_threadpool_limiter
+from backend.tracing import TracingMiddleware, trace_exporter
 
 
 @asynccontextmanager
@@ -25,11 +38,59 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             "debug": settings.debug,
         },
     )
-    # Initialize database
-    init_db()
-    logger.info("Database initialized")
+    install_threadpool_limiter(settings.threadpool_size)
+    logger.info("Threadpool sized", extra={"threadpool_size": settings.threadpool_size})
+    background_tasks = []
+    if settings.order_repository == "sqlalchemy":
+        # Initialize database
+        init_db()
+        with SessionLocal() as db:
+            backfill_status_counts(db)
+            backfill_prep_list(db)
+        logger.info("Database initialized")
+        background_tasks.append(
+            asyncio.create_task(
+                run_change_log_compaction(
+                    settings.change_log_compact_interval_seconds,
+                    timedelta(hours=settings.change_log_retention_hours),
+                )
+            )
+        )
+        if settings.maintenance_enabled and engine.dialect.name == "sqlite":
+            background_tasks.append(
+                asyncio.create_task(
+                    create_scheduler(engine, live_tenant_engines).run(
+                        settings.maintenance_check_interval_seconds
+                    )
+                )
+            )
+    else:
+        logger.warning(
+            "Using the in-memory order repository; orders are lost on restart",
+            extra={"order_repository": settings.order_repository},
+        )
+    if settings.tenancy_enabled:
+        logger.info(
+            "Tenancy enabled; tenant databases are created on first use",
+            extra={
+                "tenant_header": settings.tenant_header,
+                "tenant_base_domain": settings.tenant_base_domain,
+                "tenant_max_engines": settings.tenant_max_engines,
+            },
+        )
+    job_queue.start()
     yield
     logger.info("Shutting down application")
+    # Finish post-commit side effects while the databases are still open
+    await job_queue.stop(settings.jobs_drain_timeout_seconds)
+    for task in background_tasks:
+        task.cancel()
+    for task in background_tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+    tenant_registry.dispose_all()
+    if trace_exporter is not None:
+        trace_exporter.close()
 
 
 def create_app() -> FastAPI:
@@ -76,9 +137,26 @@ def create_app() -> FastAPI:
                 **Orders** – Create orders, list pending orders, cancel, and mark as completed.
 
                 Endpoints are grouped here with stable `operation_id`s for easy discovery:
-                `create_order`, `list_pending_orders`, `cancel_order`, `complete_order`.
+                `create_order`, `list_pending_orders`, `list_order_changes`, `export_orders`, `get_order_summary`, `get_order`,
+                `cancel_order`, `complete_order`.
                 """,
             },
+            {
+                "name": "Tables",
+                "description": "Open tabs per table: `list_open_tabs`, `list_table_orders`.",
+            },
+            {
+                "name": "Kitchen",
+                "description": "Aggregated views for the kitchen: `get_prep_list`.",
+            },
+            {
+                "name": "Reports",
+                "description": "Analytics maintained incrementally as orders change: `get_prep_times`.",
+            },
+            {
+                "name": "Admin",
+                "description": "Diagnostics for operators (rate limiter counters, request profiles, SQL statement timings). Guarded by `X-Admin-Token` when `ADMIN_TOKEN` is set.",
+            },
             {
                 "name": "health",
                 "description": "Health check and status endpoints for monitoring API availability.",
@@ -86,6 +164,38 @@ def create_app() -> FastAPI:
         ],
     )
 
+    # Opt-in request profiling, innermost so profiles cover only the app
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        enabled=settings.profiling_enabled,
+        sample_rate=settings.profiling_sample_rate,
+    )
+
+    # Sampled request tracing (Server-Timing header, optional OTLP JSON export)
+    app.add_middleware(
+        TracingMiddleware,
+        sample_rate=settings.tracing_sample_rate,
+        exporter=trace_exporter,
+        server_timing_header=settings.tracing_server_timing,
+        service_name=settings.app_name,
+    )
+
+    # Oversized /api/ request bodies get 413 before they are read or parsed
+    app.add_middleware(BodySizeLimitMiddleware, max_bytes=settings.max_request_body_bytes)
+
+    # Per-client token-bucket rate limiting for /api/ routes (inside CORS so
+    # 429 responses still carry CORS headers)
+    if settings.rate_limit_enabled:
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=rate_limiter,
+            key_header=settings.rate_limit_key_header,
+            api_keys=settings.rate_limit_api_keys,
+            trust_forwarded_for=settings.rate_limit_trust_forwarded_for,
+            trusted_proxy_hops=settings.rate_limit_trusted_proxy_hops,
+        )
+
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -93,11 +203,21 @@ def create_app() -> FastAPI:
         allow_credentials=settings.cors_allow_credentials,
         allow_methods=settings.cors_allow_methods,
         allow_headers=settings.cors_allow_headers,
+        # Lets browser clients read order versions for If-Match and the
+        # limiter's back-off hint
+        expose_headers=["ETag", "Retry-After"],
     )
 
+    # Outermost: publish the request's operation_id for logs and DB hooks
+    app.add_middleware(RequestContextMiddleware)
+
     # Include routers (tags come from each router's APIRouter(tags=[...]))
     app.include_router(health.router, tags=["health"])
     app.include_router(orders.router, prefix="/api/v1")
+    app.include_router(tables.router, prefix="/api/v1")
+    app.include_router(kitchen.router, prefix="/api/v1")
+    app.include_router(reports.router, prefix="/api/v1")
+    app.include_router(admin.router, prefix="/api/v1")
 
     return app
 
@@ -121,12 +241,6 @@ async def global_exception_handler(request, exc: Exception) -> JSONResponse:
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    uvicorn.run(
-        "backend.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.debug,
-        log_config=None,  # Use our custom logging configuration
-    )
+    from backend.server import run
+
+    run()
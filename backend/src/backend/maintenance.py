@@ -0,0 +1,232 @@
+"""
+Background SQLite maintenance during configurable quiet windows.
+
+Jobs refresh planner statistics (``PRAGMA optimize``, ``ANALYZE``), return
+free pages to the OS (``PRAGMA incremental_vacuum``) and checkpoint the WAL.
+Every job is time-boxed: statistics use ``analysis_limit``, vacuuming runs in
+small steps until the budget is spent, checkpoints are PASSIVE, and the
+connection's ``busy_timeout`` is capped at the budget so a job gives up
+rather than queueing behind the writer.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from datetime import time as dt_time
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class QuietWindow:
+    """Daily time range (local to the business timezone); may wrap past midnight."""
+
+    start: dt_time
+    end: dt_time
+
+    def contains(self, moment: dt_time) -> bool:
+        if self.start <= self.end:
+            return self.start <= moment < self.end
+        return moment >= self.start or moment < self.end
+
+
+def parse_window(spec: str) -> QuietWindow:
+    """
+    Parse a ``"HH:MM-HH:MM"`` window.
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    start, sep, end = spec.partition("-")
+    if not sep:
+        raise ValueError(f"Invalid maintenance window {spec!r}, expected HH:MM-HH:MM")
+    return QuietWindow(dt_time.fromisoformat(start.strip()), dt_time.fromisoformat(end.strip()))
+
+
+@dataclass(frozen=True)
+class MaintenanceJob:
+    """A maintenance task and how often it may run."""
+
+    name: str
+    interval: timedelta
+    run: Callable[[Connection, float], dict]
+
+
+def _pragma(conn: Connection, statement: str):
+    return conn.exec_driver_sql(statement).scalar()
+
+
+def optimize(conn: Connection, budget_seconds: float) -> dict:
+    """Let SQLite re-analyze tables whose statistics look stale."""
+    _pragma(conn, f"PRAGMA analysis_limit = {settings.maintenance_analysis_limit}")
+    conn.exec_driver_sql("PRAGMA optimize")
+    return {}
+
+
+def analyze(conn: Connection, budget_seconds: float) -> dict:
+    """Refresh statistics of every index, sampling at most ``analysis_limit`` rows each."""
+    _pragma(conn, f"PRAGMA analysis_limit = {settings.maintenance_analysis_limit}")
+    conn.exec_driver_sql("ANALYZE")
+    return {}
+
+
+def incremental_vacuum(conn: Connection, budget_seconds: float) -> dict:
+    """
+    Release free pages in small steps until none are left or the budget is spent.
+
+    Each step is its own short write transaction, so writers interleave.
+    Requires ``auto_vacuum = INCREMENTAL`` (set by ``init_db`` on new
+    databases); older files need a one-off offline ``VACUUM`` to convert.
+    """
+    if _pragma(conn, "PRAGMA auto_vacuum") != 2:
+        return {"skipped": "auto_vacuum is not INCREMENTAL"}
+
+    deadline = time.perf_counter() + budget_seconds
+    freelist_before = _pragma(conn, "PRAGMA freelist_count")
+    freelist = freelist_before
+    while freelist and time.perf_counter() < deadline:
+        conn.exec_driver_sql(f"PRAGMA incremental_vacuum({settings.maintenance_vacuum_pages})")
+        freelist = _pragma(conn, "PRAGMA freelist_count")
+    return {"pages_freed": freelist_before - freelist, "pages_remaining": freelist}
+
+
+def wal_checkpoint(conn: Connection, budget_seconds: float) -> dict:
+    """Copy WAL frames back into the database without blocking readers or writers."""
+    if _pragma(conn, "PRAGMA journal_mode") != "wal":
+        return {"skipped": "journal_mode is not WAL"}
+    busy, wal_frames, checkpointed = conn.exec_driver_sql("PRAGMA wal_checkpoint(PASSIVE)").one()
+    return {"busy": bool(busy), "wal_frames": wal_frames, "checkpointed_frames": checkpointed}
+
+
+DEFAULT_JOBS = (
+    MaintenanceJob("optimize", timedelta(hours=1), optimize),
+    MaintenanceJob("analyze", timedelta(days=1), analyze),
+    MaintenanceJob("incremental_vacuum", timedelta(hours=1), incremental_vacuum),
+    MaintenanceJob("wal_checkpoint", timedelta(minutes=5), wal_checkpoint),
+)
+
+
+class MaintenanceScheduler:
+    """
+    Runs due maintenance jobs while inside a quiet window.
+
+    Jobs run on ``engine`` and on every SQLite engine returned by
+    ``tenant_engines`` at that moment (open tenant databases).
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        windows: Sequence[QuietWindow],
+        jobs: Sequence[MaintenanceJob] = DEFAULT_JOBS,
+        time_budget_ms: int = 200,
+        timezone_name: str = "UTC",
+        tenant_engines: Callable[[], Sequence[tuple[str, Engine]]] | None = None,
+    ) -> None:
+        self.engine = engine
+        self.tenant_engines = tenant_engines
+        self.windows = list(windows)
+        self.jobs = list(jobs)
+        self.time_budget_ms = time_budget_ms
+        self.timezone = ZoneInfo(timezone_name)
+        self._last_run: dict[str, datetime] = {}
+
+    def in_quiet_window(self, now: datetime) -> bool:
+        local = now.astimezone(self.timezone).time()
+        return any(window.contains(local) for window in self.windows)
+
+    def due_jobs(self, now: datetime) -> list[MaintenanceJob]:
+        """Return jobs that may run at ``now`` (inside a window and past their interval)."""
+        if not self.in_quiet_window(now):
+            return []
+        return [
+            job
+            for job in self.jobs
+            if job.name not in self._last_run or now - self._last_run[job.name] >= job.interval
+        ]
+
+    def run_due(self, now: datetime | None = None) -> list[dict]:
+        """Run every due job once on a dedicated connection; blocking."""
+        now = now or datetime.now(timezone.utc)
+        jobs = self.due_jobs(now)
+        if not jobs:
+            return []
+
+        targets: list[tuple[str | None, Engine]] = [(None, self.engine)]
+        if self.tenant_engines is not None:
+            targets += [
+                (tenant, engine)
+                for tenant, engine in self.tenant_engines()
+                if engine.dialect.name == "sqlite"
+            ]
+        results = []
+        for tenant, engine in targets:
+            results.extend(self._run_jobs(engine, jobs, tenant))
+        for job in jobs:
+            self._last_run[job.name] = now
+        return results
+
+    def _run_jobs(self, engine: Engine, jobs: Sequence[MaintenanceJob], tenant: str | None) -> list[dict]:
+        budget = self.time_budget_ms / 1000
+        results = []
+        with engine.connect() as conn:
+            previous_timeout = _pragma(conn, "PRAGMA busy_timeout")
+            _pragma(conn, f"PRAGMA busy_timeout = {self.time_budget_ms}")
+            try:
+                for job in jobs:
+                    result = self._run_job(conn, job, budget, tenant)
+                    results.append(result)
+            finally:
+                _pragma(conn, f"PRAGMA busy_timeout = {previous_timeout}")
+                conn.commit()
+        return results
+
+    def _run_job(self, conn: Connection, job: MaintenanceJob, budget: float, tenant: str | None) -> dict:
+        start = time.perf_counter()
+        try:
+            details = job.run(conn, budget)
+            conn.commit()
+            outcome = "ok"
+        except OperationalError as e:
+            # Typically "database is locked": the writer was busy for the whole budget
+            conn.rollback()
+            details = {"error": str(e.orig)}
+            outcome = "failed"
+        duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        result = {"job": job.name, "outcome": outcome, "duration_ms": duration_ms, **details}
+        if tenant is not None:
+            result["tenant"] = tenant
+        logger.info("Database maintenance job finished", extra=result)
+        return result
+
+    async def run(self, check_interval_seconds: int) -> None:
+        """Check for due jobs periodically until cancelled."""
+        while True:
+            await asyncio.sleep(check_interval_seconds)
+            try:
+                await asyncio.to_thread(self.run_due)
+            except Exception as e:
+                logger.error("Database maintenance failed", exc_info=e)
+
+
+def create_scheduler(
+    engine: Engine,
+    tenant_engines: Callable[[], Sequence[tuple[str, Engine]]] | None = None,
+) -> MaintenanceScheduler:
+    """Build the scheduler from settings."""
+    return MaintenanceScheduler(
+        engine,
+        [parse_window(spec) for spec in settings.maintenance_windows],
+        time_budget_ms=settings.maintenance_time_budget_ms,
+        timezone_name=settings.business_timezone,
+        tenant_engines=tenant_engines,
+    )
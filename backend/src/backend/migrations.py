@@ -0,0 +1,93 @@
+"""
+In-place upgrades for databases created by earlier releases.
+
+``create_all`` only creates missing tables; it never alters existing ones.
+``upgrade_schema`` runs right after it (see ``backend.database.init_db``) and
+brings older ``orders``/``order_items`` tables up to the current models:
+
+* ``order_items.price`` (decimal) becomes ``price_cents`` (integer cents).
+* ``orders.version`` is added with every existing order at version 1.
+* The transition timestamps (``started_at``, ...) are added and filled from
+  the change log where it has the matching entry; otherwise they stay null.
+* Indexes added since are created.
+
+Every step checks the live schema first, so running it again is a no-op.
+"""
+
+import logging
+
+from sqlalchemy import Connection, DateTime, inspect
+
+from backend.database import Base
+
+logger = logging.getLogger(__name__)
+
+# Transition timestamp column -> change log entry that sets it (enum names,
+# as SQLAlchemy stores them)
+_TRANSITION_CHANGES = {
+    "started_at": "STARTED",
+    "ready_at": "READY",
+    "completed_at": "COMPLETED",
+    "cancelled_at": "CANCELLED",
+}
+
+
+def _columns(conn: Connection, table: str) -> set[str]:
+    return {column["name"] for column in inspect(conn).get_columns(table)}
+
+
+def _upgrade_order_items(conn: Connection, applied: list[str]) -> None:
+    columns = _columns(conn, "order_items")
+    if "price_cents" not in columns:
+        conn.exec_driver_sql(
+            "ALTER TABLE order_items ADD COLUMN price_cents INTEGER NOT NULL DEFAULT 0"
+        )
+        applied.append("order_items.price_cents")
+    if "price" in columns:
+        conn.exec_driver_sql(
+            "UPDATE order_items SET price_cents = CAST(ROUND(price * 100) AS INTEGER)"
+        )
+        # The old NOT NULL column would reject every new item
+        conn.exec_driver_sql("ALTER TABLE order_items DROP COLUMN price")
+        applied.append("order_items.price -> price_cents")
+
+
+def _upgrade_orders(conn: Connection, applied: list[str]) -> None:
+    columns = _columns(conn, "orders")
+    if "version" not in columns:
+        conn.exec_driver_sql("ALTER TABLE orders ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+        applied.append("orders.version")
+    timestamp_type = DateTime(timezone=True).compile(dialect=conn.dialect)
+    for column, change in _TRANSITION_CHANGES.items():
+        if column in columns:
+            continue
+        conn.exec_driver_sql(f"ALTER TABLE orders ADD COLUMN {column} {timestamp_type}")
+        conn.exec_driver_sql(
+            f"UPDATE orders SET {column} = ("
+            "SELECT max(changed_at) FROM order_changes"
+            f" WHERE order_changes.order_id = orders.id AND order_changes.change = '{change}')"
+        )
+        applied.append(f"orders.{column}")
+
+
+def upgrade_schema(conn: Connection) -> list[str]:
+    """
+    Upgrade tables created by earlier releases in the caller's transaction.
+
+    Must run after ``Base.metadata.create_all`` so every table exists.
+
+    Returns:
+        Names of the steps applied (empty when the schema was current)
+    """
+    applied: list[str] = []
+    _upgrade_order_items(conn, applied)
+    _upgrade_orders(conn, applied)
+    for table in ("orders", "order_items"):
+        existing = {index["name"] for index in inspect(conn).get_indexes(table)}
+        for index in Base.metadata.tables[table].indexes:
+            if index.name not in existing:
+                index.create(conn)
+                applied.append(f"index {index.name}")
+    if applied:
+        logger.info("Upgraded database schema", extra={"steps": applied})
+    return applied
@@ -1,5 +1,29 @@
 """Database models package."""
 
-from backend.models.order import Order, OrderItem, OrderStatus
+from backend.models.import_progress import ImportProgress
+from backend.models.order import (
+    Order,
+    OrderChange,
+    OrderChangeType,
+    OrderItem,
+    OrderStatus,
+)
+from backend.models.summary import (
+    DailyRevenue,
+    OrderStatusCount,
+    PrepListItem,
+    PrepTimeBucket,
+)
 
-__all__ = ["Order", "OrderItem", "OrderStatus"]
+__all__ = [
+    "DailyRevenue",
+    "ImportProgress",
+    "Order",
+    "OrderChange",
+    "OrderChangeType",
+    "OrderItem",
+    "OrderStatus",
+    "OrderStatusCount",
+    "PrepListItem",
+    "PrepTimeBucket",
+]
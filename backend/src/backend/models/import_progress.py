@@ -0,0 +1,22 @@
+"""Resume bookkeeping for the bulk order importer."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.database import Base
+
+
+class ImportProgress(Base):
+    """Number of source records of an import file already committed."""
+
+    __tablename__ = "import_progress"
+
+    source: Mapped[str] = mapped_column(String(1024), primary_key=True)
+    records_done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
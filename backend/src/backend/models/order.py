@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, Numeric, String
+from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.database import Base
@@ -19,10 +19,49 @@ class OrderStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+# Statuses of orders still open on the floor (not yet completed or cancelled)
+ACTIVE_STATUSES = (OrderStatus.PENDING, OrderStatus.IN_PROGRESS, OrderStatus.READY)
+
+
+# Column stamped when an order enters each status after creation
+TRANSITION_TIMESTAMPS = {
+    OrderStatus.IN_PROGRESS: "started_at",
+    OrderStatus.READY: "ready_at",
+    OrderStatus.COMPLETED: "completed_at",
+    OrderStatus.CANCELLED: "cancelled_at",
+}
+
+
+class OrderChangeType(str, enum.Enum):
+    """Kind of mutation recorded in the order change log."""
+    
+    CREATED = "created"
+    STARTED = "started"
+    READY = "ready"
+    CANCELLED = "cancelled"
+    COMPLETED = "completed"
+
+
+# Change log entry written for each status an order can be moved to (an
+# order never goes back to pending)
+CHANGE_FOR_STATUS = {
+    OrderStatus.IN_PROGRESS: OrderChangeType.STARTED,
+    OrderStatus.READY: OrderChangeType.READY,
+    OrderStatus.CANCELLED: OrderChangeType.CANCELLED,
+    OrderStatus.COMPLETED: OrderChangeType.COMPLETED,
+}
+
+
 class Order(Base):
     """Order model representing a restaurant order."""
     
     __tablename__ = "orders"
+    __table_args__ = (
+        # Serves the status-filtered, oldest-first reads in backend.queries
+        Index("ix_orders_status_created_at", "status", "created_at"),
+        # Serves per-table lookups (open tabs) in backend.queries
+        Index("ix_orders_table_number_status", "table_number", "status"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     table_number: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -36,6 +75,14 @@ class Order(Base):
         nullable=False,
         default=lambda: datetime.now(timezone.utc)
     )
+    # Transition timestamps (see TRANSITION_TIMESTAMPS); null until reached
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    ready_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    cancelled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Incremented by every ORM update; UPDATEs are issued with
+    # "WHERE version = <loaded version>" so concurrent writers cannot both win
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     
     # Relationship to order items
     items: Mapped[list["OrderItem"]] = relationship(
@@ -44,10 +91,12 @@ class Order(Base):
         cascade="all, delete-orphan"
     )
     
+    __mapper_args__ = {"version_id_col": version}
+    
     @property
-    def total(self) -> float:
-        """Calculate total price of the order."""
-        return sum(float(item.amount) * float(item.price) for item in self.items)
+    def total_cents(self) -> int:
+        """Calculate total price of the order in integer cents."""
+        return sum(item.amount * item.price_cents for item in self.items)
 
 
 class OrderItem(Base):
@@ -59,11 +108,35 @@ class OrderItem(Base):
     order_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("orders.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     amount: Mapped[int] = mapped_column(Integer, nullable=False)
-    price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    # Money is stored as integer cents; decimal conversion happens in the schemas
+    price_cents: Mapped[int] = mapped_column(Integer, nullable=False)
     
     # Relationship to order
     order: Mapped["Order"] = relationship("Order", back_populates="items")
+
+
+class OrderChange(Base):
+    """Append-only change log entry written alongside every order mutation."""
+    
+    __tablename__ = "order_changes"
+    __table_args__ = {"sqlite_autoincrement": True}
+    
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    order_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    change: Mapped[OrderChangeType] = mapped_column(
+        Enum(OrderChangeType),
+        nullable=False
+    )
+    status: Mapped[OrderStatus] = mapped_column(Enum(OrderStatus), nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc)
+    )
+    # Full order snapshot for CREATED entries; status changes only carry status
+    payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
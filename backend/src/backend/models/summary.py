@@ -0,0 +1,55 @@
+"""Counter tables backing the O(1) dashboard summary, kitchen prep list and prep-time report."""
+
+from datetime import date
+
+from sqlalchemy import Date, Enum, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.database import Base
+from backend.models.order import OrderStatus
+
+
+class OrderStatusCount(Base):
+    """Number of orders currently in each status, maintained on every transition."""
+
+    __tablename__ = "order_status_counts"
+
+    status: Mapped[OrderStatus] = mapped_column(Enum(OrderStatus), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class DailyRevenue(Base):
+    """Revenue of orders completed on a business day (in integer cents)."""
+
+    __tablename__ = "daily_revenue"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    revenue_cents: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_orders: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class PrepListItem(Base):
+    """Quantity of a dish still to be prepared across active orders."""
+
+    __tablename__ = "prep_list"
+
+    name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class PrepTimeBucket(Base):
+    """
+    One bucket of a prep-time quantile sketch (see ``backend.sketches``).
+
+    Each business day has a sketch per dimension: ``all`` (key ``""``), ``hour``
+    (hour of day the order came in, ``"00"`` to ``"23"``) and ``item`` (dish
+    name). Sketches over a date range merge by summing counts per bucket.
+    """
+
+    __tablename__ = "prep_time_buckets"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    dimension: Mapped[str] = mapped_column(String(8), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,60 @@
+"""
+OpenAPI documentation for the Kitchen API.
+
+Same layout as ``backend.openapi.orders``: tag, response examples, response
+spec builders, then operation metadata.
+"""
+
+from backend.openapi.orders import _json_content
+
+# ---------------------------------------------------------------------------
+# Tag (used in main.py openapi_tags and on router)
+# ---------------------------------------------------------------------------
+
+KITCHEN_TAG = "Kitchen"
+
+# ---------------------------------------------------------------------------
+# Reusable response examples
+# ---------------------------------------------------------------------------
+
+PREP_LIST_EXAMPLE = {
+    "items": [
+        {"name": "Pupusa revuelta", "quantity": 14},
+        {"name": "Horchata", "quantity": 9},
+        {"name": "Pupusa de queso", "quantity": 6},
+    ],
+    "total_quantity": 29,
+}
+
+ERROR_500_PREP_LIST = {"detail": "Failed to retrieve prep list"}
+
+# ---------------------------------------------------------------------------
+# Response spec builders
+# ---------------------------------------------------------------------------
+
+
+def response_200_prep_list() -> dict:
+    return {
+        200: {
+            "description": "Quantities per dish across active orders (items may be empty)",
+            "content": _json_content(PREP_LIST_EXAMPLE),
+        },
+        500: {"description": "Internal server error", "content": _json_content(ERROR_500_PREP_LIST)},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Operation metadata: summary + description (for use in route decorators)
+# ---------------------------------------------------------------------------
+
+GET_PREP_LIST = {
+    "summary": "Get the kitchen prep list",
+    "description": """
+Return how many units of each dish the active orders (pending, in_progress, ready) still need, largest first.
+
+The list is kept up to date as orders are created, cancelled and completed, so this call reads one row per dish
+and never scans orders or items. Dishes are grouped by their exact name.
+""".strip(),
+    "response_description": "Prep list",
+    "responses": response_200_prep_list,
+}
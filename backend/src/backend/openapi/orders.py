@@ -27,10 +27,11 @@ ORDER_RESPONSE_EXAMPLE = {
     ],
     "total": 30.00,
     "created_at": "2026-01-31T19:45:00.000000Z",
+    "version": 1,
 }
 
-ORDER_CANCELLED_EXAMPLE = {**ORDER_RESPONSE_EXAMPLE, "status": "cancelled"}
-ORDER_COMPLETED_EXAMPLE = {**ORDER_RESPONSE_EXAMPLE, "status": "completed"}
+ORDER_CANCELLED_EXAMPLE = {**ORDER_RESPONSE_EXAMPLE, "status": "cancelled", "version": 2}
+ORDER_COMPLETED_EXAMPLE = {**ORDER_RESPONSE_EXAMPLE, "status": "completed", "version": 2}
 
 PENDING_ORDERS_EXAMPLE = [
     {**ORDER_RESPONSE_EXAMPLE, "total": 25.00},
@@ -41,9 +42,43 @@ PENDING_ORDERS_EXAMPLE = [
         "items": [{"id": 3, "name": "Pizza", "amount": 1, "price": 15.00}],
         "total": 15.00,
         "created_at": "2026-01-31T19:46:00.000000Z",
+        "version": 1,
     },
 ]
 
+ORDER_CHANGES_EXAMPLE = {
+    "changes": [
+        {
+            "seq": 41,
+            "order_id": 1,
+            "change": "created",
+            "status": "pending",
+            "changed_at": "2026-01-31T19:45:00.000000Z",
+            "order": ORDER_RESPONSE_EXAMPLE,
+        },
+        {
+            "seq": 42,
+            "order_id": 1,
+            "change": "completed",
+            "status": "completed",
+            "changed_at": "2026-01-31T19:58:00.000000Z",
+            "order": None,
+        },
+    ],
+    "cursor": 42,
+    "has_more": False,
+}
+
+ORDER_SUMMARY_EXAMPLE = {
+    "counts": {"pending": 4, "in_progress": 2, "ready": 1, "completed": 37, "cancelled": 3},
+    "active_orders": 7,
+    "oldest_active_created_at": "2026-01-31T19:32:00.000000Z",
+    "oldest_active_age_seconds": 754.2,
+    "day": "2026-01-31",
+    "revenue_today": 1245.50,
+    "completed_today": 37,
+}
+
 ERROR_404_ORDER = {"detail": "Order with id 123 not found"}
 ERROR_422_VALIDATION = {
     "detail": [
@@ -55,13 +90,25 @@ ERROR_422_VALIDATION = {
         }
     ]
 }
+ERROR_413_BODY_TOO_LARGE = {"detail": "Request body exceeds 65536 bytes"}
 ERROR_500_CREATE = {"detail": "Failed to create order"}
 ERROR_500_PENDING = {"detail": "Failed to retrieve pending orders"}
+ERROR_500_CHANGES = {"detail": "Failed to retrieve order changes"}
+ERROR_500_SUMMARY = {"detail": "Failed to retrieve order summary"}
+ERROR_400_EXPORT_RANGE = {"detail": "`from` must be earlier than `to`"}
+ERROR_410_CURSOR_EXPIRED = {
+    "detail": "Cursor 12 is older than the retained change log; re-sync from /orders/pending"
+}
+ERROR_500_GET = {"detail": "Failed to retrieve order"}
 ERROR_500_CANCEL = {"detail": "Failed to cancel order"}
 ERROR_500_COMPLETE = {"detail": "Failed to complete order"}
 ERROR_400_ALREADY_CANCELLED = {"detail": "Order is already cancelled"}
 ERROR_400_COMPLETED_NO_CANCEL = {"detail": "Completed orders cannot be cancelled"}
 ERROR_400_CANCELLED_NO_COMPLETE = {"detail": "Cancelled orders cannot be completed"}
+ERROR_400_INVALID_IF_MATCH = {"detail": "If-Match must be an order version, e.g. \"3\""}
+ERROR_409_VERSION_CONFLICT = {
+    "detail": "Order with id 1 was modified concurrently (expected version 1, current version 2)"
+}
 
 # ---------------------------------------------------------------------------
 # Response spec builders (for consistent 200/404/400/422/500 in routes)
@@ -83,6 +130,7 @@ def _json_content_examples(examples: dict[str, dict]) -> dict:
 def response_201_order() -> dict:
     return {
         201: {"description": "Order created successfully", "content": _json_content(ORDER_RESPONSE_EXAMPLE)},
+        413: {"description": "Request body too large", "content": _json_content(ERROR_413_BODY_TOO_LARGE)},
         422: {"description": "Validation error", "content": _json_content(ERROR_422_VALIDATION)},
         500: {"description": "Internal server error", "content": _json_content(ERROR_500_CREATE)},
     }
@@ -97,8 +145,10 @@ def response_200_order_cancelled() -> dict:
             "content": _json_content_examples({
                 "already_cancelled": ERROR_400_ALREADY_CANCELLED,
                 "already_completed": ERROR_400_COMPLETED_NO_CANCEL,
+                "invalid_if_match": ERROR_400_INVALID_IF_MATCH,
             }),
         },
+        409: {"description": "Order changed since the expected version", "content": _json_content(ERROR_409_VERSION_CONFLICT)},
         500: {"description": "Internal server error", "content": _json_content(ERROR_500_CANCEL)},
     }
 
@@ -107,11 +157,33 @@ def response_200_order_completed() -> dict:
     return {
         200: {"description": "Order completed successfully", "content": _json_content(ORDER_COMPLETED_EXAMPLE)},
         404: {"description": "Order not found", "content": _json_content(ERROR_404_ORDER)},
-        400: {"description": "Order cannot be completed", "content": _json_content(ERROR_400_CANCELLED_NO_COMPLETE)},
+        400: {
+            "description": "Order cannot be completed",
+            "content": _json_content_examples({
+                "cancelled": ERROR_400_CANCELLED_NO_COMPLETE,
+                "invalid_if_match": ERROR_400_INVALID_IF_MATCH,
+            }),
+        },
+        409: {"description": "Order changed since the expected version", "content": _json_content(ERROR_409_VERSION_CONFLICT)},
         500: {"description": "Internal server error", "content": _json_content(ERROR_500_COMPLETE)},
     }
 
 
+def response_200_order() -> dict:
+    return {
+        200: {
+            "description": "The order, in any status",
+            "content": _json_content(ORDER_COMPLETED_EXAMPLE),
+            "headers": {
+                "ETag": {"description": "Order version, for If-Match", "schema": {"type": "string"}},
+                "X-Cache": {"description": "`HIT` or `MISS` in the order cache", "schema": {"type": "string"}},
+            },
+        },
+        404: {"description": "Order not found", "content": _json_content(ERROR_404_ORDER)},
+        500: {"description": "Internal server error", "content": _json_content(ERROR_500_GET)},
+    }
+
+
 def response_200_pending_list() -> dict:
     return {
         200: {
@@ -129,6 +201,56 @@ def response_200_pending_list() -> dict:
     }
 
 
+def response_200_order_changes() -> dict:
+    return {
+        200: {
+            "description": "Changes after the cursor (may be empty)",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "with_changes": {"summary": "New and completed order", "value": ORDER_CHANGES_EXAMPLE},
+                        "empty": {
+                            "summary": "Nothing changed",
+                            "value": {"changes": [], "cursor": 42, "has_more": False},
+                        },
+                    }
+                }
+            },
+        },
+        410: {"description": "Cursor was compacted away; full re-sync required", "content": _json_content(ERROR_410_CURSOR_EXPIRED)},
+        500: {"description": "Internal server error", "content": _json_content(ERROR_500_CHANGES)},
+    }
+
+
+def response_200_order_summary() -> dict:
+    return {
+        200: {"description": "Dashboard counters", "content": _json_content(ORDER_SUMMARY_EXAMPLE)},
+        500: {"description": "Internal server error", "content": _json_content(ERROR_500_SUMMARY)},
+    }
+
+
+def response_200_order_export() -> dict:
+    return {
+        200: {
+            "description": "Orders streamed as NDJSON (one order per line) or CSV (one row per item)",
+            "content": {
+                "application/x-ndjson": {
+                    "example": '{"id":1,"table_number":5,"status":"completed","items":[...],"total":30.0,"created_at":"2026-01-31T19:45:00"}\n'
+                },
+                "text/csv": {
+                    "example": (
+                        "order_id,table_number,status,created_at,order_total,item_id,item_name,amount,price\n"
+                        "1,5,completed,2026-01-31T19:45:00,30.00,1,Burger,2,12.50\n"
+                        "1,5,completed,2026-01-31T19:45:00,30.00,2,Fries,1,5.00\n"
+                    )
+                },
+            },
+        },
+        400: {"description": "Invalid date range", "content": _json_content(ERROR_400_EXPORT_RANGE)},
+        422: {"description": "Validation error (e.g. unknown format)", "content": _json_content(ERROR_422_VALIDATION)},
+    }
+
+
 # ---------------------------------------------------------------------------
 # Operation metadata: summary + description (for use in route decorators)
 # ---------------------------------------------------------------------------
@@ -140,7 +262,10 @@ Create a new restaurant order for a specific table.
 
 The order is created with status **pending**; the total is calculated from items.
 
-**Validation:** Table number > 0; at least one item; item name 1–255 chars; amount > 0; price positive, max 2 decimals.
+**Validation:** Table number > 0; 1 to `ORDER_MAX_ITEMS` items (100 by default); item name 1–255 chars; amount > 0; price positive, max 2 decimals.
+Bodies over `MAX_REQUEST_BODY_BYTES` (64 KiB by default) are rejected with 413 before they are parsed.
+
+Lines with the same name and price are merged into one line with the summed amount.
 """.strip(),
     "response_description": "The created order with items and total",
     "responses": response_201_order,
@@ -152,17 +277,73 @@ LIST_PENDING_ORDERS = {
 Return all orders with status **pending**, sorted by creation time (oldest first).
 
 Use this to process orders in the order they were received (e.g. kitchen display).
+Totals are aggregated in SQL. Pass `include_items=false` for summary views: items are not loaded and `items` is `null`.
 """.strip(),
     "response_description": "List of pending orders (may be empty)",
     "responses": response_200_pending_list,
 }
 
+LIST_ORDER_CHANGES = {
+    "summary": "List order changes since a cursor",
+    "description": """
+Return compact deltas for every order mutation after `since`, oldest first, plus the new cursor.
+
+Start with `since=0` (or after a full `/orders/pending` load), then pass the returned `cursor` back on each poll.
+**created** deltas carry the full order; status changes carry only the new status.
+If the cursor is older than the retained log (it was compacted), the endpoint returns **410** and the client must re-sync.
+""".strip(),
+    "response_description": "Changes after the cursor and the new cursor",
+    "responses": response_200_order_changes,
+}
+
+EXPORT_ORDERS = {
+    "summary": "Export orders",
+    "description": """
+Stream every order created in `[from, to)` with its items, ordered by id, as **NDJSON** (one order per line, same shape as other order responses) or **CSV** (one row per item).
+
+Rows are read from a streaming cursor and encoded incrementally, so memory use stays flat regardless of the export size.
+Timestamps without an offset are taken as UTC. Both bounds are optional.
+""".strip(),
+    "response_description": "Streamed export file",
+    "responses": response_200_order_export,
+}
+
+GET_ORDER_SUMMARY = {
+    "summary": "Get kitchen dashboard summary",
+    "description": """
+Return order counts per status, the age of the oldest active (pending, in_progress, ready) order, and revenue of orders completed today.
+
+Counts and revenue come from counters updated in the same transaction as each status change, so the cost does not grow with the number of orders.
+"Today" is the business day in `BUSINESS_TIMEZONE`.
+""".strip(),
+    "response_description": "Counts per status, oldest active order, and today's revenue",
+    "responses": response_200_order_summary,
+}
+
+GET_ORDER = {
+    "summary": "Get an order",
+    "description": """
+Return one order with its items, whatever its status (including completed and cancelled orders).
+
+Served from an in-process LRU cache keyed by order id and version: cancel and complete write the new
+version through, so a re-opened ticket usually costs a dictionary lookup. `X-Cache` tells whether the
+response came from the cache. Each hit is checked against the order's current version (a primary-key
+lookup), so changes made by other workers are never hidden.
+""".strip(),
+    "response_description": "The order",
+    "responses": response_200_order,
+}
+
 CANCEL_ORDER = {
     "summary": "Cancel an order",
     "description": """
 Cancel an order that is not yet completed. The order is set to **cancelled** (not deleted).
 
 **Allowed statuses:** pending, in_progress, ready. Completed or already cancelled orders return 400.
+
+**Concurrency:** send the `version` you last saw as `If-Match: "<version>"` or `?expected_version=`;
+if the order changed since, the request fails with 409 and nothing is written. Without either, the
+cancel still never overwrites a change committed between its read and its write.
 """.strip(),
     "response_description": "The cancelled order",
     "responses": response_200_order_cancelled,
@@ -172,6 +353,9 @@ COMPLETE_ORDER = {
     "summary": "Mark order as completed",
     "description": """
 Mark an order as **completed** (e.g. delivered to the table). Idempotent: calling again on an already completed order returns success.
+
+**Concurrency:** send the `version` you last saw as `If-Match: "<version>"` or `?expected_version=`;
+if the order changed since, the request fails with 409 and nothing is written.
 """.strip(),
     "response_description": "The completed order",
     "responses": response_200_order_completed,
@@ -0,0 +1,70 @@
+"""
+OpenAPI documentation for the Reports API.
+
+Same layout as ``backend.openapi.orders``: tag, response examples, response
+spec builders, then operation metadata.
+"""
+
+from backend.openapi.orders import _json_content
+
+# ---------------------------------------------------------------------------
+# Tag (used in main.py openapi_tags and on router)
+# ---------------------------------------------------------------------------
+
+REPORTS_TAG = "Reports"
+
+# ---------------------------------------------------------------------------
+# Reusable response examples
+# ---------------------------------------------------------------------------
+
+PREP_TIMES_EXAMPLE = {
+    "from": "2026-01-01",
+    "to": "2026-01-30",
+    "overall": {"count": 1840, "p50_seconds": 612.4, "p90_seconds": 1183.0, "p99_seconds": 2011.7},
+    "by_hour": [
+        {"hour": 12, "count": 410, "p50_seconds": 734.9, "p90_seconds": 1391.2, "p99_seconds": 2249.6},
+        {"hour": 13, "count": 388, "p50_seconds": 702.1, "p90_seconds": 1310.0, "p99_seconds": 2098.3},
+    ],
+    "by_item": [
+        {"name": "Pupusa revuelta", "count": 920, "p50_seconds": 650.2, "p90_seconds": 1210.6, "p99_seconds": 1970.4},
+        {"name": "Horchata", "count": 705, "p50_seconds": 540.8, "p90_seconds": 1052.3, "p99_seconds": 1815.5},
+    ],
+}
+
+ERROR_400_INVALID_RANGE = {"detail": "`from` must not be later than `to`"}
+ERROR_500_PREP_TIMES = {"detail": "Failed to build prep-time report"}
+
+# ---------------------------------------------------------------------------
+# Response spec builders
+# ---------------------------------------------------------------------------
+
+
+def response_200_prep_times() -> dict:
+    return {
+        200: {
+            "description": "Prep-time percentiles overall, per hour and per dish (lists may be empty)",
+            "content": _json_content(PREP_TIMES_EXAMPLE),
+        },
+        400: {"description": "Invalid date range", "content": _json_content(ERROR_400_INVALID_RANGE)},
+        500: {"description": "Internal server error", "content": _json_content(ERROR_500_PREP_TIMES)},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Operation metadata: summary + description (for use in route decorators)
+# ---------------------------------------------------------------------------
+
+GET_PREP_TIMES = {
+    "summary": "Get prep-time percentiles",
+    "description": """
+Return p50/p90/p99 prep times for orders that came in on business days `[from, to]`: overall, per hour of
+the day and per dish. Defaults to the last `PREP_TIME_REPORT_DEFAULT_DAYS` days up to today.
+
+Prep time runs from when the kitchen started an order (or when it was created) to when it was ready (or
+completed). Each finished order is added to small per-day quantile sketches as it happens; the report only
+merges the sketches of the range, so it costs the same with a week or with years of orders. Percentiles are
+accurate to within 1% of the true value.
+""".strip(),
+    "response_description": "Prep-time report",
+    "responses": response_200_prep_times,
+}
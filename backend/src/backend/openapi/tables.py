@@ -0,0 +1,89 @@
+"""
+OpenAPI documentation for the Tables API.
+
+Same layout as ``backend.openapi.orders``: tag, response examples, response
+spec builders, then operation metadata.
+"""
+
+from backend.openapi.orders import ORDER_RESPONSE_EXAMPLE, _json_content
+
+# ---------------------------------------------------------------------------
+# Tag (used in main.py openapi_tags and on router)
+# ---------------------------------------------------------------------------
+
+TABLES_TAG = "Tables"
+
+# ---------------------------------------------------------------------------
+# Reusable response examples
+# ---------------------------------------------------------------------------
+
+TABLE_ORDERS_EXAMPLE = {
+    "table_number": 5,
+    "orders": [ORDER_RESPONSE_EXAMPLE],
+    "total": 30.00,
+}
+
+OPEN_TABS_EXAMPLE = [
+    {"table_number": 3, "order_count": 1, "total": 15.00, "oldest_order_at": "2026-01-31T19:46:00.000000Z"},
+    {"table_number": 5, "order_count": 2, "total": 42.50, "oldest_order_at": "2026-01-31T19:45:00.000000Z"},
+]
+
+ERROR_500_TABLE_ORDERS = {"detail": "Failed to retrieve table orders"}
+ERROR_500_OPEN_TABS = {"detail": "Failed to retrieve open tabs"}
+
+# ---------------------------------------------------------------------------
+# Response spec builders
+# ---------------------------------------------------------------------------
+
+
+def response_200_table_orders() -> dict:
+    return {
+        200: {
+            "description": "Open orders of the table (may be empty) and their total",
+            "content": _json_content(TABLE_ORDERS_EXAMPLE),
+        },
+        500: {"description": "Internal server error", "content": _json_content(ERROR_500_TABLE_ORDERS)},
+    }
+
+
+def response_200_open_tabs() -> dict:
+    return {
+        200: {
+            "description": "Tables with open orders (or empty list)",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "with_tabs": {"summary": "Two open tabs", "value": OPEN_TABS_EXAMPLE},
+                        "empty": {"summary": "No open tabs", "value": []},
+                    }
+                }
+            },
+        },
+        500: {"description": "Internal server error", "content": _json_content(ERROR_500_OPEN_TABS)},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Operation metadata: summary + description (for use in route decorators)
+# ---------------------------------------------------------------------------
+
+LIST_TABLE_ORDERS = {
+    "summary": "List a table's open orders",
+    "description": """
+Return the open orders (pending, in_progress, ready) of one table, oldest first, with the running total.
+
+Served by the `(table_number, status)` index, so the cost follows that table's orders only.
+Pass `include_items=false` to skip loading items.
+""".strip(),
+    "response_description": "The table's open orders and their total",
+    "responses": response_200_table_orders,
+}
+
+LIST_OPEN_TABS = {
+    "summary": "List open tabs",
+    "description": """
+Return one entry per table that has open orders: number of open orders, running total, and the oldest order's creation time.
+""".strip(),
+    "response_description": "Open tabs sorted by table number",
+    "responses": response_200_open_tabs,
+}
@@ -0,0 +1,107 @@
+"""
+Read-through cache for single-order lookups.
+
+``GET /api/v1/orders/{id}`` serves built ``OrderResponse`` objects from a
+bounded LRU keyed by ``(tenant, order_id)``. Each entry remembers the order
+version it was built from, and a hit only counts if that is still the
+order's current version, read with a primary-key ``SELECT version``. Writes
+made by other workers or the bulk importer therefore never serve a stale
+order; they only turn the next lookup into a miss. The mutation routes
+write the new version through after committing, and a slower reader can
+never replace it with an older one. Entries expire after a TTL so orders
+nobody reads again do not hold memory until evicted.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from backend.config import settings
+from backend.schemas.order import OrderResponse
+
+
+class OrderCache:
+    """Thread-safe LRU of order responses with hit/miss counters."""
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 60.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, OrderResponse]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: Hashable, current_version: int | None) -> OrderResponse | None:
+        """
+        Return the cached order if it is at ``current_version``, counting a hit or a miss.
+
+        A stale entry (expired, or built from another version) is dropped.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry[0] <= time.monotonic() or entry[1].version != current_version
+            ):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, order: OrderResponse) -> None:
+        """Store an order unless a newer version is already cached."""
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1].version > order.version:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, order)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop an entry (e.g. after a write whose outcome is unknown)."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def stats(self) -> dict:
+        """Return counters for the admin endpoint."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else None,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+order_cache = OrderCache(
+    max_entries=settings.order_cache_max_entries,
+    ttl_seconds=settings.order_cache_ttl_seconds,
+)
@@ -0,0 +1,116 @@
+"""
+Prep-time quantiles maintained as each order finishes in the kitchen.
+
+An order's prep time runs from when the kitchen started it (``started_at``,
+or ``created_at`` if it was never marked in progress) to when it was ready
+(``ready_at``, or ``completed_at`` if it went straight to completed). When
+an order finishes, that time is added in the same transaction to the
+business day's quantile sketches: overall, for the hour the order came in,
+and for every dish on it. The report merges the daily sketches of the
+requested range with one grouped SUM, so its cost grows with the number of
+days and buckets, never with the number of orders.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Connection, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.models.order import OrderStatus
+from backend.models.summary import PrepTimeBucket
+from backend.sketches import QuantileSketch
+
+prep_time_buckets = PrepTimeBucket.__table__
+
+DIMENSION_ALL = "all"
+DIMENSION_HOUR = "hour"
+DIMENSION_ITEM = "item"
+
+# Statuses that end preparation; the first one reached records the prep time
+PREP_DONE_STATUSES = (OrderStatus.READY, OrderStatus.COMPLETED)
+
+
+def _utc(moment: datetime) -> datetime:
+    # SQLite returns naive datetimes; they are stored in UTC
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+
+def prep_seconds(
+    created_at: datetime,
+    started_at: datetime | None,
+    done_at: datetime,
+) -> float:
+    """Return the prep time of an order in seconds (never negative)."""
+    start = _utc(started_at or created_at)
+    return max((_utc(done_at) - start).total_seconds(), 0.0)
+
+
+def sketch_keys(created_at: datetime, item_names: Iterable[str]) -> Iterator[tuple[date, str, str]]:
+    """Yield the ``(day, dimension, key)`` sketches an order's prep time goes into."""
+    local = _utc(created_at).astimezone(ZoneInfo(settings.business_timezone))
+    day = local.date()
+    yield day, DIMENSION_ALL, ""
+    yield day, DIMENSION_HOUR, f"{local.hour:02d}"
+    for name in sorted(set(item_names)):
+        yield day, DIMENSION_ITEM, name
+
+
+def record_prep_time(
+    db: Session | Connection,
+    created_at: datetime,
+    started_at: datetime | None,
+    done_at: datetime,
+    item_names: Iterable[str],
+) -> None:
+    """Stage the prep time of a finished order in the caller's transaction."""
+    bucket = QuantileSketch().bucket(prep_seconds(created_at, started_at, done_at))
+    for day, dimension, key in sketch_keys(created_at, item_names):
+        match = (
+            (prep_time_buckets.c.day == day)
+            & (prep_time_buckets.c.dimension == dimension)
+            & (prep_time_buckets.c.key == key)
+            & (prep_time_buckets.c.bucket == bucket)
+        )
+        result = db.execute(
+            update(prep_time_buckets).where(match).values(count=prep_time_buckets.c.count + 1)
+        )
+        if result.rowcount == 0:
+            db.execute(
+                insert(prep_time_buckets).values(
+                    day=day, dimension=dimension, key=key, bucket=bucket, count=1
+                )
+            )
+
+
+def read_prep_time_sketches(
+    db: Session,
+    start: date,
+    end: date,
+) -> dict[tuple[str, str], QuantileSketch]:
+    """
+    Merge the daily sketches of ``[start, end]`` per dimension and key.
+
+    The merge is the grouped SUM itself: bucket counts of the same dimension,
+    key and bucket add up across days.
+    """
+    rows = db.execute(
+        select(
+            prep_time_buckets.c.dimension,
+            prep_time_buckets.c.key,
+            prep_time_buckets.c.bucket,
+            func.sum(prep_time_buckets.c.count),
+        )
+        .where(prep_time_buckets.c.day.between(start, end))
+        .group_by(
+            prep_time_buckets.c.dimension,
+            prep_time_buckets.c.key,
+            prep_time_buckets.c.bucket,
+        )
+    ).all()
+    sketches: dict[tuple[str, str], QuantileSketch] = {}
+    for dimension, key, bucket, count in rows:
+        sketches.setdefault((dimension, key), QuantileSketch()).add_bucket(bucket, count)
+    return sketches
@@ -0,0 +1,170 @@
+"""Opt-in per-request cProfile capture with size-bounded on-disk storage."""
+
+import asyncio
+import cProfile
+import logging
+import random
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.config import settings
+from backend.request_context import resolve_operation_id
+from backend.security import ADMIN_TOKEN_HEADER, is_admin_token
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_SUFFIX = ".prof"
+_STAMP_FORMAT = "%Y%m%dT%H%M%S%fZ"
+
+
+@dataclass(frozen=True)
+class ProfileInfo:
+    """Metadata of a stored profile, parsed from its file name."""
+
+    name: str
+    operation_id: str
+    duration_ms: int
+    created_at: datetime
+    size_bytes: int
+
+
+class ProfileStore:
+    """
+    Directory of ``.prof`` dumps (loadable with ``pstats``/snakeviz).
+
+    File names encode timestamp, duration and operation_id so listing never
+    has to open a profile. Oldest files are deleted once the directory
+    exceeds ``max_bytes``.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def save(self, profiler: cProfile.Profile, operation_id: str, duration_ms: int) -> Path:
+        """Dump a profile to disk and rotate old ones."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime(_STAMP_FORMAT)
+        safe_operation_id = re.sub(r"[^A-Za-z0-9_-]", "_", operation_id)
+        path = self.directory / f"{stamp}_{duration_ms}ms_{safe_operation_id}{PROFILE_SUFFIX}"
+        profiler.dump_stats(path)
+        self.rotate()
+        return path
+
+    def rotate(self) -> int:
+        """Delete the oldest profiles until the directory fits ``max_bytes``."""
+        files = sorted(self.directory.glob(f"*{PROFILE_SUFFIX}"))
+        sizes = [f.stat().st_size for f in files]
+        total = sum(sizes)
+        deleted = 0
+        # Names start with a UTC timestamp, so lexical order is age order
+        for path, size in zip(files, sizes):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            deleted += 1
+        return deleted
+
+    def list(self, limit: int = 50) -> list[ProfileInfo]:
+        """Return the most recent profiles, newest first."""
+        if not self.directory.is_dir():
+            return []
+        files = sorted(self.directory.glob(f"*{PROFILE_SUFFIX}"), reverse=True)
+        profiles = []
+        for path in files[:limit]:
+            info = self._parse(path)
+            if info is not None:
+                profiles.append(info)
+        return profiles
+
+    def path_for(self, name: str) -> Path | None:
+        """Resolve a profile name to a path inside the store, if it exists."""
+        path = self.directory / name
+        if path.parent != self.directory or path.suffix != PROFILE_SUFFIX or not path.is_file():
+            return None
+        return path
+
+    @staticmethod
+    def _parse(path: Path) -> ProfileInfo | None:
+        try:
+            stamp, duration, operation_id = path.stem.split("_", 2)
+            created_at = datetime.strptime(stamp, _STAMP_FORMAT).replace(tzinfo=timezone.utc)
+            duration_ms = int(duration.removesuffix("ms"))
+            size_bytes = path.stat().st_size
+        except (ValueError, OSError):
+            return None
+        return ProfileInfo(path.name, operation_id, duration_ms, created_at, size_bytes)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that runs sampled requests under cProfile.
+
+    A request is profiled when sampling is enabled and it wins the
+    ``sample_rate`` draw, or when it sends ``X-Profile: 1`` together with a
+    valid ``X-Admin-Token``. Since Python 3.12 cProfile observes every thread
+    (so the threadpool running sync handlers is included), but only one
+    profiler may be active at a time: overlapping requests are not profiled,
+    and work from concurrent requests can show up in a profile.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: ProfileStore,
+        enabled: bool = False,
+        sample_rate: float = 0.0,
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self._active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._active or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiling tool (e.g. a debugger) already owns the hook
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            self._active = False
+            duration_ms = round((time.perf_counter() - start) * 1000)
+            operation_id = resolve_operation_id(scope) or "unmatched"
+            try:
+                path = await asyncio.to_thread(self.store.save, profiler, operation_id, duration_ms)
+                logger.info(
+                    "Request profile saved",
+                    extra={"operation_id": operation_id, "duration_ms": duration_ms, "path": str(path)},
+                )
+            except OSError as e:
+                logger.error("Failed to save request profile", exc_info=e)
+
+    def _should_profile(self, scope: Scope) -> bool:
+        headers = Headers(scope=scope)
+        if headers.get(PROFILE_HEADER) == "1" and is_admin_token(headers.get(ADMIN_TOKEN_HEADER)):
+            return True
+        return self.enabled and random.random() < self.sample_rate
+
+
+profile_store = ProfileStore(Path(settings.profiling_dir), settings.profiling_max_bytes)
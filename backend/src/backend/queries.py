@@ -0,0 +1,267 @@
+"""
+Read-side query layer built on SQLAlchemy Core selects.
+
+GET endpoints only need a handful of columns and never modify what they read,
+so they select plain column tuples into slotted records instead of hydrating
+ORM instances (no identity map, no change tracking, no lazy-load machinery).
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, Row, and_, func, select
+from sqlalchemy.orm import Session
+
+from backend.models.order import (
+    ACTIVE_STATUSES,
+    Order,
+    OrderChange,
+    OrderItem,
+    OrderStatus,
+)
+
+orders = Order.__table__
+order_items = OrderItem.__table__
+order_changes = OrderChange.__table__
+
+
+@dataclass(slots=True)
+class OrderItemRecord:
+    """Columns of an order item needed by ``OrderItemResponse``."""
+
+    id: int
+    name: str
+    amount: int
+    price_cents: int
+
+
+@dataclass(slots=True)
+class OrderRecord:
+    """Columns of an order needed by ``OrderResponse``, with its SQL total."""
+
+    id: int
+    table_number: int
+    status: OrderStatus
+    created_at: datetime
+    total_cents: int
+    items: list[OrderItemRecord] = field(default_factory=list)
+    version: int = 1
+
+
+@dataclass(slots=True)
+class TableTabRecord:
+    """Aggregate of one table's open orders."""
+
+    table_number: int
+    order_count: int
+    total_cents: int
+    oldest_created_at: datetime
+
+
+def _total_cents():
+    return func.coalesce(
+        func.sum(order_items.c.amount * order_items.c.price_cents), 0
+    ).label("total_cents")
+
+
+def _fetch_orders(
+    db: Session,
+    condition: ColumnElement[bool],
+    include_items: bool,
+) -> list[OrderRecord]:
+    order_rows = db.execute(
+        select(
+            orders.c.id,
+            orders.c.table_number,
+            orders.c.status,
+            orders.c.created_at,
+            _total_cents(),
+            orders.c.version,
+        )
+        .select_from(orders.outerjoin(order_items, order_items.c.order_id == orders.c.id))
+        .where(condition)
+        .group_by(orders.c.id)
+        .order_by(orders.c.created_at.asc())
+    ).all()
+
+    records = [
+        OrderRecord(order_id, table_number, order_status, created_at, total_cents, version=version)
+        for order_id, table_number, order_status, created_at, total_cents, version in order_rows
+    ]
+    if include_items and records:
+        by_id = {record.id: record.items for record in records}
+        item_rows = db.execute(
+            select(
+                order_items.c.order_id,
+                order_items.c.id,
+                order_items.c.name,
+                order_items.c.amount,
+                order_items.c.price_cents,
+            )
+            .join(orders, orders.c.id == order_items.c.order_id)
+            .where(condition)
+            .order_by(order_items.c.id)
+        ).all()
+        for order_id, item_id, name, amount, price_cents in item_rows:
+            items = by_id.get(order_id)
+            # An order may change status between the two selects
+            if items is not None:
+                items.append(OrderItemRecord(item_id, name, amount, price_cents))
+    return records
+
+
+def fetch_orders_by_status(
+    db: Session,
+    order_status: OrderStatus,
+    include_items: bool = True,
+) -> list[OrderRecord]:
+    """
+    Fetch orders with a given status, oldest first, with SQL-computed totals.
+
+    Items are fetched with a second select filtered by the same status and
+    attached to their orders in a single pass.
+
+    Args:
+        db: Database session
+        order_status: Status to filter on
+        include_items: If False, only orders and totals are read
+
+    Returns:
+        Order records sorted by creation time
+    """
+    return _fetch_orders(db, orders.c.status == order_status, include_items)
+
+
+def fetch_order(db: Session, order_id: int) -> OrderRecord | None:
+    """Fetch one order with its items and SQL total, or None."""
+    records = _fetch_orders(db, orders.c.id == order_id, include_items=True)
+    return records[0] if records else None
+
+
+def fetch_table_orders(
+    db: Session,
+    table_number: int,
+    statuses: Sequence[OrderStatus] = ACTIVE_STATUSES,
+    include_items: bool = True,
+) -> list[OrderRecord]:
+    """
+    Fetch one table's orders in the given statuses, oldest first.
+
+    Both selects seek ``ix_orders_table_number_status``, so the cost follows
+    the number of orders of that table rather than of the whole restaurant.
+
+    Args:
+        db: Database session
+        table_number: Table to look up
+        statuses: Statuses to include (open orders by default)
+        include_items: If False, only orders and totals are read
+
+    Returns:
+        Order records sorted by creation time
+    """
+    condition = and_(orders.c.table_number == table_number, orders.c.status.in_(statuses))
+    return _fetch_orders(db, condition, include_items)
+
+
+def fetch_open_tabs(db: Session) -> list[TableTabRecord]:
+    """
+    Fetch one row per table with open orders: order count, total and oldest order.
+
+    Returns:
+        Tab records sorted by table number
+    """
+    open_orders = (
+        select(orders.c.id, orders.c.table_number, orders.c.created_at)
+        .where(orders.c.status.in_(ACTIVE_STATUSES))
+        .subquery()
+    )
+    rows = db.execute(
+        select(
+            open_orders.c.table_number,
+            func.count(func.distinct(open_orders.c.id)),
+            _total_cents(),
+            func.min(open_orders.c.created_at),
+        )
+        .select_from(
+            open_orders.outerjoin(order_items, order_items.c.order_id == open_orders.c.id)
+        )
+        .group_by(open_orders.c.table_number)
+        .order_by(open_orders.c.table_number)
+    ).all()
+    return [TableTabRecord(*row) for row in rows]
+
+
+def iter_orders_for_export(
+    db: Session,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    batch_size: int = 1000,
+) -> Iterator[OrderRecord]:
+    """
+    Stream orders (with items) created in ``[start, end)``, ordered by id.
+
+    A single order/item join is read with ``yield_per`` so at most
+    ``batch_size`` rows are buffered at a time, and consecutive rows of the
+    same order are folded into one record as they arrive. Memory stays flat
+    however many orders match.
+
+    Args:
+        db: Database session (must stay open while iterating)
+        start: Inclusive lower bound on ``created_at`` (naive UTC)
+        end: Exclusive upper bound on ``created_at`` (naive UTC)
+        batch_size: Rows fetched from the cursor per round trip
+
+    Yields:
+        Order records with items and totals
+    """
+    stmt = (
+        select(
+            orders.c.id,
+            orders.c.table_number,
+            orders.c.status,
+            orders.c.created_at,
+            orders.c.version,
+            order_items.c.id,
+            order_items.c.name,
+            order_items.c.amount,
+            order_items.c.price_cents,
+        )
+        .select_from(orders.outerjoin(order_items, order_items.c.order_id == orders.c.id))
+        .order_by(orders.c.id, order_items.c.id)
+        .execution_options(yield_per=batch_size)
+    )
+    if start is not None:
+        stmt = stmt.where(orders.c.created_at >= start)
+    if end is not None:
+        stmt = stmt.where(orders.c.created_at < end)
+
+    current: OrderRecord | None = None
+    for order_id, table_number, order_status, created_at, version, *item in db.execute(stmt):
+        if current is None or current.id != order_id:
+            if current is not None:
+                yield current
+            current = OrderRecord(order_id, table_number, order_status, created_at, 0, version=version)
+        item_id, name, amount, price_cents = item
+        if item_id is not None:
+            current.items.append(OrderItemRecord(item_id, name, amount, price_cents))
+            current.total_cents += amount * price_cents
+    if current is not None:
+        yield current
+
+
+def fetch_order_changes(db: Session, since: int, limit: int) -> Sequence[Row]:
+    """Fetch up to ``limit`` change log rows after ``since``, oldest first."""
+    return db.execute(
+        select(
+            order_changes.c.seq,
+            order_changes.c.order_id,
+            order_changes.c.change,
+            order_changes.c.status,
+            order_changes.c.changed_at,
+            order_changes.c.payload,
+        )
+        .where(order_changes.c.seq > since)
+        .order_by(order_changes.c.seq.asc())
+        .limit(limit)
+    ).all()
@@ -0,0 +1,107 @@
+"""SQL statement fingerprinting and per-fingerprint timing aggregates."""
+
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+
+from backend.config import settings
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a SQL statement so that equivalent queries share one key.
+
+    Literals become ``?``, placeholder lists of any length (e.g. the ``IN``
+    clause emitted by ``selectinload``) collapse to ``(...)``, and whitespace
+    is squashed.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint_id(normalized: str) -> str:
+    """Short stable id for a fingerprint, handy for log searches."""
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+@dataclass
+class _Aggregate:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    samples: deque[float] = field(default_factory=deque)
+
+
+class QueryStats:
+    """
+    Thread-safe per-fingerprint aggregates (count, total, max, p95).
+
+    p95 is computed over a bounded window of the most recent durations per
+    fingerprint; the number of fingerprints is bounded too, evicting the least
+    recently seen one.
+    """
+
+    def __init__(self, max_fingerprints: int = 500, sample_size: int = 1024) -> None:
+        self.max_fingerprints = max_fingerprints
+        self.sample_size = sample_size
+        self._lock = threading.Lock()
+        self._aggregates: OrderedDict[str, _Aggregate] = OrderedDict()
+
+    def record(self, normalized: str, duration_ms: float) -> None:
+        """Add one statement execution to its fingerprint's aggregate."""
+        with self._lock:
+            aggregate = self._aggregates.get(normalized)
+            if aggregate is None:
+                if len(self._aggregates) >= self.max_fingerprints:
+                    self._aggregates.popitem(last=False)
+                aggregate = _Aggregate(samples=deque(maxlen=self.sample_size))
+                self._aggregates[normalized] = aggregate
+            else:
+                self._aggregates.move_to_end(normalized)
+            aggregate.count += 1
+            aggregate.total_ms += duration_ms
+            aggregate.max_ms = max(aggregate.max_ms, duration_ms)
+            aggregate.samples.append(duration_ms)
+
+    def snapshot(self) -> list[dict]:
+        """Return aggregates sorted by total time, most expensive first."""
+        with self._lock:
+            items = [
+                (normalized, a.count, a.total_ms, a.max_ms, sorted(a.samples))
+                for normalized, a in self._aggregates.items()
+            ]
+        result = [
+            {
+                "fingerprint": normalized,
+                "fingerprint_id": fingerprint_id(normalized),
+                "count": count,
+                "total_ms": round(total_ms, 3),
+                "mean_ms": round(total_ms / count, 3),
+                "max_ms": round(max_ms, 3),
+                "p95_ms": round(samples[max(math.ceil(0.95 * len(samples)) - 1, 0)], 3),
+            }
+            for normalized, count, total_ms, max_ms, samples in items
+        ]
+        result.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return result
+
+    def reset(self) -> None:
+        """Drop all aggregates."""
+        with self._lock:
+            self._aggregates.clear()
+
+
+query_stats = QueryStats(
+    max_fingerprints=settings.query_stats_max_fingerprints,
+    sample_size=settings.query_stats_sample_size,
+)
@@ -0,0 +1,227 @@
+"""In-process token-bucket rate limiting keyed by client and operation."""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.config import Settings, settings
+from backend.request_context import resolve_operation_id
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Bucket refill rate (tokens per second) and capacity."""
+
+    rate: float
+    burst: int
+
+
+class TokenBucket:
+    """Token bucket state for one (client, operation) pair."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter with per-operation limits and idle eviction.
+
+    Buckets live in an LRU-ordered dict, so memory is one small slotted object
+    per active (client, operation) pair; buckets idle for longer than
+    ``idle_seconds`` (or beyond ``max_buckets``) are evicted as new requests
+    arrive. The limiter is only touched from the event loop, so it needs no lock.
+    """
+
+    def __init__(
+        self,
+        default: RateLimit,
+        limits: dict[str, RateLimit] | None = None,
+        idle_seconds: float = 300.0,
+        max_buckets: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.default = default
+        self.limits = limits or {}
+        self.idle_seconds = idle_seconds
+        self.max_buckets = max_buckets
+        self._clock = clock
+        self._buckets: OrderedDict[tuple[str, str], TokenBucket] = OrderedDict()
+        self._allowed: dict[str, int] = {}
+        self._rejected: dict[str, int] = {}
+        self._evicted = 0
+
+    @classmethod
+    def from_settings(cls, config: Settings) -> "RateLimiter":
+        """Build a limiter from application settings."""
+        return cls(
+            default=RateLimit(config.rate_limit_default_rate, config.rate_limit_default_burst),
+            limits={
+                operation_id: RateLimit(rate, burst)
+                for operation_id, (rate, burst) in config.rate_limits.items()
+            },
+            idle_seconds=config.rate_limit_idle_seconds,
+            max_buckets=config.rate_limit_max_buckets,
+        )
+
+    def limit_for(self, operation_id: str) -> RateLimit:
+        """Return the limit configured for an operation."""
+        return self.limits.get(operation_id, self.default)
+
+    def acquire(self, client_key: str, operation_id: str) -> float:
+        """
+        Take one token for a request.
+
+        Args:
+            client_key: Client identity (API key or IP address)
+            operation_id: Operation being called
+
+        Returns:
+            0.0 if the request is allowed, otherwise seconds until a token is available
+        """
+        limit = self.limit_for(operation_id)
+        if limit.rate <= 0:
+            self._allowed[operation_id] = self._allowed.get(operation_id, 0) + 1
+            return 0.0
+
+        now = self._clock()
+        self._evict(now)
+
+        key = (client_key, operation_id)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_buckets:
+                self._buckets.popitem(last=False)
+                self._evicted += 1
+            bucket = TokenBucket(float(limit.burst), now)
+            self._buckets[key] = bucket
+        else:
+            elapsed = now - bucket.updated
+            bucket.tokens = min(float(limit.burst), bucket.tokens + elapsed * limit.rate)
+            bucket.updated = now
+            self._buckets.move_to_end(key)
+
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            self._allowed[operation_id] = self._allowed.get(operation_id, 0) + 1
+            return 0.0
+
+        self._rejected[operation_id] = self._rejected.get(operation_id, 0) + 1
+        return (1.0 - bucket.tokens) / limit.rate
+
+    def _evict(self, now: float) -> None:
+        # Least recently used buckets sit at the front of the OrderedDict
+        while self._buckets:
+            bucket = next(iter(self._buckets.values()))
+            if now - bucket.updated < self.idle_seconds:
+                break
+            self._buckets.popitem(last=False)
+            self._evicted += 1
+
+    def stats(self) -> dict:
+        """Return counters for the admin endpoint."""
+        operation_ids = set(self._allowed) | set(self._rejected) | set(self.limits)
+        return {
+            "active_buckets": len(self._buckets),
+            "evicted_buckets": self._evicted,
+            "operations": {
+                operation_id: {
+                    "rate": self.limit_for(operation_id).rate,
+                    "burst": self.limit_for(operation_id).burst,
+                    "allowed": self._allowed.get(operation_id, 0),
+                    "rejected": self._rejected.get(operation_id, 0),
+                }
+                for operation_id in sorted(operation_ids)
+            },
+        }
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware that answers 429 with ``Retry-After`` when a bucket is empty.
+
+    Clients are keyed by API key only when the key is one of ``api_keys``;
+    anything else would let a client mint a fresh bucket per request. Other
+    clients are keyed by IP: the socket peer, or behind trusted proxies the
+    ``X-Forwarded-For`` entry appended by the outermost trusted proxy
+    (``trusted_proxy_hops`` from the right). Entries left of it are supplied
+    by the client and ignored.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: RateLimiter,
+        key_header: str = "X-API-Key",
+        api_keys: Iterable[str] = (),
+        trust_forwarded_for: bool = False,
+        trusted_proxy_hops: int = 1,
+        path_prefix: str = "/api/",
+    ) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.key_header = key_header
+        self.api_keys = frozenset(api_keys)
+        self.trust_forwarded_for = trust_forwarded_for
+        self.trusted_proxy_hops = max(trusted_proxy_hops, 1)
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        operation_id = resolve_operation_id(scope)
+        if operation_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        client_key = self._client_key(scope)
+        retry_after = self.limiter.acquire(client_key, operation_id)
+        if retry_after > 0:
+            logger.warning(
+                "Rate limit exceeded",
+                extra={"operation_id": operation_id, "retry_after": retry_after},
+            )
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Rate limit exceeded"},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _client_key(self, scope: Scope) -> str:
+        headers = Headers(scope=scope)
+        api_key = headers.get(self.key_header)
+        if api_key and api_key in self.api_keys:
+            return f"key:{api_key}"
+        if self.trust_forwarded_for:
+            # Each proxy appends the address it received from; count from the right
+            hops = [
+                entry.strip()
+                for value in headers.getlist("x-forwarded-for")
+                for entry in value.split(",")
+                if entry.strip()
+            ]
+            if hops:
+                return f"ip:{hops[-min(self.trusted_proxy_hops, len(hops))]}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+
+rate_limiter = RateLimiter.from_settings(settings)
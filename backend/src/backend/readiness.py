@@ -0,0 +1,189 @@
+"""
+Readiness checks for load balancers and orchestrators.
+
+``/health/ready`` runs a real but cheap database round trip and gathers pool,
+WAL, disk and writer-queue figures. The result is cached for
+``health_cache_ttl_seconds`` and concurrent probes wait for the one check in
+flight, so several orchestrators polling every second add one query per TTL.
+"""
+
+import logging
+import os
+import shutil
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import Engine
+from sqlalchemy.pool import QueuePool
+
+from backend.config import settings
+from backend.database import engine, writer_gauge
+from backend.tenancy import live_tenant_engines
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReadinessReport:
+    """Outcome of one readiness check."""
+
+    ready: bool
+    checked_at: datetime
+    reasons: list[str] = field(default_factory=list)
+    database: dict = field(default_factory=dict)
+    pool: dict = field(default_factory=dict)
+    writer_queue_depth: int = 0
+    wal_bytes: int | None = None
+    disk_free_bytes: int | None = None
+
+
+def pool_stats(engine: Engine) -> dict:
+    """Return connection pool usage; limits are None for pools without them."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"size": None, "checked_out": None, "overflow": None, "limit": None}
+    max_overflow = pool._max_overflow
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "limit": pool.size() + max_overflow if max_overflow >= 0 else None,
+    }
+
+
+def _sqlite_path(engine: Engine) -> str | None:
+    database = engine.url.database
+    if engine.dialect.name != "sqlite" or not database or database == ":memory:":
+        return None
+    return os.path.abspath(database)
+
+
+class ReadinessProbe:
+    """
+    Runs readiness checks against one engine and caches the result.
+
+    With ``tenant_engines``, the open tenant databases are pinged as well and
+    any that fails makes the instance not ready.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        ttl_seconds: float = 2.0,
+        max_db_latency_ms: float = 500.0,
+        max_writer_queue: int = 8,
+        min_free_disk_mb: int = 50,
+        check_database: bool = True,
+        tenant_engines: Callable[[], Sequence[tuple[str, Engine]]] | None = None,
+    ) -> None:
+        self.engine = engine
+        self.tenant_engines = tenant_engines
+        self.ttl_seconds = ttl_seconds
+        self.max_db_latency_ms = max_db_latency_ms
+        self.max_writer_queue = max_writer_queue
+        self.min_free_disk_mb = min_free_disk_mb
+        self.check_database = check_database
+        self._lock = threading.Lock()
+        self._report: ReadinessReport | None = None
+        self._expires_at = 0.0
+
+    def check(self) -> tuple[ReadinessReport, bool]:
+        """
+        Return the cached report, or run a new check once it has expired.
+
+        Returns:
+            The report and whether it came from the cache
+        """
+        with self._lock:
+            if self._report is not None and time.monotonic() < self._expires_at:
+                return self._report, True
+            self._report = self._run()
+            self._expires_at = time.monotonic() + self.ttl_seconds
+            if not self._report.ready:
+                logger.warning("Readiness check failed", extra={"reasons": self._report.reasons})
+            return self._report, False
+
+    def _run(self) -> ReadinessReport:
+        report = ReadinessReport(ready=True, checked_at=datetime.now(timezone.utc))
+        report.pool = pool_stats(self.engine)
+        report.writer_queue_depth = writer_gauge.active
+
+        if not self.check_database:
+            report.database = {"ok": True, "latency_ms": None, "error": None, "skipped": True}
+            return report
+
+        limit = report.pool["limit"]
+        if limit is not None and report.pool["checked_out"] >= limit:
+            # Checking out a connection now would block for the pool timeout
+            report.reasons.append("connection pool exhausted")
+            report.database = {"ok": False, "latency_ms": None, "error": "pool exhausted"}
+        else:
+            report.database = self._ping(self.engine)
+            if not report.database["ok"]:
+                report.reasons.append("database check failed")
+            elif report.database["latency_ms"] > self.max_db_latency_ms:
+                report.reasons.append(
+                    f"database latency {report.database['latency_ms']} ms"
+                    f" above {self.max_db_latency_ms} ms"
+                )
+
+        if self.tenant_engines is not None:
+            for tenant, tenant_engine in self.tenant_engines():
+                if not self._ping(tenant_engine)["ok"]:
+                    report.reasons.append(f"database check failed for tenant {tenant!r}")
+
+        if report.writer_queue_depth > self.max_writer_queue:
+            report.reasons.append(
+                f"{report.writer_queue_depth} writers queued (max {self.max_writer_queue})"
+            )
+
+        path = _sqlite_path(self.engine)
+        if path is not None:
+            wal_path = f"{path}-wal"
+            report.wal_bytes = os.path.getsize(wal_path) if os.path.exists(wal_path) else 0
+            try:
+                report.disk_free_bytes = shutil.disk_usage(os.path.dirname(path)).free
+            except OSError:
+                report.reasons.append("database volume unavailable")
+            else:
+                if report.disk_free_bytes < self.min_free_disk_mb * 1024 * 1024:
+                    report.reasons.append(
+                        f"{report.disk_free_bytes // (1024 * 1024)} MB free on the database volume"
+                    )
+
+        report.ready = not report.reasons
+        return report
+
+    def _ping(self, engine: Engine) -> dict:
+        # Reading sqlite_master touches the file (and its locks) unlike "SELECT 1"
+        statement = "SELECT 1"
+        if engine.dialect.name == "sqlite":
+            statement = "SELECT 1 FROM sqlite_master LIMIT 1"
+        start = time.perf_counter()
+        try:
+            with engine.connect() as conn:
+                conn.exec_driver_sql(statement).all()
+        except Exception as e:
+            logger.error("Readiness database check failed", exc_info=e)
+            return {"ok": False, "latency_ms": None, "error": type(e).__name__}
+        latency_ms = round((time.perf_counter() - start) * 1000, 3)
+        return {"ok": True, "latency_ms": latency_ms, "error": None}
+
+
+readiness_probe = ReadinessProbe(
+    engine,
+    ttl_seconds=settings.health_cache_ttl_seconds,
+    max_db_latency_ms=settings.health_max_db_latency_ms,
+    max_writer_queue=settings.health_max_writer_queue,
+    min_free_disk_mb=settings.health_min_free_disk_mb,
+    check_database=settings.order_repository == "sqlalchemy",
+    tenant_engines=live_tenant_engines,
+)
+
+
+def get_readiness_probe() -> ReadinessProbe:
+    """Dependency returning the application's readiness probe."""
+    return readiness_probe
@@ -0,0 +1,51 @@
+"""Order storage backends, selected with ``Settings.order_repository``."""
+
+from datetime import timedelta
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.database import get_db
+from backend.repositories.base import (
+    InvalidStatusTransitionError,
+    OrderNotFoundError,
+    OrderRepository,
+    OrderVersionConflictError,
+)
+from backend.repositories.memory import InMemoryOrderRepository
+from backend.repositories.sqlalchemy import SqlAlchemyOrderRepository
+
+# Shared by every request when ORDER_REPOSITORY=memory
+memory_repository = InMemoryOrderRepository(
+    change_log_retention=timedelta(hours=settings.change_log_retention_hours)
+)
+
+
+def get_order_repository(db: Annotated[Session, Depends(get_db)]) -> OrderRepository:
+    """
+    Dependency returning the configured order repository.
+
+    The session is created lazily by SQLAlchemy, so the memory backend never
+    opens a database connection.
+    """
+    if settings.order_repository == "memory":
+        return memory_repository
+    return SqlAlchemyOrderRepository(db)
+
+
+OrderRepositoryDep = Annotated[OrderRepository, Depends(get_order_repository)]
+
+
+__all__ = [
+    "InMemoryOrderRepository",
+    "InvalidStatusTransitionError",
+    "OrderNotFoundError",
+    "OrderRepository",
+    "OrderRepositoryDep",
+    "OrderVersionConflictError",
+    "SqlAlchemyOrderRepository",
+    "get_order_repository",
+    "memory_repository",
+]
@@ -0,0 +1,135 @@
+"""Storage-agnostic interface for orders."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime
+from typing import Any
+
+from backend.models.order import OrderStatus
+from backend.queries import OrderRecord, TableTabRecord
+from backend.schemas.order import OrderItemCreate
+from backend.sketches import QuantileSketch
+
+
+class OrderNotFoundError(LookupError):
+    """Raised when a mutation targets an order that does not exist."""
+
+    def __init__(self, order_id: int) -> None:
+        super().__init__(f"Order with id {order_id} not found")
+        self.order_id = order_id
+
+
+class InvalidStatusTransitionError(ValueError):
+    """Raised when an order is moved to a status it can never be moved to."""
+
+    def __init__(self, order_id: int, new_status: OrderStatus) -> None:
+        super().__init__(f"Order with id {order_id} cannot be moved to {new_status.value}")
+        self.order_id = order_id
+        self.new_status = new_status
+
+
+class OrderVersionConflictError(Exception):
+    """Raised when an order changed since the version the caller acted on."""
+
+    def __init__(self, order_id: int, expected: int, current: int | None) -> None:
+        super().__init__(f"Order with id {order_id} was modified concurrently")
+        self.order_id = order_id
+        self.expected = expected
+        self.current = current
+
+
+class OrderRepository(ABC):
+    """
+    Everything the order routes need from storage.
+
+    Implementations return plain records (``OrderRecord`` and friends), keep
+    the change log and dashboard counters consistent with every mutation, and
+    are safe to call from the threadpool that runs sync endpoints.
+    """
+
+    @abstractmethod
+    def create(self, table_number: int, items: Sequence[OrderItemCreate]) -> OrderRecord:
+        """Create a pending order and record it in the change log and counters."""
+
+    @abstractmethod
+    def get(self, order_id: int) -> OrderRecord | None:
+        """Return an order with its items, or None if it does not exist."""
+
+    @abstractmethod
+    def get_version(self, order_id: int) -> int | None:
+        """Return an order's current version (a primary-key lookup), or None if it does not exist."""
+
+    @abstractmethod
+    def set_status(
+        self,
+        order_id: int,
+        new_status: OrderStatus,
+        expected_version: int | None = None,
+    ) -> OrderRecord:
+        """
+        Move an order to a new status, recording the change and counter updates.
+
+        Callers validate the transition first; this only applies it. The
+        status's transition timestamp is set, and an order leaving the
+        kitchen (ready, or completed without being ready) adds its prep time
+        to the prep-time sketches. The
+        order's version is incremented; with ``expected_version`` the write is
+        a compare-and-swap, so a caller that validated an older version of
+        the order never overwrites a concurrent change.
+
+        Raises:
+            InvalidStatusTransitionError: If ``new_status`` has no change type
+                in ``CHANGE_FOR_STATUS`` (moving back to pending)
+            OrderNotFoundError: If the order does not exist
+            OrderVersionConflictError: If the order is not at ``expected_version``
+        """
+
+    @abstractmethod
+    def list_by_status(self, order_status: OrderStatus, include_items: bool = True) -> list[OrderRecord]:
+        """Return orders in a status, oldest first."""
+
+    @abstractmethod
+    def list_for_table(self, table_number: int, include_items: bool = True) -> list[OrderRecord]:
+        """Return a table's open orders, oldest first."""
+
+    @abstractmethod
+    def open_tabs(self) -> list[TableTabRecord]:
+        """Return one aggregate per table with open orders, by table number."""
+
+    @abstractmethod
+    def iter_export(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        batch_size: int,
+    ) -> Iterator[OrderRecord]:
+        """Stream orders created in ``[start, end)`` (naive UTC), by id."""
+
+    @abstractmethod
+    def oldest_change_seq(self) -> int | None:
+        """Return the smallest change log sequence number still retained."""
+
+    @abstractmethod
+    def list_changes(self, since: int, limit: int) -> Sequence[Any]:
+        """
+        Return up to ``limit`` change log entries after ``since``, oldest first.
+
+        Entries expose ``seq``, ``order_id``, ``change``, ``status``,
+        ``changed_at`` and ``payload`` attributes.
+        """
+
+    @abstractmethod
+    def summary(self) -> dict:
+        """Return dashboard counters in the shape of ``backend.counters.read_summary``."""
+
+    @abstractmethod
+    def prep_list(self) -> list[tuple[str, int]]:
+        """Return ``(name, quantity)`` per dish owed by active orders, largest first."""
+
+    @abstractmethod
+    def prep_time_sketches(self, start: date, end: date) -> dict[tuple[str, str], QuantileSketch]:
+        """
+        Return prep-time sketches of orders that came in on business days ``[start, end]``.
+
+        Keyed by ``(dimension, key)`` as described in ``backend.prep_times``.
+        """
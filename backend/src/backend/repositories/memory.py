@@ -0,0 +1,293 @@
+"""In-process order repository for ephemeral deployments and benchmarks."""
+
+import heapq
+import threading
+from collections import Counter, deque
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from backend.counters import business_day
+from backend.models.order import (
+    ACTIVE_STATUSES,
+    CHANGE_FOR_STATUS,
+    TRANSITION_TIMESTAMPS,
+    OrderChangeType,
+    OrderStatus,
+)
+from backend.prep_times import prep_seconds, sketch_keys
+from backend.queries import OrderItemRecord, OrderRecord, TableTabRecord
+from backend.repositories.base import (
+    InvalidStatusTransitionError,
+    OrderNotFoundError,
+    OrderRepository,
+    OrderVersionConflictError,
+)
+from backend.schemas.order import OrderItemCreate, OrderResponse
+from backend.sketches import QuantileSketch
+
+
+@dataclass(slots=True)
+class ChangeRecord:
+    """Change log entry with the same attributes as an ``order_changes`` row."""
+
+    seq: int
+    order_id: int
+    change: OrderChangeType
+    status: OrderStatus
+    changed_at: datetime
+    payload: dict[str, Any] | None
+
+
+def _utcnow() -> datetime:
+    # Naive UTC, matching what the SQLite backend returns
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _copy(order: OrderRecord, include_items: bool = True) -> OrderRecord:
+    return OrderRecord(
+        order.id,
+        order.table_number,
+        order.status,
+        order.created_at,
+        order.total_cents,
+        list(order.items) if include_items else [],
+        order.version,
+    )
+
+
+class InMemoryOrderRepository(OrderRepository):
+    """
+    Lock-protected, non-durable repository.
+
+    Indexes are kept up to date on every mutation so no read scans all orders:
+
+    * ``_by_status``: insertion-ordered id sets per status. Orders only enter
+      PENDING when created, so the PENDING set is already the oldest-first
+      queue; other statuses are sorted on read.
+    * ``_open_by_table``: open order ids per table.
+    * ``_active_heap``: ``(created_at, id)`` min-heap of active orders with lazy
+      deletion, giving the oldest active order in O(1) amortized.
+    * ``_prep``: quantity per dish owed by active orders.
+    * ``_prep_times``: prep-time sketches per ``(day, dimension, key)``.
+    """
+
+    def __init__(self, change_log_retention: timedelta = timedelta(hours=24)) -> None:
+        self.change_log_retention = change_log_retention
+        self._lock = threading.Lock()
+        self._orders: dict[int, OrderRecord] = {}
+        self._by_status: dict[OrderStatus, dict[int, None]] = {s: {} for s in OrderStatus}
+        self._open_by_table: dict[int, dict[int, None]] = {}
+        self._active_heap: list[tuple[datetime, int]] = []
+        self._revenue: dict[date, list[int]] = {}
+        self._prep: Counter[str] = Counter()
+        self._timestamps: dict[int, dict[str, datetime]] = {}
+        self._prep_times: dict[tuple[date, str, str], QuantileSketch] = {}
+        self._changes: deque[ChangeRecord] = deque()
+        self._next_order_id = 1
+        self._next_item_id = 1
+        self._next_seq = 1
+
+    # -- writes ---------------------------------------------------------------
+
+    def create(self, table_number: int, items: Sequence[OrderItemCreate]) -> OrderRecord:
+        with self._lock:
+            order_items = []
+            for item in items:
+                order_items.append(
+                    OrderItemRecord(self._next_item_id, item.name, item.amount, item.price_cents)
+                )
+                self._next_item_id += 1
+            order = OrderRecord(
+                self._next_order_id,
+                table_number,
+                OrderStatus.PENDING,
+                _utcnow(),
+                sum(item.amount * item.price_cents for item in order_items),
+                order_items,
+            )
+            self._next_order_id += 1
+
+            self._orders[order.id] = order
+            self._by_status[order.status][order.id] = None
+            self._open_by_table.setdefault(table_number, {})[order.id] = None
+            heapq.heappush(self._active_heap, (order.created_at, order.id))
+            for item in order_items:
+                self._prep[item.name] += item.amount
+            self._append_change(order, OrderChangeType.CREATED)
+            return _copy(order)
+
+    def set_status(
+        self,
+        order_id: int,
+        new_status: OrderStatus,
+        expected_version: int | None = None,
+    ) -> OrderRecord:
+        change = CHANGE_FOR_STATUS.get(new_status)
+        if change is None:
+            raise InvalidStatusTransitionError(order_id, new_status)
+        with self._lock:
+            order = self._orders.get(order_id)
+            if order is None:
+                raise OrderNotFoundError(order_id)
+            if expected_version is not None and order.version != expected_version:
+                raise OrderVersionConflictError(order_id, expected_version, order.version)
+            now = _utcnow()
+            timestamps = self._timestamps.setdefault(order_id, {})
+            if new_status == OrderStatus.READY or (
+                new_status == OrderStatus.COMPLETED and "ready_at" not in timestamps
+            ):
+                seconds = prep_seconds(order.created_at, timestamps.get("started_at"), now)
+                for key in sketch_keys(order.created_at, (item.name for item in order.items)):
+                    self._prep_times.setdefault(key, QuantileSketch()).add(seconds)
+            if new_status in TRANSITION_TIMESTAMPS:
+                timestamps[TRANSITION_TIMESTAMPS[new_status]] = now
+            if (order.status in ACTIVE_STATUSES) != (new_status in ACTIVE_STATUSES):
+                sign = 1 if new_status in ACTIVE_STATUSES else -1
+                for item in order.items:
+                    self._prep[item.name] += sign * item.amount
+                    if self._prep[item.name] <= 0:
+                        del self._prep[item.name]
+            del self._by_status[order.status][order_id]
+            self._by_status[new_status][order_id] = None
+            order.status = new_status
+            order.version += 1
+            if new_status not in ACTIVE_STATUSES:
+                table = self._open_by_table.get(order.table_number, {})
+                table.pop(order_id, None)
+                if not table:
+                    self._open_by_table.pop(order.table_number, None)
+            if new_status == OrderStatus.COMPLETED:
+                day = self._revenue.setdefault(business_day(), [0, 0])
+                day[0] += order.total_cents
+                day[1] += 1
+            self._append_change(order, change)
+            return _copy(order)
+
+    def _append_change(self, order: OrderRecord, change: OrderChangeType) -> None:
+        payload = None
+        if change == OrderChangeType.CREATED:
+            payload = OrderResponse.from_order(order, total_cents=order.total_cents).model_dump(
+                mode="json"
+            )
+        now = _utcnow()
+        self._changes.append(
+            ChangeRecord(self._next_seq, order.id, change, order.status, now, payload)
+        )
+        self._next_seq += 1
+        # Compact as we go; the newest entry is always kept (see backend.changes)
+        cutoff = now - self.change_log_retention
+        while len(self._changes) > 1 and self._changes[0].changed_at < cutoff:
+            self._changes.popleft()
+
+    # -- reads ----------------------------------------------------------------
+
+    def get(self, order_id: int) -> OrderRecord | None:
+        with self._lock:
+            order = self._orders.get(order_id)
+            return _copy(order) if order is not None else None
+
+    def get_version(self, order_id: int) -> int | None:
+        with self._lock:
+            order = self._orders.get(order_id)
+            return order.version if order is not None else None
+
+    def _sorted(self, ids: dict[int, None], presorted: bool, include_items: bool) -> list[OrderRecord]:
+        records = [_copy(self._orders[order_id], include_items) for order_id in ids]
+        if not presorted:
+            records.sort(key=lambda order: (order.created_at, order.id))
+        return records
+
+    def list_by_status(self, order_status: OrderStatus, include_items: bool = True) -> list[OrderRecord]:
+        with self._lock:
+            return self._sorted(
+                self._by_status[order_status],
+                presorted=order_status == OrderStatus.PENDING,
+                include_items=include_items,
+            )
+
+    def list_for_table(self, table_number: int, include_items: bool = True) -> list[OrderRecord]:
+        with self._lock:
+            return self._sorted(
+                self._open_by_table.get(table_number, {}),
+                presorted=False,
+                include_items=include_items,
+            )
+
+    def open_tabs(self) -> list[TableTabRecord]:
+        with self._lock:
+            tabs = []
+            for table_number in sorted(self._open_by_table):
+                orders = [self._orders[order_id] for order_id in self._open_by_table[table_number]]
+                tabs.append(
+                    TableTabRecord(
+                        table_number,
+                        len(orders),
+                        sum(order.total_cents for order in orders),
+                        min(order.created_at for order in orders),
+                    )
+                )
+            return tabs
+
+    def iter_export(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        batch_size: int,
+    ) -> Iterator[OrderRecord]:
+        with self._lock:
+            # Ids are assigned in order, so dict order is id order
+            order_ids = list(self._orders)
+        for offset in range(0, len(order_ids), batch_size):
+            with self._lock:
+                batch = [
+                    _copy(self._orders[order_id])
+                    for order_id in order_ids[offset : offset + batch_size]
+                ]
+            for order in batch:
+                if start is not None and order.created_at < start:
+                    continue
+                if end is not None and order.created_at >= end:
+                    continue
+                yield order
+
+    def oldest_change_seq(self) -> int | None:
+        with self._lock:
+            return self._changes[0].seq if self._changes else None
+
+    def list_changes(self, since: int, limit: int) -> list[ChangeRecord]:
+        with self._lock:
+            if not self._changes:
+                return []
+            # Sequence numbers are contiguous, so the cursor maps to an index;
+            # pollers ask for the tail, which deque indexing reaches from the right
+            first = max(since + 1 - self._changes[0].seq, 0)
+            return [self._changes[i] for i in range(first, min(first + limit, len(self._changes)))]
+
+    def summary(self) -> dict:
+        with self._lock:
+            heap = self._active_heap
+            while heap and self._orders[heap[0][1]].status not in ACTIVE_STATUSES:
+                heapq.heappop(heap)
+            day = business_day()
+            revenue_cents, completed_orders = self._revenue.get(day, (0, 0))
+            return {
+                "counts": {s: len(ids) for s, ids in self._by_status.items()},
+                "oldest_active_created_at": heap[0][0] if heap else None,
+                "day": day,
+                "revenue_cents": revenue_cents,
+                "completed_orders": completed_orders,
+            }
+
+    def prep_list(self) -> list[tuple[str, int]]:
+        with self._lock:
+            return sorted(self._prep.items(), key=lambda entry: (-entry[1], entry[0]))
+
+    def prep_time_sketches(self, start: date, end: date) -> dict[tuple[str, str], QuantileSketch]:
+        with self._lock:
+            merged: dict[tuple[str, str], QuantileSketch] = {}
+            for (day, dimension, key), sketch in self._prep_times.items():
+                if start <= day <= end:
+                    merged.setdefault((dimension, key), QuantileSketch()).merge(sketch)
+            return merged
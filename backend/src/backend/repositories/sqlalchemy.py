@@ -0,0 +1,185 @@
+"""Order repository backed by the SQLAlchemy session (the default)."""
+
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, timezone
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from backend.changes import oldest_retained_seq, record_order_change
+from backend.counters import (
+    order_prep_quantities,
+    order_total_cents,
+    read_prep_list,
+    read_summary,
+    record_prep_change,
+    record_status_change,
+)
+from backend.models.order import (
+    CHANGE_FOR_STATUS,
+    TRANSITION_TIMESTAMPS,
+    Order,
+    OrderChangeType,
+    OrderItem,
+    OrderStatus,
+)
+from backend.prep_times import read_prep_time_sketches, record_prep_time
+from backend.queries import (
+    OrderItemRecord,
+    OrderRecord,
+    TableTabRecord,
+    fetch_open_tabs,
+    fetch_order,
+    fetch_order_changes,
+    fetch_orders_by_status,
+    fetch_table_orders,
+    iter_orders_for_export,
+)
+from backend.repositories.base import (
+    InvalidStatusTransitionError,
+    OrderNotFoundError,
+    OrderRepository,
+    OrderVersionConflictError,
+)
+from backend.schemas.order import OrderItemCreate
+from backend.sketches import QuantileSketch
+from backend.tracing import span
+
+
+def _to_record(order: Order) -> OrderRecord:
+    items = [
+        OrderItemRecord(item.id, item.name, item.amount, item.price_cents) for item in order.items
+    ]
+    return OrderRecord(
+        order.id,
+        order.table_number,
+        order.status,
+        order.created_at,
+        sum(item.amount * item.price_cents for item in items),
+        items,
+        order.version,
+    )
+
+
+class SqlAlchemyOrderRepository(OrderRepository):
+    """
+    Repository over one request's session.
+
+    Writes go through the ORM so the change log and counters are staged in
+    the same transaction; reads use the Core read path in ``backend.queries``.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def create(self, table_number: int, items: Sequence[OrderItemCreate]) -> OrderRecord:
+        order = Order(table_number=table_number, status=OrderStatus.PENDING)
+        for item in items:
+            OrderItem(
+                name=item.name,
+                amount=item.amount,
+                price_cents=item.price_cents,
+                order=order,
+            )
+        self.db.add(order)
+        quantities: Counter[str] = Counter()
+        for item in items:
+            quantities[item.name] += item.amount
+        try:
+            with span("db.commit"):
+                self.db.flush()
+                record_order_change(self.db, order, OrderChangeType.CREATED)
+                record_status_change(self.db, None, order.status)
+                record_prep_change(self.db, order.id, None, order.status, quantities)
+                self.db.commit()
+            with span("db.refresh"):
+                self.db.refresh(order)
+                return _to_record(order)
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def get(self, order_id: int) -> OrderRecord | None:
+        return fetch_order(self.db, order_id)
+
+    def get_version(self, order_id: int) -> int | None:
+        return self.db.execute(select(Order.version).where(Order.id == order_id)).scalar_one_or_none()
+
+    def set_status(
+        self,
+        order_id: int,
+        new_status: OrderStatus,
+        expected_version: int | None = None,
+    ) -> OrderRecord:
+        change = CHANGE_FOR_STATUS.get(new_status)
+        if change is None:
+            raise InvalidStatusTransitionError(order_id, new_status)
+        order = self.db.get(Order, order_id)
+        if order is None:
+            raise OrderNotFoundError(order_id)
+        if expected_version is not None and order.version != expected_version:
+            raise OrderVersionConflictError(order_id, expected_version, order.version)
+        loaded_version = order.version
+        old_status = order.status
+        now = datetime.now(timezone.utc)
+        prep_done = new_status == OrderStatus.READY or (
+            new_status == OrderStatus.COMPLETED and order.ready_at is None
+        )
+        order.status = new_status
+        if new_status in TRANSITION_TIMESTAMPS:
+            setattr(order, TRANSITION_TIMESTAMPS[new_status], now)
+        try:
+            record_order_change(self.db, order, change)
+            total_cents = (
+                order_total_cents(self.db, order.id) if new_status == OrderStatus.COMPLETED else 0
+            )
+            record_status_change(self.db, old_status, new_status, total_cents)
+            quantities = order_prep_quantities(self.db, order.id) if prep_done else None
+            record_prep_change(self.db, order.id, old_status, new_status, quantities)
+            if quantities is not None:
+                # One sketch entry per dish on the order
+                record_prep_time(self.db, order.created_at, order.started_at, now, quantities.keys())
+            self.db.commit()
+            self.db.refresh(order)
+            return _to_record(order)
+        except StaleDataError as e:
+            # The versioned UPDATE matched no row: another writer committed first
+            self.db.rollback()
+            raise OrderVersionConflictError(order_id, loaded_version, None) from e
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def list_by_status(self, order_status: OrderStatus, include_items: bool = True) -> list[OrderRecord]:
+        return fetch_orders_by_status(self.db, order_status, include_items=include_items)
+
+    def list_for_table(self, table_number: int, include_items: bool = True) -> list[OrderRecord]:
+        return fetch_table_orders(self.db, table_number, include_items=include_items)
+
+    def open_tabs(self) -> list[TableTabRecord]:
+        return fetch_open_tabs(self.db)
+
+    def iter_export(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        batch_size: int,
+    ) -> Iterator[OrderRecord]:
+        return iter_orders_for_export(self.db, start, end, batch_size)
+
+    def oldest_change_seq(self) -> int | None:
+        return oldest_retained_seq(self.db)
+
+    def list_changes(self, since: int, limit: int) -> Sequence[Row]:
+        return fetch_order_changes(self.db, since, limit)
+
+    def summary(self) -> dict:
+        return read_summary(self.db)
+
+    def prep_list(self) -> list[tuple[str, int]]:
+        return read_prep_list(self.db)
+
+    def prep_time_sketches(self, start: date, end: date) -> dict[tuple[str, str], QuantileSketch]:
+        return read_prep_time_sketches(self.db, start, end)
@@ -0,0 +1,51 @@
+"""Per-request context shared by middleware, logging and database hooks."""
+
+from contextvars import ContextVar
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_SCOPE_KEY = "backend.operation_id"
+
+# operation_id of the request being handled; copied into threadpool workers
+current_operation_id: ContextVar[str | None] = ContextVar("current_operation_id", default=None)
+
+
+def resolve_operation_id(scope: Scope) -> str | None:
+    """
+    Return the operation_id of the route that will handle a request.
+
+    The result is cached on the scope so stacked middleware only walk the
+    route table once per request.
+    """
+    if _SCOPE_KEY in scope:
+        return scope[_SCOPE_KEY]
+
+    operation_id = None
+    app = scope.get("app")
+    if app is not None:
+        for route in app.router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                operation_id = getattr(route, "operation_id", None) or getattr(route, "name", None)
+                break
+    scope[_SCOPE_KEY] = operation_id
+    return operation_id
+
+
+class RequestContextMiddleware:
+    """ASGI middleware that publishes the request's operation_id in a context var."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = current_operation_id.set(resolve_operation_id(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_operation_id.reset(token)
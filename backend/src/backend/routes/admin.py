@@ -0,0 +1,196 @@
+"""Admin and diagnostics endpoints."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+
+from backend.config import settings
+from backend.jobs import job_queue
+from backend.order_cache import order_cache
+from backend.profiling import profile_store
+from backend.query_stats import query_stats
+from backend.rate_limit import rate_limiter
+from backend.schemas.admin import (
+    JobQueueStatsResponse,
+    OrderCacheStatsResponse,
+    ProfileInfoResponse,
+    QueryStatsResponse,
+    RateLimitStatsResponse,
+    SingleFlightStatsResponse,
+    ThreadpoolStatsResponse,
+)
+from backend.security import require_admin
+from backend.single_flight import pending_orders_flight
+from backend.threadpool import threadpool_snapshot, threadpool_stats
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get(
+    "/rate-limits",
+    response_model=RateLimitStatsResponse,
+    operation_id="get_rate_limit_stats",
+    summary="Rate limiter counters",
+    description="""
+    Per-operation token-bucket limits with allowed/rejected counters and the
+    number of client buckets currently held in memory.
+    """,
+    response_description="Rate limiter configuration and counters",
+)
+async def get_rate_limit_stats() -> RateLimitStatsResponse:
+    """Get rate limiter counters."""
+    return RateLimitStatsResponse(enabled=settings.rate_limit_enabled, **rate_limiter.stats())
+
+
+@router.get(
+    "/order-cache",
+    response_model=OrderCacheStatsResponse,
+    operation_id="get_order_cache_stats",
+    summary="Order cache counters",
+    description="""
+    Size, hit/miss counters and evictions of the read-through cache behind
+    `GET /api/v1/orders/{order_id}`.
+    """,
+    response_description="Order cache configuration and counters",
+)
+async def get_order_cache_stats() -> OrderCacheStatsResponse:
+    """Get order cache counters."""
+    return OrderCacheStatsResponse(**order_cache.stats())
+
+
+@router.get(
+    "/jobs",
+    response_model=JobQueueStatsResponse,
+    operation_id="get_job_queue_stats",
+    summary="Post-commit job queue counters",
+    description="""
+    Depth and outcome counters of the in-process queue that runs side effects
+    (order events, notifications) after a write has committed.
+    """,
+    response_description="Job queue configuration and counters",
+)
+async def get_job_queue_stats() -> JobQueueStatsResponse:
+    """Get job queue counters."""
+    return JobQueueStatsResponse(**job_queue.stats())
+
+
+@router.get(
+    "/single-flight",
+    response_model=SingleFlightStatsResponse,
+    operation_id="get_single_flight_stats",
+    summary="Pending-list coalescing counters",
+    description="""
+    How many `GET /api/v1/orders/pending` requests ran the query, waited for
+    an identical one already running, or were answered by a result that had
+    just finished.
+    """,
+    response_description="Coalescing configuration and counters",
+)
+async def get_single_flight_stats() -> SingleFlightStatsResponse:
+    """Get pending-list coalescing counters."""
+    return SingleFlightStatsResponse(
+        enabled=settings.pending_orders_coalescing, **pending_orders_flight.stats()
+    )
+
+
+@router.get(
+    "/threadpool",
+    response_model=ThreadpoolStatsResponse,
+    operation_id="get_threadpool_stats",
+    summary="Threadpool size and saturation",
+    description="""
+    Size of the worker threadpool that runs sync endpoints, threads in use,
+    tasks waiting for a thread now and at peak, and per-operation wait times.
+    A growing wait means `THREADPOOL_SIZE` (or the database behind it) is the
+    bottleneck.
+    """,
+    response_description="Threadpool configuration and counters",
+)
+async def get_threadpool_stats() -> ThreadpoolStatsResponse:
+    """Get threadpool counters."""
+    # Async on purpose: it must answer even when every worker thread is busy
+    return ThreadpoolStatsResponse(**threadpool_snapshot())
+
+
+@router.delete(
+    "/threadpool",
+    status_code=status.HTTP_204_NO_CONTENT,
+    operation_id="reset_threadpool_stats",
+    summary="Reset threadpool wait statistics",
+    description="Clear wait aggregates and the peak queue length, e.g. before a load test.",
+)
+async def reset_threadpool_stats() -> None:
+    """Reset threadpool wait statistics."""
+    threadpool_stats.reset()
+
+
+@router.get(
+    "/profiles",
+    response_model=list[ProfileInfoResponse],
+    operation_id="list_profiles",
+    summary="List recent request profiles",
+    description="""
+    List cProfile dumps written by the profiling middleware, newest first.
+
+    Profiles are captured for a sample of requests when `PROFILING_ENABLED` is
+    set, or on demand for a request sent with `X-Profile: 1` and a valid
+    `X-Admin-Token`.
+    """,
+    response_description="Recent profiles (may be empty)",
+)
+def list_profiles(
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> list[ProfileInfoResponse]:
+    """List recent request profiles."""
+    return [ProfileInfoResponse.model_validate(info) for info in profile_store.list(limit)]
+
+
+@router.get(
+    "/profiles/{name}",
+    operation_id="download_profile",
+    summary="Download a request profile",
+    description="Download a `.prof` file for `pstats`, snakeviz or similar tools.",
+    response_description="The profile file",
+    response_class=FileResponse,
+)
+def download_profile(name: str) -> FileResponse:
+    """Download a stored profile."""
+    path = profile_store.path_for(name)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile {name} not found",
+        )
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
+
+
+@router.get(
+    "/queries",
+    response_model=list[QueryStatsResponse],
+    operation_id="list_query_stats",
+    summary="SQL statement timings by fingerprint",
+    description="""
+    Per-fingerprint statement timings (count, total, mean, max, p95), most
+    expensive first. Statements slower than `SLOW_QUERY_THRESHOLD_MS` are also
+    logged individually by the `backend.slow_query` logger.
+    """,
+    response_description="Statement aggregates sorted by total time",
+)
+async def list_query_stats(
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> list[QueryStatsResponse]:
+    """List SQL statement timing aggregates."""
+    return [QueryStatsResponse(**entry) for entry in query_stats.snapshot()[:limit]]
+
+
+@router.delete(
+    "/queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    operation_id="reset_query_stats",
+    summary="Reset SQL statement timings",
+    description="Clear all fingerprint aggregates, e.g. before a load test.",
+)
+async def reset_query_stats() -> None:
+    """Reset SQL statement timing aggregates."""
+    query_stats.reset()
@@ -1,11 +1,14 @@
 """Health check endpoints."""
 
+from dataclasses import asdict
 from datetime import datetime, timezone
+from typing import Annotated
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response, status
 from pydantic import BaseModel, ConfigDict, Field
 
 from backend.config import settings
+from backend.readiness import ReadinessProbe, get_readiness_probe
 
 router = APIRouter()
 
@@ -32,6 +35,59 @@ class HealthResponse(BaseModel):
     )
 
 
+class DatabaseCheck(BaseModel):
+    """Result of the readiness database round trip."""
+
+    ok: bool = Field(..., description="Whether the check query succeeded")
+    latency_ms: float | None = Field(None, description="Round-trip time of the check query")
+    error: str | None = Field(None, description="Error class if the check failed")
+    skipped: bool = Field(False, description="True when orders are not stored in the database")
+
+
+class PoolStats(BaseModel):
+    """Connection pool usage (None for pools without fixed limits)."""
+
+    size: int | None = Field(None, description="Configured pool size")
+    checked_out: int | None = Field(None, description="Connections currently in use")
+    overflow: int | None = Field(None, description="Connections opened beyond the pool size")
+    limit: int | None = Field(None, description="Maximum connections (size + max overflow)")
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness probe response model."""
+
+    status: str = Field(..., description="`ready` or `not_ready`", examples=["ready"])
+    reasons: list[str] = Field(..., description="Why the instance is not ready (empty when ready)")
+    checked_at: datetime = Field(..., description="When the checks ran")
+    cached: bool = Field(..., description="True if served from the probe cache")
+    database: DatabaseCheck
+    pool: PoolStats
+    writer_queue_depth: int = Field(
+        ...,
+        description="Connections with an open write transaction; SQLite runs one, the rest wait",
+    )
+    wal_bytes: int | None = Field(None, description="Size of the SQLite WAL file")
+    disk_free_bytes: int | None = Field(None, description="Free space on the database volume")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "status": "ready",
+                    "reasons": [],
+                    "checked_at": "2026-01-31T19:45:00.000000Z",
+                    "cached": False,
+                    "database": {"ok": True, "latency_ms": 0.412, "error": None, "skipped": False},
+                    "pool": {"size": 5, "checked_out": 1, "overflow": 0, "limit": 15},
+                    "writer_queue_depth": 0,
+                    "wal_bytes": 0,
+                    "disk_free_bytes": 10737418240,
+                }
+            ]
+        }
+    )
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -58,6 +114,61 @@ async def health_check() -> HealthResponse:
     )
 
 
+@router.get(
+    "/health/live",
+    response_model=HealthResponse,
+    summary="Liveness probe",
+    description="""
+    Report that the process is up and serving requests.
+
+    Performs no I/O, so it only fails when the event loop is stuck or the
+    process is gone. Use it to decide whether to restart the container.
+    """,
+    response_description="Liveness status and application metadata",
+)
+async def liveness() -> HealthResponse:
+    """Check that the process is alive."""
+    return HealthResponse(
+        status="alive",
+        app_name=settings.app_name,
+        version=settings.app_version,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    summary="Readiness probe",
+    description="""
+    Report whether this instance should receive traffic.
+
+    Runs a cheap query that reads the database file and reports its latency,
+    connection pool usage, SQLite WAL size, free disk space and the number of
+    connections waiting to write. Results are cached for
+    `HEALTH_CACHE_TTL_SECONDS`.
+
+    Returns `503` when the database check fails or is slower than
+    `HEALTH_MAX_DB_LATENCY_MS`, the pool is exhausted, more than
+    `HEALTH_MAX_WRITER_QUEUE` writers are queued, or free disk space is below
+    `HEALTH_MIN_FREE_DISK_MB`.
+    """,
+    response_description="Readiness status with database, pool and WAL figures",
+    responses={503: {"description": "Not ready; `reasons` lists the failed checks"}},
+)
+def readiness(
+    response: Response,
+    probe: Annotated[ReadinessProbe, Depends(get_readiness_probe)],
+) -> ReadinessResponse:
+    """Check that the instance can serve traffic."""
+    report, cached = probe.check()
+    if not report.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    details = asdict(report)
+    ready = details.pop("ready")
+    return ReadinessResponse(status="ready" if ready else "not_ready", cached=cached, **details)
+
+
 @router.get(
     "/",
     summary="Root endpoint",
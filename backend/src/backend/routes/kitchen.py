@@ -0,0 +1,41 @@
+"""Kitchen API endpoints."""
+
+import logging
+
+from fastapi import APIRouter, HTTPException, status
+
+from backend.openapi.kitchen import GET_PREP_LIST, KITCHEN_TAG, response_200_prep_list
+from backend.repositories import OrderRepositoryDep
+from backend.schemas.kitchen import PrepListResponse
+from backend.tracing import TracedRoute
+
+router = APIRouter(tags=[KITCHEN_TAG], route_class=TracedRoute)
+logger = logging.getLogger(__name__)
+
+
+@router.get(
+    "/kitchen/prep-list",
+    response_model=PrepListResponse,
+    operation_id="get_prep_list",
+    summary=GET_PREP_LIST["summary"],
+    description=GET_PREP_LIST["description"],
+    response_description=GET_PREP_LIST["response_description"],
+    responses=response_200_prep_list(),
+)
+def get_prep_list(
+    repository: OrderRepositoryDep,
+) -> PrepListResponse:
+    """Get the quantity of each dish owed by active orders."""
+    try:
+        rows = repository.prep_list()
+
+        logger.info("Retrieved prep list", extra={"dishes": len(rows)})
+
+        return PrepListResponse.from_rows(rows)
+
+    except Exception as e:
+        logger.error("Failed to retrieve prep list", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve prep list",
+        ) from e
@@ -1,45 +1,83 @@
 """Orders API endpoints."""
 
 import logging
+from datetime import datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from backend.database import get_db
-from backend.models.order import Order, OrderItem, OrderStatus
+from backend.config import settings
+from backend.export import MEDIA_TYPES, ExportFormat, encode_export
+from backend.jobs import job_queue
+from backend.models.order import OrderStatus
 from backend.openapi.orders import (
     CANCEL_ORDER,
     COMPLETE_ORDER,
     CREATE_ORDER,
+    EXPORT_ORDERS,
+    GET_ORDER,
+    GET_ORDER_SUMMARY,
+    LIST_ORDER_CHANGES,
     LIST_PENDING_ORDERS,
     ORDERS_TAG,
+    response_200_order,
     response_200_order_cancelled,
+    response_200_order_changes,
     response_200_order_completed,
+    response_200_order_export,
+    response_200_order_summary,
     response_200_pending_list,
     response_201_order,
 )
-from backend.schemas.order import OrderCreate, OrderResponse
+from backend.order_cache import order_cache
+from backend.queries import OrderRecord
+from backend.repositories import (
+    OrderRepository,
+    OrderRepositoryDep,
+    OrderVersionConflictError,
+)
+from backend.schemas.order import (
+    OrderChangesResponse,
+    OrderCreate,
+    OrderResponse,
+    OrderSummaryResponse,
+)
+from backend.single_flight import pending_orders_flight
+from backend.tracing import TracedRoute
 
-router = APIRouter(tags=[ORDERS_TAG])
+router = APIRouter(tags=[ORDERS_TAG], route_class=TracedRoute)
 logger = logging.getLogger(__name__)
 
+_order_list = TypeAdapter(list[OrderResponse])
+
+
+def publish_order_event(event: str, fields: dict) -> None:
+    """
+    Post-commit side effects of an order change, run by the job queue.
+
+    Only a structured log for now; notifications, kitchen printing and
+    analytics belong here so they never delay the response.
+    """
+    logger.info(event, extra=fields)
+
 
-def get_order_or_404(db: Session, order_id: int) -> Order:
+def get_order_or_404(repository: OrderRepository, order_id: int) -> OrderRecord:
     """
     Get an order by ID or raise 404.
 
     Args:
-        db: Database session
+        repository: Order repository
         order_id: Order ID
 
     Returns:
-        Order instance
+        Order record with items
 
     Raises:
         HTTPException: If order not found
     """
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = repository.get(order_id)
     if not order:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -48,6 +86,61 @@ def get_order_or_404(db: Session, order_id: int) -> Order:
     return order
 
 
+def expected_version_from(if_match: str | None, expected_version: int | None) -> int | None:
+    """
+    Resolve the version a mutation is conditioned on.
+
+    ``If-Match`` takes an ETag as returned by the API (``"3"``; weak tags and
+    bare numbers are accepted, ``*`` matches any version). When both the
+    header and ``expected_version`` are sent they must agree.
+
+    Raises:
+        HTTPException: 400 if the header is malformed or disagrees with the query
+    """
+    header_version = None
+    if if_match is not None and if_match.strip() != "*":
+        tag = if_match.strip().removeprefix("W/").strip('"')
+        if not tag.isdigit():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='If-Match must be an order version, e.g. "3"',
+            )
+        header_version = int(tag)
+    if header_version is not None and expected_version is not None and header_version != expected_version:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="If-Match and expected_version disagree",
+        )
+    return header_version if header_version is not None else expected_version
+
+
+def version_conflict(order_id: int, expected: int, current: int | None) -> HTTPException:
+    """Build the 409 returned when an order changed under the caller."""
+    detail = f"Order with id {order_id} was modified concurrently (expected version {expected}"
+    detail += f", current version {current})" if current is not None else ")"
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+def cache_key(request: Request, order_id: int) -> tuple[str | None, int]:
+    """Key of an order in ``order_cache`` (order ids are only unique per tenant)."""
+    return getattr(request.state, "tenant", None), order_id
+
+
+def set_etag(response: Response, order: OrderRecord | OrderResponse) -> None:
+    """Expose the order's version as a strong ETag for later If-Match requests."""
+    response.headers["ETag"] = f'"{order.version}"'
+
+
+IfMatchHeader = Annotated[
+    str | None,
+    Header(description='Version the change is based on, as returned in ETag (e.g. "3")'),
+]
+ExpectedVersionQuery = Annotated[
+    int | None,
+    Query(ge=1, description="Alternative to If-Match for clients that cannot set headers"),
+]
+
+
 @router.post(
     "/orders",
     response_model=OrderResponse,
@@ -60,44 +153,31 @@ def get_order_or_404(db: Session, order_id: int) -> Order:
 )
 def create_order(
     order_data: OrderCreate,
-    db: Annotated[Session, Depends(get_db)],
-) -> Order:
+    repository: OrderRepositoryDep,
+    response: Response,
+) -> OrderResponse:
     """Create a new restaurant order."""
     try:
-        # Create order
-        order = Order(
-            table_number=order_data.table_number,
-            status=OrderStatus.PENDING,
-        )
-
-        # Create order items
-        for item_data in order_data.items:
-            order_item = OrderItem(
-                name=item_data.name,
-                amount=item_data.amount,
-                price=item_data.price,
-                order=order,
-            )
-            db.add(order_item)
+        order = repository.create(order_data.table_number, order_data.items)
 
-        db.add(order)
-        db.commit()
-        db.refresh(order)
-
-        logger.info(
+        job_queue.submit(
+            "order_created",
+            publish_order_event,
             "Order created",
-            extra={
+            {
                 "order_id": order.id,
                 "table_number": order.table_number,
                 "items_count": len(order.items),
-                "total": order.total,
+                "submitted_lines": order_data.submitted_lines,
+                "total_cents": order.total_cents,
             },
         )
 
-        return order
+        pending_orders_flight.invalidate()
+        set_etag(response, order)
+        return OrderResponse.from_order(order)
 
     except Exception as e:
-        db.rollback()
         logger.error("Failed to create order", exc_info=e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -115,24 +195,39 @@ def create_order(
     responses=response_200_pending_list(),
 )
 def get_pending_orders(
-    db: Annotated[Session, Depends(get_db)],
-) -> list[Order]:
+    request: Request,
+    repository: OrderRepositoryDep,
+    include_items: Annotated[
+        bool,
+        Query(description="Set to false to return totals only, without loading items"),
+    ] = True,
+) -> Response:
     """Get all pending orders sorted by creation time."""
-    try:
-        orders = (
-            db.query(Order)
-            .options(selectinload(Order.items))
-            .filter(Order.status == OrderStatus.PENDING)
-            .order_by(Order.created_at.asc())
-            .all()
-        )
+
+    def load() -> bytes:
+        orders = repository.list_by_status(OrderStatus.PENDING, include_items=include_items)
 
         logger.info(
             "Retrieved pending orders",
-            extra={"count": len(orders)},
+            extra={"count": len(orders), "include_items": include_items},
         )
 
-        return orders
+        return _order_list.dump_json(
+            [
+                OrderResponse.from_order(order, total_cents=order.total_cents, include_items=include_items)
+                for order in orders
+            ]
+        )
+
+    try:
+        if settings.pending_orders_coalescing:
+            key = (getattr(request.state, "tenant", None), include_items)
+            body, outcome = pending_orders_flight.do(key, load)
+        else:
+            body, outcome = load(), "leader"
+
+        # Already serialized (and possibly shared), so bypass response_model
+        return Response(body, media_type="application/json", headers={"X-Single-Flight": outcome})
 
     except Exception as e:
         logger.error("Failed to retrieve pending orders", exc_info=e)
@@ -142,6 +237,204 @@ def get_pending_orders(
         ) from e
 
 
+@router.get(
+    "/orders/changes",
+    response_model=OrderChangesResponse,
+    operation_id="list_order_changes",
+    summary=LIST_ORDER_CHANGES["summary"],
+    description=LIST_ORDER_CHANGES["description"],
+    response_description=LIST_ORDER_CHANGES["response_description"],
+    responses=response_200_order_changes(),
+)
+def get_order_changes(
+    repository: OrderRepositoryDep,
+    since: Annotated[int, Query(ge=0, description="Cursor from the previous call")] = 0,
+    limit: Annotated[
+        int | None,
+        Query(ge=1, description="Maximum number of changes to return"),
+    ] = None,
+) -> OrderChangesResponse:
+    """Get order changes recorded after the given cursor."""
+    limit = min(limit or settings.change_feed_default_limit, settings.change_feed_max_limit)
+    try:
+        oldest = repository.oldest_change_seq()
+        if since > 0 and oldest is not None and since < oldest - 1:
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail=(
+                    f"Cursor {since} is older than the retained change log; "
+                    "re-sync from /orders/pending"
+                ),
+            )
+
+        # Fetch one extra row to know whether another page exists
+        changes = repository.list_changes(since, limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        cursor = changes[-1].seq if changes else since
+
+        logger.info(
+            "Retrieved order changes",
+            extra={"since": since, "count": len(changes), "cursor": cursor},
+        )
+
+        return OrderChangesResponse.model_validate(
+            {"changes": changes, "cursor": cursor, "has_more": has_more},
+            from_attributes=True,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to retrieve order changes", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve order changes",
+        ) from e
+
+
+def _as_naive_utc(value: datetime | None) -> datetime | None:
+    """Normalize a query timestamp to the naive UTC form stored by SQLite."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@router.get(
+    "/orders/export",
+    response_class=StreamingResponse,
+    operation_id="export_orders",
+    summary=EXPORT_ORDERS["summary"],
+    description=EXPORT_ORDERS["description"],
+    response_description=EXPORT_ORDERS["response_description"],
+    responses=response_200_order_export(),
+)
+def export_orders(
+    repository: OrderRepositoryDep,
+    export_format: Annotated[
+        ExportFormat,
+        Query(alias="format", description="Output encoding"),
+    ] = ExportFormat.NDJSON,
+    start: Annotated[
+        datetime | None,
+        Query(alias="from", description="Only orders created at or after this time"),
+    ] = None,
+    end: Annotated[
+        datetime | None,
+        Query(alias="to", description="Only orders created before this time"),
+    ] = None,
+) -> StreamingResponse:
+    """Stream orders and their items as NDJSON or CSV."""
+    start, end = _as_naive_utc(start), _as_naive_utc(end)
+    if start is not None and end is not None and start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="`from` must be earlier than `to`",
+        )
+
+    def body():
+        # The session behind the repository stays open until the response is
+        # sent (request-scoped dependency)
+        exported = 0
+        try:
+            for chunk in encode_export(
+                repository.iter_export(start, end, settings.export_batch_size),
+                export_format,
+                settings.export_chunk_bytes,
+            ):
+                exported += len(chunk)
+                yield chunk
+        except Exception as e:
+            # Headers are already sent; the client sees a truncated body
+            logger.error("Failed to stream order export", exc_info=e)
+            raise
+        logger.info(
+            "Exported orders",
+            extra={"format": export_format.value, "bytes": exported},
+        )
+
+    filename = f"orders.{export_format.value}"
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/orders/summary",
+    response_model=OrderSummaryResponse,
+    operation_id="get_order_summary",
+    summary=GET_ORDER_SUMMARY["summary"],
+    description=GET_ORDER_SUMMARY["description"],
+    response_description=GET_ORDER_SUMMARY["response_description"],
+    responses=response_200_order_summary(),
+)
+def get_order_summary(
+    repository: OrderRepositoryDep,
+) -> OrderSummaryResponse:
+    """Get order counts per status, oldest active order, and today's revenue."""
+    try:
+        return OrderSummaryResponse.from_summary(repository.summary())
+
+    except Exception as e:
+        logger.error("Failed to retrieve order summary", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve order summary",
+        ) from e
+
+
+@router.get(
+    "/orders/{order_id}",
+    response_model=OrderResponse,
+    operation_id="get_order",
+    summary=GET_ORDER["summary"],
+    description=GET_ORDER["description"],
+    response_description=GET_ORDER["response_description"],
+    responses=response_200_order(),
+)
+def get_order(
+    order_id: int,
+    request: Request,
+    response: Response,
+    repository: OrderRepositoryDep,
+) -> OrderResponse:
+    """Get one order by ID, through the order cache (validated against its current version)."""
+    try:
+        key = cache_key(request, order_id)
+        cached = None
+        if order_cache.enabled:
+            current_version = repository.get_version(order_id)
+            if current_version is None:
+                order_cache.invalidate(key)
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Order with id {order_id} not found",
+                )
+            cached = order_cache.get(key, current_version)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            set_etag(response, cached)
+            return cached
+
+        order = OrderResponse.from_order(get_order_or_404(repository, order_id))
+        order_cache.put(key, order)
+
+        response.headers["X-Cache"] = "MISS"
+        set_etag(response, order)
+        return order
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to retrieve order", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve order",
+        ) from e
+
+
 @router.delete(
     "/orders/{order_id}",
     response_model=OrderResponse,
@@ -153,12 +446,20 @@ def get_pending_orders(
 )
 def cancel_order(
     order_id: int,
-    db: Annotated[Session, Depends(get_db)],
-) -> Order:
+    repository: OrderRepositoryDep,
+    request: Request,
+    response: Response,
+    if_match: IfMatchHeader = None,
+    expected_version: ExpectedVersionQuery = None,
+) -> OrderResponse:
     """Cancel an order by marking it as cancelled."""
     try:
+        expected = expected_version_from(if_match, expected_version)
+
         # Get the order
-        order = get_order_or_404(db, order_id)
+        order = get_order_or_404(repository, order_id)
+        if expected is not None and order.version != expected:
+            raise version_conflict(order_id, expected, order.version)
 
         # Check if order can be cancelled
         if order.status == OrderStatus.CANCELLED:
@@ -173,28 +474,40 @@ def cancel_order(
                 detail="Completed orders cannot be cancelled",
             )
 
-        # Cancel the order
+        # Cancel the order, unless someone changed it since we checked
         old_status = order.status
-        order.status = OrderStatus.CANCELLED
-        db.commit()
-        db.refresh(order)
+        order = repository.set_status(
+            order_id, OrderStatus.CANCELLED, expected_version=order.version
+        )
 
-        logger.info(
+        job_queue.submit(
+            "order_cancelled",
+            publish_order_event,
             "Order cancelled",
-            extra={
+            {
                 "order_id": order.id,
                 "table_number": order.table_number,
                 "old_status": old_status.value,
                 "new_status": order.status.value,
+                "version": order.version,
             },
         )
 
-        return order
+        # Write the new version through so cached reads never go back in time
+        body = OrderResponse.from_order(order)
+        order_cache.put(cache_key(request, order_id), body)
+        pending_orders_flight.invalidate()
+        set_etag(response, order)
+        return body
 
     except HTTPException:
         raise
+    except OrderVersionConflictError as e:
+        logger.info("Order cancel conflicted", extra={"order_id": order_id})
+        order_cache.invalidate(cache_key(request, order_id))
+        raise version_conflict(order_id, e.expected, e.current) from e
     except Exception as e:
-        db.rollback()
+        order_cache.invalidate(cache_key(request, order_id))
         logger.error("Failed to cancel order", exc_info=e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -213,12 +526,20 @@ def cancel_order(
 )
 def complete_order(
     order_id: int,
-    db: Annotated[Session, Depends(get_db)],
-) -> Order:
+    repository: OrderRepositoryDep,
+    request: Request,
+    response: Response,
+    if_match: IfMatchHeader = None,
+    expected_version: ExpectedVersionQuery = None,
+) -> OrderResponse:
     """Mark an order as completed."""
     try:
+        expected = expected_version_from(if_match, expected_version)
+
         # Get the order
-        order = get_order_or_404(db, order_id)
+        order = get_order_or_404(repository, order_id)
+        if expected is not None and order.version != expected:
+            raise version_conflict(order_id, expected, order.version)
 
         # Check if order can be completed
         if order.status == OrderStatus.CANCELLED:
@@ -236,30 +557,45 @@ def complete_order(
                     "table_number": order.table_number,
                 },
             )
-            return order
+            body = OrderResponse.from_order(order)
+            order_cache.put(cache_key(request, order_id), body)
+            set_etag(response, order)
+            return body
 
-        # Complete the order
+        # Complete the order, unless someone changed it since we checked
         old_status = order.status
-        order.status = OrderStatus.COMPLETED
-        db.commit()
-        db.refresh(order)
+        order = repository.set_status(
+            order_id, OrderStatus.COMPLETED, expected_version=order.version
+        )
 
-        logger.info(
+        job_queue.submit(
+            "order_completed",
+            publish_order_event,
             "Order completed",
-            extra={
+            {
                 "order_id": order.id,
                 "table_number": order.table_number,
                 "old_status": old_status.value,
                 "new_status": order.status.value,
+                "version": order.version,
             },
         )
 
-        return order
+        # Write the new version through so cached reads never go back in time
+        body = OrderResponse.from_order(order)
+        order_cache.put(cache_key(request, order_id), body)
+        pending_orders_flight.invalidate()
+        set_etag(response, order)
+        return body
 
     except HTTPException:
         raise
+    except OrderVersionConflictError as e:
+        logger.info("Order complete conflicted", extra={"order_id": order_id})
+        order_cache.invalidate(cache_key(request, order_id))
+        raise version_conflict(order_id, e.expected, e.current) from e
     except Exception as e:
-        db.rollback()
+        order_cache.invalidate(cache_key(request, order_id))
         logger.error("Failed to complete order", exc_info=e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,64 @@
+"""Reports API endpoints."""
+
+import logging
+from datetime import date, timedelta
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from backend.config import settings
+from backend.counters import business_day
+from backend.openapi.reports import GET_PREP_TIMES, REPORTS_TAG, response_200_prep_times
+from backend.repositories import OrderRepositoryDep
+from backend.schemas.report import PrepTimesResponse
+from backend.tracing import TracedRoute
+
+router = APIRouter(tags=[REPORTS_TAG], route_class=TracedRoute)
+logger = logging.getLogger(__name__)
+
+
+@router.get(
+    "/reports/prep-times",
+    response_model=PrepTimesResponse,
+    operation_id="get_prep_times",
+    summary=GET_PREP_TIMES["summary"],
+    description=GET_PREP_TIMES["description"],
+    response_description=GET_PREP_TIMES["response_description"],
+    responses=response_200_prep_times(),
+)
+def get_prep_times(
+    repository: OrderRepositoryDep,
+    start: Annotated[
+        date | None,
+        Query(alias="from", description="First business day to include"),
+    ] = None,
+    end: Annotated[
+        date | None,
+        Query(alias="to", description="Last business day to include (default: today)"),
+    ] = None,
+) -> PrepTimesResponse:
+    """Get prep-time percentiles overall, per hour and per dish."""
+    end = end or business_day()
+    start = start or end - timedelta(days=settings.prep_time_report_default_days - 1)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="`from` must not be later than `to`",
+        )
+
+    try:
+        sketches = repository.prep_time_sketches(start, end)
+
+        logger.info(
+            "Built prep-time report",
+            extra={"from": start.isoformat(), "to": end.isoformat(), "sketches": len(sketches)},
+        )
+
+        return PrepTimesResponse.from_sketches(start, end, sketches)
+
+    except Exception as e:
+        logger.error("Failed to build prep-time report", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to build prep-time report",
+        ) from e
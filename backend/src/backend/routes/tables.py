@@ -0,0 +1,84 @@
+"""Tables API endpoints (open tabs per table)."""
+
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Path, Query, status
+
+from backend.openapi.tables import (
+    LIST_OPEN_TABS,
+    LIST_TABLE_ORDERS,
+    TABLES_TAG,
+    response_200_open_tabs,
+    response_200_table_orders,
+)
+from backend.repositories import OrderRepositoryDep
+from backend.schemas.table import TableOrdersResponse, TableTabResponse
+from backend.tracing import TracedRoute
+
+router = APIRouter(tags=[TABLES_TAG], route_class=TracedRoute)
+logger = logging.getLogger(__name__)
+
+
+@router.get(
+    "/tables",
+    response_model=list[TableTabResponse],
+    operation_id="list_open_tabs",
+    summary=LIST_OPEN_TABS["summary"],
+    description=LIST_OPEN_TABS["description"],
+    response_description=LIST_OPEN_TABS["response_description"],
+    responses=response_200_open_tabs(),
+)
+def get_open_tabs(
+    repository: OrderRepositoryDep,
+) -> list[TableTabResponse]:
+    """Get every table with open orders and its running total."""
+    try:
+        tabs = repository.open_tabs()
+
+        logger.info("Retrieved open tabs", extra={"count": len(tabs)})
+
+        return [TableTabResponse.from_record(tab) for tab in tabs]
+
+    except Exception as e:
+        logger.error("Failed to retrieve open tabs", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve open tabs",
+        ) from e
+
+
+@router.get(
+    "/tables/{table_number}/orders",
+    response_model=TableOrdersResponse,
+    operation_id="list_table_orders",
+    summary=LIST_TABLE_ORDERS["summary"],
+    description=LIST_TABLE_ORDERS["description"],
+    response_description=LIST_TABLE_ORDERS["response_description"],
+    responses=response_200_table_orders(),
+)
+def get_table_orders(
+    table_number: Annotated[int, Path(gt=0, description="Table number")],
+    repository: OrderRepositoryDep,
+    include_items: Annotated[
+        bool,
+        Query(description="Set to false to return totals only, without loading items"),
+    ] = True,
+) -> TableOrdersResponse:
+    """Get the open orders of a table and their running total."""
+    try:
+        orders = repository.list_for_table(table_number, include_items=include_items)
+
+        logger.info(
+            "Retrieved table orders",
+            extra={"table_number": table_number, "count": len(orders)},
+        )
+
+        return TableOrdersResponse.from_records(table_number, orders, include_items=include_items)
+
+    except Exception as e:
+        logger.error("Failed to retrieve table orders", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve table orders",
+        ) from e
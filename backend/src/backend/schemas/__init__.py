@@ -1,15 +1,29 @@
 """Pydantic schemas package."""
 
+from backend.schemas.kitchen import PrepListEntry, PrepListResponse
 from backend.schemas.order import (
+    OrderChangeResponse,
+    OrderChangesResponse,
     OrderCreate,
+    OrderImport,
     OrderItemCreate,
     OrderItemResponse,
     OrderResponse,
+    OrderSummaryResponse,
 )
+from backend.schemas.table import TableOrdersResponse, TableTabResponse
 
 __all__ = [
     "OrderCreate",
+    "OrderImport",
     "OrderItemCreate",
     "OrderResponse",
     "OrderItemResponse",
+    "OrderChangeResponse",
+    "OrderChangesResponse",
+    "OrderSummaryResponse",
+    "PrepListEntry",
+    "PrepListResponse",
+    "TableOrdersResponse",
+    "TableTabResponse",
 ]
@@ -0,0 +1,111 @@
+"""Pydantic schemas for admin and diagnostics endpoints."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class OperationRateLimitStats(BaseModel):
+    """Rate limit configuration and counters for one operation."""
+
+    rate: float = Field(..., description="Bucket refill rate in requests per second")
+    burst: int = Field(..., description="Bucket capacity")
+    allowed: int = Field(..., description="Requests allowed since startup")
+    rejected: int = Field(..., description="Requests rejected with 429 since startup")
+
+
+class RateLimitStatsResponse(BaseModel):
+    """Rate limiter state as returned by the admin endpoint."""
+
+    enabled: bool = Field(..., description="Whether rate limiting is active")
+    active_buckets: int = Field(..., description="Buckets currently held in memory")
+    evicted_buckets: int = Field(..., description="Buckets evicted as idle or over capacity")
+    operations: dict[str, OperationRateLimitStats] = Field(
+        ...,
+        description="Per-operation limits and counters keyed by operation_id",
+    )
+
+
+class OrderCacheStatsResponse(BaseModel):
+    """Single-order cache counters as returned by the admin endpoint."""
+
+    enabled: bool = Field(..., description="False when ORDER_CACHE_MAX_ENTRIES is 0")
+    entries: int = Field(..., description="Orders currently cached")
+    max_entries: int = Field(..., description="LRU capacity")
+    ttl_seconds: float = Field(..., description="Lifetime of an entry")
+    hits: int = Field(..., description="Lookups served from the cache since startup")
+    misses: int = Field(..., description="Lookups that went to the repository since startup")
+    hit_ratio: float | None = Field(..., description="hits / (hits + misses), null before the first lookup")
+    evictions: int = Field(..., description="Entries dropped to stay within max_entries")
+    invalidations: int = Field(..., description="Entries dropped after a failed or conflicting write")
+
+
+class SingleFlightStatsResponse(BaseModel):
+    """Pending-list coalescing counters as returned by the admin endpoint."""
+
+    enabled: bool = Field(..., description="Whether PENDING_ORDERS_COALESCING is on")
+    ttl_seconds: float = Field(..., description="How long a finished result keeps answering requests")
+    in_flight: int = Field(..., description="Computations currently running")
+    executions: int = Field(..., description="Requests that ran the query since startup")
+    joined: int = Field(..., description="Requests that waited for a running query since startup")
+    cached: int = Field(..., description="Requests served from a just-finished result since startup")
+
+
+class JobQueueStatsResponse(BaseModel):
+    """Post-commit job queue counters as returned by the admin endpoint."""
+
+    running: bool = Field(..., description="False before startup and while draining at shutdown (jobs run inline)")
+    workers: int = Field(..., description="Worker tasks")
+    max_size: int = Field(..., description="Jobs held before new ones are dropped")
+    pending: int = Field(..., description="Jobs queued, running or waiting to retry")
+    submitted: int = Field(..., description="Jobs queued since startup")
+    succeeded: int = Field(..., description="Jobs that completed since startup")
+    failed: int = Field(..., description="Jobs that failed every attempt since startup")
+    retried: int = Field(..., description="Retries scheduled since startup")
+    dropped: int = Field(..., description="Jobs rejected because the queue was full")
+
+
+class ThreadpoolWaitStats(BaseModel):
+    """Time spent waiting for a worker thread by one operation."""
+
+    operation_id: str = Field(..., description="Operation that waited (unknown outside requests)")
+    count: int = Field(..., description="Thread hand-offs since startup (or last reset)")
+    total_ms: float = Field(..., description="Total time spent waiting for a thread")
+    mean_ms: float = Field(..., description="Mean wait")
+    max_ms: float = Field(..., description="Longest wait")
+    p95_ms: float = Field(..., description="95th percentile over the most recent hand-offs")
+
+
+class ThreadpoolStatsResponse(BaseModel):
+    """Threadpool size and saturation as returned by the admin endpoint."""
+
+    metered: bool = Field(..., description="Whether waits are being timed (false before startup)")
+    total_tokens: int = Field(..., description="Worker threads allowed (THREADPOOL_SIZE)")
+    borrowed_tokens: int = Field(..., description="Worker threads in use right now")
+    waiting: int = Field(..., description="Tasks waiting for a thread right now")
+    peak_waiting: int = Field(..., description="Most tasks waiting at once since startup (or last reset)")
+    waits: list[ThreadpoolWaitStats] = Field(..., description="Wait aggregates, longest total first")
+
+
+class ProfileInfoResponse(BaseModel):
+    """A stored request profile."""
+
+    name: str = Field(..., description="File name, used to download the profile")
+    operation_id: str = Field(..., description="Operation that was profiled")
+    duration_ms: int = Field(..., description="Wall-clock duration of the request")
+    created_at: datetime = Field(..., description="When the profile was written")
+    size_bytes: int = Field(..., description="Size of the profile file")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class QueryStatsResponse(BaseModel):
+    """Timing aggregate for one SQL statement fingerprint."""
+
+    fingerprint: str = Field(..., description="Normalized SQL statement")
+    fingerprint_id: str = Field(..., description="Short hash of the fingerprint, as used in slow-query logs")
+    count: int = Field(..., description="Executions since startup (or last reset)")
+    total_ms: float = Field(..., description="Total execution time")
+    mean_ms: float = Field(..., description="Mean execution time")
+    max_ms: float = Field(..., description="Slowest execution")
+    p95_ms: float = Field(..., description="95th percentile over the most recent executions")
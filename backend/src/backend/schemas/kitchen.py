@@ -0,0 +1,36 @@
+"""Pydantic schemas for kitchen endpoints."""
+
+from collections.abc import Sequence
+
+from pydantic import BaseModel, Field
+
+
+class PrepListEntry(BaseModel):
+    """Schema for one dish on the prep list."""
+    
+    name: str = Field(..., description="Dish name, as entered on the orders")
+    quantity: int = Field(..., gt=0, description="Units still owed by active orders")
+
+
+class PrepListResponse(BaseModel):
+    """
+    Schema for the kitchen prep list.
+    
+    Quantities are summed per dish across all active orders (pending,
+    in_progress, ready), so the payload grows with the menu rather than with
+    the number of tickets.
+    """
+    
+    items: list[PrepListEntry] = Field(
+        ...,
+        description="Dishes to prepare, largest quantity first"
+    )
+    total_quantity: int = Field(..., description="Sum of all quantities")
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple[str, int]]) -> "PrepListResponse":
+        """Build the response from ``(name, quantity)`` pairs."""
+        return cls(
+            items=[PrepListEntry(name=name, quantity=quantity) for name, quantity in rows],
+            total_quantity=sum(quantity for _, quantity in rows),
+        )
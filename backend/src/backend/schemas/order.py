@@ -1,8 +1,27 @@
 """Pydantic schemas for order endpoints."""
 
-from datetime import datetime
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+from backend.config import settings
+
+if TYPE_CHECKING:
+    from backend.models.order import Order, OrderItem
+    from backend.queries import OrderItemRecord, OrderRecord
+
+
+def cents_to_decimal(cents: int) -> float:
+    """Convert integer cents to the decimal amount exposed by the API."""
+    return cents / 100
 
 
 class OrderItemCreate(BaseModel):
@@ -53,10 +72,15 @@ class OrderItemCreate(BaseModel):
     @classmethod
     def validate_price(cls, v: float) -> float:
         """Validate price has at most 2 decimal places."""
-        if round(v, 2) != v:
+        if abs(v * 100 - round(v * 100)) > 1e-6:
             raise ValueError("Price must have at most 2 decimal places")
         return v
 
+    @property
+    def price_cents(self) -> int:
+        """Price per unit in integer cents, as stored."""
+        return round(self.price * 100)
+
 
 class OrderItemResponse(BaseModel):
     """
@@ -71,7 +95,6 @@ class OrderItemResponse(BaseModel):
     price: float = Field(..., description="Price per unit in USD")
     
     model_config = ConfigDict(
-        from_attributes=True,
         json_schema_extra={
             "examples": [
                 {
@@ -83,6 +106,16 @@ class OrderItemResponse(BaseModel):
             ]
         }
     )
+    
+    @classmethod
+    def from_item(cls, item: "OrderItem | OrderItemRecord") -> "OrderItemResponse":
+        """Build the response from an order item row (integer cents)."""
+        return cls(
+            id=item.id,
+            name=item.name,
+            amount=item.amount,
+            price=cents_to_decimal(item.price_cents),
+        )
 
 
 class OrderCreate(BaseModel):
@@ -101,8 +134,14 @@ class OrderCreate(BaseModel):
     items: list[OrderItemCreate] = Field(
         ...,
         min_length=1,
-        description="List of items in the order (at least one required)"
+        description=(
+            "List of items in the order (at least one required). Lines with the "
+            "same name and price are merged into one with the summed amount."
+        )
     )
+
+    # Number of lines as submitted, before duplicates were merged
+    _submitted_lines: int = PrivateAttr(default=0)
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -141,6 +180,51 @@ class OrderCreate(BaseModel):
         }
     )
 
+    @field_validator("items", mode="before")
+    @classmethod
+    def limit_items(cls, v: object) -> object:
+        """Reject oversized orders before any line is validated."""
+        if isinstance(v, list) and len(v) > settings.order_max_items:
+            raise ValueError(f"An order can have at most {settings.order_max_items} items")
+        return v
+
+    @model_validator(mode="after")
+    def merge_duplicate_items(self) -> "OrderCreate":
+        """Merge lines with the same name and price, keeping first-seen order."""
+        self._submitted_lines = len(self.items)
+        if not settings.order_merge_duplicate_items:
+            return self
+        merged: dict[tuple[str, int], OrderItemCreate] = {}
+        for item in self.items:
+            key = (item.name, item.price_cents)
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = item
+            else:
+                merged[key] = existing.model_copy(update={"amount": existing.amount + item.amount})
+        if len(merged) < len(self.items):
+            self.items = list(merged.values())
+        return self
+
+    @property
+    def submitted_lines(self) -> int:
+        """Number of lines in the request, before duplicates were merged."""
+        return self._submitted_lines
+
+
+class OrderImport(BaseModel):
+    """
+    Schema for a historical order read by the bulk importer.
+
+    Same fields as ``OrderCreate`` but without the ingestion rules for live
+    orders: there is no item limit and lines are kept exactly as recorded.
+    """
+
+    table_number: int = Field(..., gt=0, description="Table number where the order was placed")
+    items: list[OrderItemCreate] = Field(
+        ..., min_length=1, description="Items of the order, as recorded"
+    )
+
 
 class OrderResponse(BaseModel):
     """
@@ -156,9 +240,9 @@ class OrderResponse(BaseModel):
         ...,
         description="Order status (pending, in_progress, or ready)"
     )
-    items: list[OrderItemResponse] = Field(
+    items: list[OrderItemResponse] | None = Field(
         ...,
-        description="List of items in the order"
+        description="List of items in the order (null when requested with include_items=false)"
     )
     total: float = Field(
         ...,
@@ -168,10 +252,12 @@ class OrderResponse(BaseModel):
         ...,
         description="Timestamp when the order was created"
     )
+    version: int = Field(
+        ...,
+        description="Incremented on every change; send it back as If-Match or expected_version"
+    )
     
     model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True,
         json_schema_extra={
             "examples": [
                 {
@@ -193,7 +279,181 @@ class OrderResponse(BaseModel):
                         }
                     ],
                     "total": 30.00,
-                    "created_at": "2026-01-31T19:45:00.000000Z"
+                    "created_at": "2026-01-31T19:45:00.000000Z",
+                    "version": 1
+                }
+            ]
+        }
+    )
+    
+    @classmethod
+    def from_order(
+        cls,
+        order: "Order | OrderRecord",
+        total_cents: int | None = None,
+        include_items: bool = True,
+    ) -> "OrderResponse":
+        """
+        Build the response from an order row, converting cents to decimals.
+
+        Args:
+            order: ORM order or read-path record
+            total_cents: Total already aggregated in SQL; computed from the
+                items when omitted
+            include_items: If False, items are neither loaded nor returned
+        """
+        if total_cents is None:
+            total_cents = order.total_cents
+        return cls(
+            id=order.id,
+            table_number=order.table_number,
+            status=order.status.value,
+            items=(
+                [OrderItemResponse.from_item(item) for item in order.items]
+                if include_items
+                else None
+            ),
+            total=cents_to_decimal(total_cents),
+            created_at=order.created_at,
+            version=order.version,
+        )
+
+
+class OrderChangeResponse(BaseModel):
+    """
+    Schema for a single change feed delta.
+    
+    CREATED deltas include the full order snapshot; status changes only carry
+    the new status so the payload stays proportional to what changed.
+    """
+    
+    seq: int = Field(..., description="Monotonic sequence number of the change")
+    order_id: int = Field(..., description="Order the change applies to")
+    change: str = Field(
+        ...,
+        description="Kind of change (created, started, ready, cancelled, or completed)"
+    )
+    status: str = Field(..., description="Order status after the change")
+    changed_at: datetime = Field(..., description="Timestamp of the change")
+    order: OrderResponse | None = Field(
+        None,
+        validation_alias="payload",
+        description="Full order snapshot (only for created changes)"
+    )
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrderChangesResponse(BaseModel):
+    """
+    Schema for the change feed response.
+    
+    Clients store `cursor` and pass it back as `since` on the next call.
+    """
+    
+    changes: list[OrderChangeResponse] = Field(
+        ...,
+        description="Changes after the requested cursor, oldest first"
+    )
+    cursor: int = Field(..., description="Cursor to pass as `since` next time")
+    has_more: bool = Field(
+        ...,
+        description="True if more changes are available past `cursor`"
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "changes": [
+                        {
+                            "seq": 41,
+                            "order_id": 7,
+                            "change": "completed",
+                            "status": "completed",
+                            "changed_at": "2026-01-31T19:50:00.000000Z",
+                            "order": None
+                        }
+                    ],
+                    "cursor": 41,
+                    "has_more": False
+                }
+            ]
+        }
+    )
+
+
+class OrderSummaryResponse(BaseModel):
+    """
+    Schema for the kitchen dashboard summary.
+    
+    Served from counters maintained with every status change, so it stays
+    cheap to poll regardless of how many orders exist.
+    """
+    
+    counts: dict[str, int] = Field(
+        ...,
+        description="Number of orders per status (every status is present)"
+    )
+    active_orders: int = Field(
+        ...,
+        description="Orders that are pending, in progress, or ready"
+    )
+    oldest_active_created_at: datetime | None = Field(
+        None,
+        description="Creation time of the oldest active order"
+    )
+    oldest_active_age_seconds: float | None = Field(
+        None,
+        description="Age of the oldest active order in seconds"
+    )
+    day: date = Field(..., description="Business day the revenue figures refer to")
+    revenue_today: float = Field(
+        ...,
+        description="Total of orders completed today"
+    )
+    completed_today: int = Field(..., description="Number of orders completed today")
+    
+    @classmethod
+    def from_summary(cls, summary: dict, now: datetime | None = None) -> "OrderSummaryResponse":
+        """Build the response from ``backend.counters.read_summary`` output."""
+        from backend.models.order import ACTIVE_STATUSES
+
+        now = now or datetime.now(timezone.utc)
+        oldest = summary["oldest_active_created_at"]
+        if oldest is not None and oldest.tzinfo is None:
+            # SQLite drops the offset; timestamps are always written in UTC
+            oldest = oldest.replace(tzinfo=timezone.utc)
+        counts = summary["counts"]
+        return cls(
+            counts={s.value: n for s, n in counts.items()},
+            active_orders=sum(counts[s] for s in ACTIVE_STATUSES),
+            oldest_active_created_at=oldest,
+            oldest_active_age_seconds=(
+                round((now - oldest).total_seconds(), 3) if oldest is not None else None
+            ),
+            day=summary["day"],
+            revenue_today=cents_to_decimal(summary["revenue_cents"]),
+            completed_today=summary["completed_orders"],
+        )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "counts": {
+                        "pending": 4,
+                        "in_progress": 2,
+                        "ready": 1,
+                        "completed": 37,
+                        "cancelled": 3
+                    },
+                    "active_orders": 7,
+                    "oldest_active_created_at": "2026-01-31T19:32:00.000000Z",
+                    "oldest_active_age_seconds": 754.2,
+                    "day": "2026-01-31",
+                    "revenue_today": 1245.5,
+                    "completed_today": 37
                 }
             ]
         }
@@ -0,0 +1,84 @@
+"""Pydantic schemas for report endpoints."""
+
+from datetime import date
+from typing import Self
+
+from pydantic import BaseModel, Field
+
+from backend.prep_times import DIMENSION_ALL, DIMENSION_HOUR, DIMENSION_ITEM
+from backend.sketches import QuantileSketch
+
+
+class PrepTimeQuantiles(BaseModel):
+    """Prep-time percentiles of a group of orders, in seconds."""
+
+    count: int = Field(..., description="Orders measured")
+    p50_seconds: float = Field(..., description="Median prep time")
+    p90_seconds: float = Field(..., description="90th percentile prep time")
+    p99_seconds: float = Field(..., description="99th percentile prep time")
+
+    @classmethod
+    def from_sketch(cls, sketch: QuantileSketch, **fields) -> Self:
+        return cls(
+            count=sketch.count,
+            p50_seconds=round(sketch.quantile(0.5) or 0.0, 1),
+            p90_seconds=round(sketch.quantile(0.9) or 0.0, 1),
+            p99_seconds=round(sketch.quantile(0.99) or 0.0, 1),
+            **fields,
+        )
+
+
+class PrepTimeByHour(PrepTimeQuantiles):
+    """Prep-time percentiles of orders that came in during one hour of the day."""
+
+    hour: int = Field(..., ge=0, le=23, description="Hour of day in the business timezone")
+
+
+class PrepTimeByItem(PrepTimeQuantiles):
+    """Prep-time percentiles of orders containing one dish."""
+
+    name: str = Field(..., description="Dish name, as entered on the orders")
+
+
+class PrepTimesResponse(BaseModel):
+    """
+    Schema for the prep-time report.
+
+    Percentiles come from quantile sketches with 1% relative accuracy, merged
+    over the requested business days.
+    """
+
+    start: date = Field(..., serialization_alias="from", description="First business day included")
+    end: date = Field(..., serialization_alias="to", description="Last business day included")
+    overall: PrepTimeQuantiles | None = Field(..., description="All measured orders, null if none")
+    by_hour: list[PrepTimeByHour] = Field(..., description="Per hour the orders came in, by hour")
+    by_item: list[PrepTimeByItem] = Field(..., description="Per dish, slowest median first")
+
+    @classmethod
+    def from_sketches(
+        cls,
+        start: date,
+        end: date,
+        sketches: dict[tuple[str, str], QuantileSketch],
+    ) -> "PrepTimesResponse":
+        """Build the report from sketches keyed by ``(dimension, key)``."""
+        overall = sketches.get((DIMENSION_ALL, ""))
+        by_hour = [
+            PrepTimeByHour.from_sketch(sketch, hour=int(key))
+            for (dimension, key), sketch in sketches.items()
+            if dimension == DIMENSION_HOUR
+        ]
+        by_item = [
+            PrepTimeByItem.from_sketch(sketch, name=key)
+            for (dimension, key), sketch in sketches.items()
+            if dimension == DIMENSION_ITEM
+        ]
+        by_hour.sort(key=lambda entry: entry.hour)
+        by_item.sort(key=lambda entry: (-entry.p50_seconds, entry.name))
+        return cls(
+            start=start,
+            end=end,
+            overall=PrepTimeQuantiles.from_sketch(overall) if overall else None,
+            by_hour=by_hour,
+            by_item=by_item,
+        )
@@ -0,0 +1,107 @@
+"""Pydantic schemas for per-table endpoints."""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.schemas.order import OrderResponse, cents_to_decimal
+
+if TYPE_CHECKING:
+    from backend.queries import OrderRecord, TableTabRecord
+
+
+class TableOrdersResponse(BaseModel):
+    """
+    Schema for one table's open tab.
+    
+    Lists the table's open orders (pending, in_progress, ready) together with
+    the running total a waiter would quote.
+    """
+    
+    table_number: int = Field(..., description="Table number")
+    orders: list[OrderResponse] = Field(
+        ...,
+        description="Open orders of the table, oldest first"
+    )
+    total: float = Field(..., description="Running total of the open orders in USD")
+    
+    @classmethod
+    def from_records(
+        cls,
+        table_number: int,
+        orders: "list[OrderRecord]",
+        include_items: bool = True,
+    ) -> "TableOrdersResponse":
+        """Build the response from read-path records with SQL totals."""
+        return cls(
+            table_number=table_number,
+            orders=[
+                OrderResponse.from_order(order, total_cents=order.total_cents, include_items=include_items)
+                for order in orders
+            ],
+            total=cents_to_decimal(sum(order.total_cents for order in orders)),
+        )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "table_number": 5,
+                    "orders": [
+                        {
+                            "id": 1,
+                            "table_number": 5,
+                            "status": "pending",
+                            "items": [
+                                {
+                                    "id": 1,
+                                    "name": "Burger",
+                                    "amount": 2,
+                                    "price": 12.50
+                                }
+                            ],
+                            "total": 25.00,
+                            "created_at": "2026-01-31T19:45:00.000000Z"
+                        }
+                    ],
+                    "total": 25.00
+                }
+            ]
+        }
+    )
+
+
+class TableTabResponse(BaseModel):
+    """Schema for a table with open orders in the open tabs list."""
+    
+    table_number: int = Field(..., description="Table number")
+    order_count: int = Field(..., description="Number of open orders")
+    total: float = Field(..., description="Running total of the open orders in USD")
+    oldest_order_at: datetime = Field(
+        ...,
+        description="Creation time of the table's oldest open order"
+    )
+    
+    @classmethod
+    def from_record(cls, tab: "TableTabRecord") -> "TableTabResponse":
+        """Build the response from a read-path aggregate."""
+        return cls(
+            table_number=tab.table_number,
+            order_count=tab.order_count,
+            total=cents_to_decimal(tab.total_cents),
+            oldest_order_at=tab.oldest_created_at,
+        )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "table_number": 5,
+                    "order_count": 2,
+                    "total": 42.50,
+                    "oldest_order_at": "2026-01-31T19:45:00.000000Z"
+                }
+            ]
+        }
+    )
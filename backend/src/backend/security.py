@@ -0,0 +1,41 @@
+"""Access control helpers for privileged endpoints and headers."""
+
+import hmac
+from typing import Annotated
+
+from fastapi import Header, HTTPException, status
+
+from backend.config import settings
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+def is_admin_token(token: str | None) -> bool:
+    """
+    Check a token against the configured admin token.
+
+    Returns False when no admin token is configured, so privileged request
+    headers (e.g. on-demand profiling) are never honored on an open deployment.
+    """
+    if not settings.admin_token or not token:
+        return False
+    return hmac.compare_digest(token, settings.admin_token)
+
+
+def require_admin(
+    x_admin_token: Annotated[str | None, Header(alias=ADMIN_TOKEN_HEADER)] = None,
+) -> None:
+    """
+    Dependency guarding admin endpoints.
+
+    When ``ADMIN_TOKEN`` is unset the endpoints stay open, matching the rest of
+    the API; once set, requests must send it in the ``X-Admin-Token`` header.
+
+    Raises:
+        HTTPException: If an admin token is configured and the header does not match
+    """
+    if settings.admin_token and not is_admin_token(x_admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin token required",
+        )
@@ -0,0 +1,158 @@
+"""
+Production server entry point (``python -m backend.server``).
+
+Runs uvicorn with settings from ``Settings`` instead of its defaults: the
+configured number of worker processes (one unless set), uvloop and
+httptools when installed, and explicit backlog, keep-alive and concurrency
+limits. The effective configuration is logged once at startup.
+
+Caches, single-flight, rate-limit buckets, admin statistics and background
+tasks all live in process memory, so each extra worker multiplies them; and
+SQLite serialises writes whatever the number of processes. More than one
+worker is therefore only used when asked for explicitly.
+"""
+
+import importlib.util
+import logging
+import os
+from typing import Any
+
+from backend.config import Settings, settings
+from backend.logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+APP = "backend.main:app"
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_implementation(choice: str, fast: str, fallback: str) -> str:
+    """
+    Return the event loop or HTTP parser to use.
+
+    ``auto`` picks ``fast`` when it is installed and ``fallback`` otherwise.
+
+    Raises:
+        RuntimeError: If ``fast`` is requested explicitly but not installed
+    """
+    if choice == "auto":
+        return fast if _installed(fast) else fallback
+    if choice == fast and not _installed(fast):
+        raise RuntimeError(f"{fast} was requested but is not installed")
+    return choice
+
+
+def usable_cpus() -> int:
+    """
+    Return the CPUs this process may use, honouring a cgroup v2 CPU quota.
+
+    ``os.process_cpu_count()`` only sees CPU affinity, so in a container
+    limited to e.g. 2 CPUs on a 64-core host it would report 64.
+    """
+    cpus = os.process_cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(1, min(cpus, int(quota) // int(period)))
+
+
+def uses_sqlite(config: Settings) -> bool:
+    """Return whether orders are stored in SQLite (the default and per-tenant databases)."""
+    url = config.tenant_database_url_template if config.tenancy_enabled else config.database_url
+    return url.startswith("sqlite")
+
+
+def resolve_workers(config: Settings) -> int:
+    """
+    Return the number of worker processes.
+
+    State held in process memory (the in-memory repository) cannot be shared
+    between workers, and auto-reload only supports one, so both force a
+    single worker. ``0`` means one per usable CPU, except on SQLite, where
+    it means one: more only queue on the database's single writer.
+    """
+    if config.debug or config.order_repository == "memory":
+        return 1
+    if config.server_workers > 0:
+        return config.server_workers
+    if uses_sqlite(config):
+        return 1
+    return usable_cpus()
+
+
+def build_config(config: Settings = settings) -> dict[str, Any]:
+    """Return the keyword arguments for ``uvicorn.run``."""
+    return {
+        "host": config.host,
+        "port": config.port,
+        "workers": resolve_workers(config),
+        "reload": config.debug,
+        "loop": resolve_implementation(config.server_loop, "uvloop", "asyncio"),
+        "http": resolve_implementation(config.server_http, "httptools", "h11"),
+        "backlog": config.server_backlog,
+        "timeout_keep_alive": config.server_keep_alive_seconds,
+        "limit_concurrency": config.server_limit_concurrency,
+        "h11_max_incomplete_event_size": config.server_h11_max_incomplete_event_size,
+        "log_config": None,  # Use our custom logging configuration
+    }
+
+
+def preload() -> None:
+    """
+    Import the app and create the schema in the supervisor process.
+
+    uvicorn spawns workers rather than forking them, so nothing is shared
+    copy-on-write; preloading makes import and configuration errors fail
+    before any worker starts, and creates tables and seeds the counters once
+    so workers starting together find them in place.
+    """
+    from backend.main import app  # noqa: F401
+
+    if settings.order_repository == "sqlalchemy":
+        from backend.counters import backfill_prep_list, backfill_status_counts
+        from backend.database import SessionLocal, engine, init_db
+
+        init_db()
+        with SessionLocal() as db:
+            backfill_status_counts(db)
+            backfill_prep_list(db)
+        # Workers open their own connections
+        engine.dispose()
+
+
+def run() -> None:
+    """Start the server."""
+    configure_logging(level=settings.log_level)
+    config = build_config()
+    if settings.server_preload and not config["reload"]:
+        preload()
+    logger.info(
+        "Starting server",
+        extra={
+            "app": APP,
+            "cpu_count": usable_cpus(),
+            "preload": settings.server_preload,
+            **{key: value for key, value in config.items() if key != "log_config"},
+        },
+    )
+    if config["workers"] > 1:
+        logger.warning(
+            "Running several workers: caches, single-flight, rate limits, admin "
+            "statistics and background tasks are per worker",
+            extra={"workers": config["workers"]},
+        )
+
+    import uvicorn
+
+    uvicorn.run(APP, **config)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,124 @@
+"""
+Single-flight coalescing of identical concurrent reads.
+
+Kitchen and waiter screens poll ``/orders/pending`` on the same tick. The
+first request for a key runs the computation; requests for the same key
+arriving while it runs wait for it and share its result instead of issuing
+their own queries. Optionally the result is kept for a micro-TTL so
+requests that arrive just after it finished are served too.
+
+Local writes call ``invalidate()``: computations already running are
+detached, so requests arriving after the write start a fresh one and see
+it. A detached computation still answers the waiters it already had but
+is not kept.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from backend.config import settings
+
+
+class _Call:
+    """One in-flight computation and the threads waiting for it."""
+
+    __slots__ = ("done", "result", "error", "generation")
+
+    def __init__(self, generation: int) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.generation = generation
+
+
+class SingleFlight:
+    """Coalesces calls per key across threadpool workers."""
+
+    def __init__(self, ttl_seconds: float = 0.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+        self._generation = 0
+        self._executions = 0
+        self._joined = 0
+        self._cached = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple[Any, str]:
+        """
+        Return ``fn()``'s result for ``key``, sharing it with concurrent callers.
+
+        Returns:
+            The result and how it was obtained: ``leader`` (ran ``fn``),
+            ``joined`` (waited for a running call) or ``cached`` (micro-TTL)
+
+        Raises:
+            Whatever ``fn`` raised, in the leader and in every waiter
+        """
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._cached += 1
+                return cached[1], "cached"
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call(self._generation)
+                self._calls[key] = call
+            else:
+                self._joined += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, "joined"
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                # invalidate() may have detached this call and a newer one taken its place
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                self._executions += 1
+                if (
+                    call.error is None
+                    and self.ttl_seconds > 0
+                    and call.generation == self._generation
+                ):
+                    self._results[key] = (time.monotonic() + self.ttl_seconds, call.result)
+            call.done.set()
+        return call.result, "leader"
+
+    def invalidate(self) -> None:
+        """
+        Forget kept results and detach running calls.
+
+        Later callers start a new computation instead of joining one that
+        may have read the data before the write; detached calls are not kept.
+        """
+        with self._lock:
+            self._results.clear()
+            self._calls.clear()
+            self._generation += 1
+
+    def stats(self) -> dict:
+        """Return counters for the admin endpoint."""
+        with self._lock:
+            return {
+                "ttl_seconds": self.ttl_seconds,
+                "in_flight": len(self._calls),
+                "executions": self._executions,
+                "joined": self._joined,
+                "cached": self._cached,
+            }
+
+
+# Shared by GET /orders/pending; create, cancel and complete invalidate it
+pending_orders_flight = SingleFlight(ttl_seconds=settings.pending_orders_ttl_ms / 1000)
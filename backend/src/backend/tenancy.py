@@ -0,0 +1,282 @@
+"""
+Per-restaurant database routing.
+
+Each branch (tenant) gets its own database, so branches never contend for
+the same SQLite write lock. Tenants are resolved per request from a header
+or subdomain; their engines are created on first use, initialised like the
+default database, and kept in a bounded LRU registry.
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.schema import CreateSchema
+
+from backend.config import settings
+from backend.counters import backfill_prep_list, backfill_status_counts
+from backend.database import init_db, use_wal
+
+logger = logging.getLogger(__name__)
+
+# Lowercase DNS label: safe as a file name, a schema name and a subdomain
+TENANT_ID_PATTERN = re.compile(r"^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?$")
+
+
+class InvalidTenantError(ValueError):
+    """Raised for malformed tenant ids."""
+
+
+def validate_tenant(tenant: str) -> str:
+    """
+    Normalise a tenant id and check it is a lowercase DNS label.
+
+    Raises:
+        InvalidTenantError: If the id is malformed
+    """
+    tenant = tenant.strip().lower()
+    if not TENANT_ID_PATTERN.match(tenant):
+        raise InvalidTenantError(f"Invalid tenant id {tenant!r}")
+    return tenant
+
+
+def resolve_tenant(
+    headers: Mapping[str, str],
+    header_name: str,
+    base_domain: str | None,
+    default: str | None,
+) -> str | None:
+    """
+    Return the raw tenant id of a request, or None if none was given.
+
+    The header wins over the subdomain (``centro.pupas.app`` with base domain
+    ``pupas.app`` gives ``centro``), which wins over the default.
+    """
+    tenant = headers.get(header_name)
+    if tenant:
+        return tenant
+    if base_domain:
+        host = (headers.get("host") or "").split(":", 1)[0].lower()
+        suffix = "." + base_domain.lower()
+        if host.endswith(suffix):
+            subdomain = host[: -len(suffix)]
+            if subdomain and "." not in subdomain:
+                return subdomain
+    return default
+
+
+@dataclass
+class TenantDatabase:
+    """Engine and session factory of one tenant."""
+
+    tenant: str
+    engine: Engine
+    session_factory: sessionmaker[Session]
+    # Schema-per-tenant engines share their parent's pool and must not dispose it
+    owns_engine: bool
+
+
+class TenantEngineRegistry:
+    """
+    Lazily creates tenant databases and keeps the most recently used ones.
+
+    With a ``{tenant}`` placeholder in ``url_template`` every tenant gets its
+    own engine (for SQLite, its own file and write lock). Without it all
+    tenants share one engine and are separated by schema through
+    ``schema_translate_map``. Beyond ``max_engines`` the least recently used
+    tenant is evicted and its pool disposed; it is recreated on next use.
+
+    A tenant's database is created and initialised outside the registry lock,
+    under a lock of its own, so first use of one tenant never blocks requests
+    for the others. Schema creation and backfills run once per tenant and
+    process; re-creating an evicted tenant only opens a new engine.
+    """
+
+    def __init__(self, url_template: str, max_engines: int = 32) -> None:
+        self.url_template = url_template
+        self.max_engines = max_engines
+        self._lock = threading.Lock()
+        self._databases: OrderedDict[str, TenantDatabase] = OrderedDict()
+        # Tenant -> lock held while its database is being created
+        self._creating: dict[str, threading.Lock] = {}
+        self._initialised: set[str] = set()
+        self._shared_engine: Engine | None = None
+        self.created = 0
+        self.evicted = 0
+
+    @property
+    def per_tenant_engines(self) -> bool:
+        return "{tenant}" in self.url_template
+
+    def tenants(self) -> list[str]:
+        """Return the tenants with a live engine, least recently used first."""
+        with self._lock:
+            return list(self._databases)
+
+    def databases(self) -> list[TenantDatabase]:
+        """Return the live tenant databases (for background maintenance)."""
+        with self._lock:
+            return list(self._databases.values())
+
+    def get(self, tenant: str) -> TenantDatabase:
+        """Return a tenant's database, creating and initialising it on first use."""
+        with self._lock:
+            database = self._lookup(tenant)
+            if database is not None:
+                return database
+            creating = self._creating.setdefault(tenant, threading.Lock())
+
+        # Concurrent first requests for the same tenant wait here; other
+        # tenants are only held up by the short registry lock
+        with creating:
+            with self._lock:
+                database = self._lookup(tenant)
+                if database is not None:
+                    return database
+
+            database = self._create(tenant)
+
+            with self._lock:
+                self._databases[tenant] = database
+                self._creating.pop(tenant, None)
+                self.created += 1
+                evicted = []
+                while len(self._databases) > self.max_engines:
+                    evicted.append(self._databases.popitem(last=False)[1])
+                self.evicted += len(evicted)
+                engines = len(self._databases)
+        for old in evicted:
+            self._dispose(old)
+        logger.info(
+            "Tenant database ready",
+            extra={"tenant": tenant, "dialect": database.engine.dialect.name, "engines": engines},
+        )
+        return database
+
+    def _lookup(self, tenant: str) -> TenantDatabase | None:
+        # Caller holds self._lock
+        database = self._databases.get(tenant)
+        if database is not None:
+            self._databases.move_to_end(tenant)
+        return database
+
+    def dispose_all(self) -> None:
+        """Dispose every engine (application shutdown)."""
+        with self._lock:
+            while self._databases:
+                _, database = self._databases.popitem()
+                if database.owns_engine:
+                    database.engine.dispose()
+            if self._shared_engine is not None:
+                self._shared_engine.dispose()
+                self._shared_engine = None
+
+    def _create(self, tenant: str) -> TenantDatabase:
+        # Caller holds the tenant's creation lock, not the registry lock
+        initialise = tenant not in self._initialised
+        if self.per_tenant_engines:
+            engine = _create_engine(self.url_template.format(tenant=tenant))
+            owns_engine = True
+        else:
+            with self._lock:
+                if self._shared_engine is None:
+                    self._shared_engine = _create_engine(self.url_template)
+                shared_engine = self._shared_engine
+            engine = shared_engine.execution_options(schema_translate_map={None: tenant})
+            if initialise:
+                with engine.begin() as conn:
+                    conn.execute(CreateSchema(tenant, if_not_exists=True))
+            owns_engine = False
+
+        if initialise:
+            _initialise(engine)
+            with self._lock:
+                self._initialised.add(tenant)
+        return TenantDatabase(
+            tenant,
+            engine,
+            sessionmaker(autocommit=False, autoflush=False, bind=engine),
+            owns_engine,
+        )
+
+    def _dispose(self, database: TenantDatabase) -> None:
+        if database.owns_engine:
+            # Checked-out connections finish their request and are then closed
+            database.engine.dispose()
+        logger.info("Evicted tenant database", extra={"tenant": database.tenant})
+
+
+def _create_engine(url: str) -> Engine:
+    parsed = make_url(url)
+    connect_args = {}
+    if parsed.get_backend_name() == "sqlite":
+        connect_args["check_same_thread"] = False
+        if parsed.database and parsed.database != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(parsed.database)), exist_ok=True)
+    return use_wal(create_engine(url, connect_args=connect_args))
+
+
+def _initialise(engine: Engine) -> None:
+    # Same steps as the default database at startup
+    init_db(engine)
+    with Session(engine) as db:
+        backfill_status_counts(db)
+        backfill_prep_list(db)
+
+
+tenant_registry = TenantEngineRegistry(
+    settings.tenant_database_url_template,
+    max_engines=settings.tenant_max_engines,
+)
+
+
+def live_tenant_databases() -> list[TenantDatabase]:
+    """Return the open tenant databases, or none when tenancy is off."""
+    if not settings.tenancy_enabled:
+        return []
+    return tenant_registry.databases()
+
+
+def live_tenant_engines() -> list[tuple[str, Engine]]:
+    """Return ``(tenant, engine)`` of the open tenant databases."""
+    return [(database.tenant, database.engine) for database in live_tenant_databases()]
+
+
+def tenant_sessionmaker(request: Request) -> sessionmaker[Session]:
+    """
+    Resolve the request's tenant and return its session factory.
+
+    Raises:
+        HTTPException: 400 if no valid tenant is given, 404 if it is not allowed
+    """
+    raw = resolve_tenant(
+        request.headers,
+        settings.tenant_header,
+        settings.tenant_base_domain,
+        settings.default_tenant,
+    )
+    if raw is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Missing tenant: send the {settings.tenant_header} header",
+        )
+    try:
+        tenant = validate_tenant(raw)
+    except InvalidTenantError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    if not settings.tenant_auto_create and tenant not in settings.tenant_allowlist:
+        # Unknown ids never reach the registry, which would create a database
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown tenant {tenant!r}",
+        )
+    request.state.tenant = tenant
+    return tenant_registry.get(tenant).session_factory
@@ -0,0 +1,164 @@
+"""
+Size and saturation metrics of the threadpool that runs sync endpoints.
+
+Every ``def`` endpoint and sync dependency (``get_db``) runs in AnyIO's
+worker threadpool, capped by one default ``CapacityLimiter`` (40 tokens out
+of the box). When SQLite is slow, requests wait for a token without leaving
+a trace. At startup ``install()`` sizes the limiter from THREADPOOL_SIZE and
+wraps it so every wait for a token is timed per operation_id, and the
+current and peak number of waiting tasks are kept.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import anyio.to_thread
+
+from backend.request_context import current_operation_id
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _WaitAggregate:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    samples: deque[float] = field(default_factory=deque)
+
+
+class ThreadpoolStats:
+    """Thread-safe token wait aggregates per operation_id, plus queue length."""
+
+    def __init__(self, sample_size: int = 1024) -> None:
+        self.sample_size = sample_size
+        self._lock = threading.Lock()
+        self._waits: dict[str, _WaitAggregate] = {}
+        self.waiting = 0
+        self.peak_waiting = 0
+
+    def enter_queue(self) -> None:
+        with self._lock:
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+
+    def record(self, operation_id: str, wait_ms: float, queued: bool) -> None:
+        """Record one acquisition; ``queued`` if it had to wait in the queue."""
+        with self._lock:
+            if queued:
+                self.waiting -= 1
+            aggregate = self._waits.get(operation_id)
+            if aggregate is None:
+                aggregate = self._waits[operation_id] = _WaitAggregate(
+                    samples=deque(maxlen=self.sample_size)
+                )
+            aggregate.count += 1
+            aggregate.total_ms += wait_ms
+            aggregate.max_ms = max(aggregate.max_ms, wait_ms)
+            aggregate.samples.append(wait_ms)
+
+    def snapshot(self) -> dict:
+        """Return queue counters and wait aggregates, longest total wait first."""
+        with self._lock:
+            items = [
+                (operation_id, a.count, a.total_ms, a.max_ms, sorted(a.samples))
+                for operation_id, a in self._waits.items()
+            ]
+            waiting, peak_waiting = self.waiting, self.peak_waiting
+        waits = [
+            {
+                "operation_id": operation_id,
+                "count": count,
+                "total_ms": round(total_ms, 3),
+                "mean_ms": round(total_ms / count, 3),
+                "max_ms": round(max_ms, 3),
+                "p95_ms": round(samples[max(math.ceil(0.95 * len(samples)) - 1, 0)], 3),
+            }
+            for operation_id, count, total_ms, max_ms, samples in items
+        ]
+        waits.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return {"waiting": waiting, "peak_waiting": peak_waiting, "waits": waits}
+
+    def reset(self) -> None:
+        """Drop wait aggregates and restart the peak from the current queue length."""
+        with self._lock:
+            self._waits.clear()
+            self.peak_waiting = self.waiting
+
+
+class MeteredLimiter:
+    """
+    Wraps AnyIO's default ``CapacityLimiter`` and times token acquisition.
+
+    AnyIO only enters the limiter as an async context manager when it hands a
+    call to a worker thread; everything else is delegated unchanged.
+    """
+
+    def __init__(self, limiter: Any, stats: ThreadpoolStats) -> None:
+        self._limiter = limiter
+        self._stats = stats
+
+    @property
+    def total_tokens(self) -> float:
+        return self._limiter.total_tokens
+
+    @total_tokens.setter
+    def total_tokens(self, value: float) -> None:
+        self._limiter.total_tokens = value
+
+    async def __aenter__(self) -> None:
+        start = time.perf_counter()
+        queued = self._limiter.available_tokens < 1
+        if queued:
+            self._stats.enter_queue()
+        try:
+            await self._limiter.acquire()
+        finally:
+            wait_ms = (time.perf_counter() - start) * 1000
+            self._stats.record(current_operation_id.get() or "unknown", wait_ms, queued)
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._limiter.release()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._limiter, name)
+
+
+threadpool_stats = ThreadpoolStats()
+
+
+def install(total_tokens: int) -> None:
+    """
+    Size the default threadpool limiter of the running event loop and meter it.
+
+    Must be called from the event loop (the application lifespan). The limiter
+    is per event loop, so calling it again only resizes.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = total_tokens
+    if isinstance(limiter, MeteredLimiter):
+        return
+    try:
+        # AnyIO keeps the default limiter in a per-loop RunVar with no public
+        # setter; without it only the size and the live counters are available
+        from anyio._backends._asyncio import _default_thread_limiter
+    except ImportError:
+        logger.warning("Threadpool wait metrics unavailable with this AnyIO version")
+        return
+    _default_thread_limiter.set(MeteredLimiter(limiter, threadpool_stats))
+
+
+def threadpool_snapshot() -> dict:
+    """Return limiter size, threads in use and the wait statistics."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return {
+        "metered": isinstance(limiter, MeteredLimiter),
+        "total_tokens": int(limiter.total_tokens),
+        "borrowed_tokens": limiter.borrowed_tokens,
+        **threadpool_stats.snapshot(),
+    }
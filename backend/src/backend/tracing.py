@@ -0,0 +1,379 @@
+"""Lightweight request tracing with OTLP-style JSON export and Server-Timing."""
+
+import functools
+import inspect
+import json
+import logging
+import queue
+import random
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueListener, RotatingFileHandler
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.config import settings
+from backend.request_context import resolve_operation_id
+
+logger = logging.getLogger(__name__)
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+
+class Span:
+    """A timed operation inside a trace."""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns", "attributes")
+
+    def __init__(
+        self,
+        trace: "Trace",
+        name: str,
+        parent_id: str | None,
+        kind: int = SPAN_KIND_INTERNAL,
+        start_ns: int | None = None,
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        self.trace = trace
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes = attributes or {}
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+
+class Trace:
+    """All spans of one request; appended to from the event loop and worker threads."""
+
+    def __init__(self) -> None:
+        self.trace_id = secrets.token_hex(16)
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def snapshot(self) -> list[Span]:
+        with self._lock:
+            return list(self.spans)
+
+    def find(self, name: str) -> Span | None:
+        """Return the most recent finished span with the given name."""
+        return next((s for s in reversed(self.snapshot()) if s.name == name and s.end_ns), None)
+
+
+# Innermost open span of the current request; None when the request is not sampled
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def is_tracing() -> bool:
+    """Return True if the current request is being traced."""
+    return _current_span.get() is not None
+
+
+@contextmanager
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Span | None]:
+    """
+    Record a child span of the current span.
+
+    A no-op (yielding None) when the current request is not sampled, so it is
+    cheap enough to leave around hot code paths.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(parent.trace, name, parent.span_id, kind, attributes=attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    finally:
+        child.end_ns = time.time_ns()
+        _current_span.reset(token)
+        parent.trace.add(child)
+
+
+def record_span(
+    name: str,
+    start_ns: int,
+    end_ns: int,
+    kind: int = SPAN_KIND_INTERNAL,
+    **attributes: Any,
+) -> None:
+    """Record an already finished child span of the current span (if tracing)."""
+    parent = _current_span.get()
+    if parent is None:
+        return
+    child = Span(parent.trace, name, parent.span_id, kind, start_ns, attributes)
+    child.end_ns = end_ns
+    parent.trace.add(child)
+
+
+def server_timing(trace: Trace, root: Span) -> str:
+    """
+    Summarize a trace as a ``Server-Timing`` header value.
+
+    Phases are summed by name; individual ``db.query`` spans are folded into
+    one ``db`` entry with the statement count.
+    """
+    totals: dict[str, float] = {}
+    queries = 0
+    for s in trace.snapshot():
+        if s.end_ns is None:
+            continue
+        if s.name == "db.query":
+            totals["db"] = totals.get("db", 0.0) + s.duration_ms
+            queries += 1
+        elif s.parent_id == root.span_id or s.name in ("db.commit", "db.refresh"):
+            key = s.name.replace(".", "-")
+            totals[key] = totals.get(key, 0.0) + s.duration_ms
+
+    entries = []
+    for name, duration in totals.items():
+        entry = f"{name};dur={duration:.2f}"
+        if name == "db":
+            entry += f';desc="{queries} queries"'
+        entries.append(entry)
+    entries.append(f"app;dur={root.duration_ms:.2f}")
+    return ", ".join(entries)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(trace: Trace, service_name: str) -> dict[str, Any]:
+    """Render a trace in the OTLP/JSON ``ExportTraceServiceRequest`` shape."""
+    spans = trace.snapshot()
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [
+                            {
+                                "traceId": trace.trace_id,
+                                "spanId": s.span_id,
+                                **({"parentSpanId": s.parent_id} if s.parent_id else {}),
+                                "name": s.name,
+                                "kind": s.kind,
+                                "startTimeUnixNano": str(s.start_ns),
+                                "endTimeUnixNano": str(s.end_ns or s.start_ns),
+                                "attributes": [
+                                    {"key": key, "value": _otlp_value(value)}
+                                    for key, value in s.attributes.items()
+                                ],
+                            }
+                            for s in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class _OtlpFormatter(logging.Formatter):
+    """Serialises the trace attached to a record as one OTLP JSON line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(to_otlp(record.trace, record.service_name), separators=(",", ":"))
+
+
+class TraceExporter:
+    """
+    Append traces as JSON lines to a size-rotated file.
+
+    ``export()`` only enqueues the trace; a background thread serialises it
+    and writes the file, so sampled requests never block the event loop on
+    disk. When the queue is full (the disk cannot keep up) traces are dropped
+    and counted.
+    """
+
+    def __init__(self, path: str, max_bytes: int, backup_count: int = 3, queue_size: int = 1000) -> None:
+        self._handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, delay=True
+        )
+        self._handler.setFormatter(_OtlpFormatter())
+        self._queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+        self._listener = QueueListener(self._queue, self._handler)
+        self._listener.start()
+        self.dropped = 0
+
+    def export(self, trace: Trace, service_name: str) -> None:
+        record = logging.makeLogRecord(
+            {"levelno": logging.INFO, "trace": trace, "service_name": service_name}
+        )
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Block until every queued trace has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write the traces still queued, then close the file."""
+        self._listener.stop()
+        self._handler.close()
+        if self.dropped:
+            logger.warning("Dropped traces: export queue was full", extra={"dropped": self.dropped})
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware that traces a sample of requests.
+
+    Sampled requests get a root server span, a ``Server-Timing`` response
+    header summarizing the phases, and (when an exporter is configured) one
+    OTLP JSON line per trace.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 0.0,
+        exporter: TraceExporter | None = None,
+        server_timing_header: bool = True,
+        service_name: str = "backend",
+    ) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+        self.server_timing_header = server_timing_header
+        self.service_name = service_name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        operation_id = resolve_operation_id(scope)
+        root = Span(
+            trace,
+            f"{scope['method']} {operation_id or scope['path']}",
+            None,
+            SPAN_KIND_SERVER,
+            attributes={
+                "http.request.method": scope["method"],
+                "url.path": scope["path"],
+                "operation_id": operation_id or "",
+            },
+        )
+        token = _current_span.set(root)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                root.attributes["http.response.status_code"] = message["status"]
+                if self.server_timing_header:
+                    MutableHeaders(scope=message).append("Server-Timing", server_timing(trace, root))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            root.end_ns = time.time_ns()
+            _current_span.reset(token)
+            trace.add(root)
+            if self.exporter is not None:
+                self.exporter.export(trace, self.service_name)
+
+
+def _trace_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an endpoint in a ``handler`` span, keeping it sync or async."""
+    if getattr(endpoint, "__traced__", False):
+        # Already wrapped: include_router re-creates routes from route.endpoint
+        return endpoint
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def traced_async(*args: Any, **kwargs: Any) -> Any:
+            with span("handler"):
+                return await endpoint(*args, **kwargs)
+
+        traced_async.__traced__ = True  # type: ignore[attr-defined]
+        return traced_async
+
+    @functools.wraps(endpoint)
+    def traced_sync(*args: Any, **kwargs: Any) -> Any:
+        with span("handler"):
+            return endpoint(*args, **kwargs)
+
+    traced_sync.__traced__ = True  # type: ignore[attr-defined]
+    return traced_sync
+
+
+class TracedRoute(APIRoute):
+    """
+    APIRoute that splits a traced request into phases.
+
+    ``validation`` covers body parsing, Pydantic validation and dependency
+    resolution (everything before the endpoint runs), ``handler`` the endpoint
+    itself, and ``serialization`` response-model validation and JSON encoding.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _trace_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+
+        async def traced_handler(request: Request) -> Response:
+            parent = _current_span.get()
+            if parent is None:
+                return await handler(request)
+
+            start_ns = time.time_ns()
+            try:
+                return await handler(request)
+            finally:
+                end_ns = time.time_ns()
+                endpoint_span = parent.trace.find("handler")
+                if endpoint_span is None or endpoint_span.start_ns < start_ns:
+                    # Rejected before the endpoint ran (e.g. 422)
+                    record_span("validation", start_ns, end_ns)
+                else:
+                    record_span("validation", start_ns, endpoint_span.start_ns)
+                    record_span("serialization", endpoint_span.end_ns or end_ns, end_ns)
+
+        return traced_handler
+
+
+trace_exporter = (
+    TraceExporter(settings.tracing_export_path, settings.tracing_export_max_bytes)
+    if settings.tracing_export_path
+    else None
+)
@@ -53,8 +53,10 @@ def test_db(test_engine) -> Generator[Session, None, None]:
 def client(test_engine) -> Generator[TestClient, None, None]:
     """Create a test client for the FastAPI application."""
     from fastapi import FastAPI
-    from backend.routes import health, orders
+    from backend.routes import health, kitchen, orders, reports, tables
     from backend.config import settings
+    from backend.order_cache import order_cache
+    from backend.single_flight import pending_orders_flight
     
     # Create app without lifespan to avoid database initialization
     app = FastAPI(
@@ -66,6 +68,9 @@ def client(test_engine) -> Generator[TestClient, None, None]:
     # Include routers
     app.include_router(health.router, tags=["health"])
     app.include_router(orders.router, prefix="/api/v1", tags=["orders"])
+    app.include_router(tables.router, prefix="/api/v1")
+    app.include_router(kitchen.router, prefix="/api/v1")
+    app.include_router(reports.router, prefix="/api/v1")
     
     # Create a session factory for the test engine
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
@@ -79,7 +84,12 @@ def client(test_engine) -> Generator[TestClient, None, None]:
     
     app.dependency_overrides[get_db] = override_get_db
     
+    # Every test starts from a fresh database, so cached orders must go too
+    order_cache.clear()
+    pending_orders_flight.invalidate()
     with TestClient(app) as test_client:
         yield test_client
     
     app.dependency_overrides.clear()
+    order_cache.clear()
+    pending_orders_flight.invalidate()
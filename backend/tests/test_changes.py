@@ -0,0 +1,130 @@
+"""Tests for the order change feed and change log compaction."""
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from backend.changes import compact_order_changes
+from backend.models.order import OrderChange
+
+
+def _create_order(client: TestClient, table_number: int = 5) -> int:
+    response = client.post(
+        "/api/v1/orders",
+        json={
+            "table_number": table_number,
+            "items": [{"name": "Pupusa", "amount": 2, "price": 1.50}],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+class TestOrderChangesEndpoint:
+    """Test GET /api/v1/orders/changes endpoint."""
+
+    def test_changes_empty(self, client: TestClient):
+        """Test the feed when nothing has happened yet."""
+        response = client.get("/api/v1/orders/changes")
+
+        assert response.status_code == 200
+        assert response.json() == {"changes": [], "cursor": 0, "has_more": False}
+
+    def test_changes_record_every_mutation(self, client: TestClient):
+        """Test that create, cancel and complete each append a delta."""
+        first = _create_order(client, table_number=1)
+        second = _create_order(client, table_number=2)
+        client.delete(f"/api/v1/orders/{first}")
+        client.patch(f"/api/v1/orders/{second}/complete")
+
+        response = client.get("/api/v1/orders/changes?since=0")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [(c["order_id"], c["change"]) for c in data["changes"]] == [
+            (first, "created"),
+            (second, "created"),
+            (first, "cancelled"),
+            (second, "completed"),
+        ]
+        assert data["cursor"] == data["changes"][-1]["seq"]
+        created = data["changes"][0]["order"]
+        assert created["table_number"] == 1
+        assert created["total"] == 3.00
+        assert data["changes"][2]["order"] is None
+        assert data["changes"][2]["status"] == "cancelled"
+
+    def test_changes_since_cursor(self, client: TestClient):
+        """Test that only changes after the cursor are returned."""
+        _create_order(client)
+        cursor = client.get("/api/v1/orders/changes").json()["cursor"]
+        order_id = _create_order(client)
+
+        data = client.get(f"/api/v1/orders/changes?since={cursor}").json()
+
+        assert len(data["changes"]) == 1
+        assert data["changes"][0]["order_id"] == order_id
+
+        data = client.get(f"/api/v1/orders/changes?since={data['cursor']}").json()
+        assert data["changes"] == []
+
+    def test_changes_pagination(self, client: TestClient):
+        """Test limit and has_more paging through the log."""
+        for table_number in range(1, 4):
+            _create_order(client, table_number=table_number)
+
+        page = client.get("/api/v1/orders/changes?limit=2").json()
+        assert len(page["changes"]) == 2
+        assert page["has_more"] is True
+
+        page = client.get(f"/api/v1/orders/changes?since={page['cursor']}&limit=2").json()
+        assert len(page["changes"]) == 1
+        assert page["has_more"] is False
+
+    def test_rejected_mutation_not_logged(self, client: TestClient):
+        """Test that a failed cancel does not append a change."""
+        order_id = _create_order(client)
+        client.delete(f"/api/v1/orders/{order_id}")
+        assert client.delete(f"/api/v1/orders/{order_id}").status_code == 400
+
+        data = client.get("/api/v1/orders/changes").json()
+        assert len(data["changes"]) == 2
+
+    def test_expired_cursor_returns_410(self, client: TestClient, test_db: Session):
+        """Test that a cursor behind the compacted log is rejected."""
+        for table_number in range(1, 4):
+            _create_order(client, table_number=table_number)
+        test_db.query(OrderChange).update(
+            {OrderChange.changed_at: datetime.now(timezone.utc) - timedelta(days=2)}
+        )
+        test_db.commit()
+        compact_order_changes(test_db, timedelta(hours=1))
+
+        response = client.get("/api/v1/orders/changes?since=1")
+
+        assert response.status_code == 410
+
+
+class TestCompactOrderChanges:
+    """Test change log compaction."""
+
+    def test_compaction_keeps_recent_and_newest(self, client: TestClient, test_db: Session):
+        """Test that old entries are removed but the newest one is kept."""
+        for table_number in range(1, 4):
+            _create_order(client, table_number=table_number)
+        test_db.query(OrderChange).update(
+            {OrderChange.changed_at: datetime.now(timezone.utc) - timedelta(days=2)}
+        )
+        test_db.commit()
+
+        deleted = compact_order_changes(test_db, timedelta(hours=1))
+
+        assert deleted == 2
+        remaining = test_db.query(OrderChange).all()
+        assert len(remaining) == 1
+        assert remaining[0].seq == 3
+
+    def test_compaction_on_empty_log(self, test_db: Session):
+        """Test that compacting an empty log is a no-op."""
+        assert compact_order_changes(test_db, timedelta(hours=1)) == 0
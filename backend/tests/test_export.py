@@ -0,0 +1,132 @@
+"""Tests for the streaming order export."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from backend.export import CSV_HEADER, ExportFormat, encode_export
+from backend.models.order import Order, OrderItem, OrderStatus
+from backend.queries import OrderItemRecord, OrderRecord, iter_orders_for_export
+
+
+def _create_order(client: TestClient, table_number: int, items: list[dict]) -> int:
+    response = client.post("/api/v1/orders", json={"table_number": table_number, "items": items})
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+class TestExportEndpoint:
+    """Test GET /api/v1/orders/export endpoint."""
+
+    def test_export_ndjson(self, client: TestClient):
+        """Test one JSON order per line, including closed orders."""
+        first = _create_order(client, 1, [{"name": "Burger", "amount": 2, "price": 12.50}])
+        second = _create_order(
+            client,
+            2,
+            [{"name": "Pizza", "amount": 1, "price": 15.00}, {"name": "Soda", "amount": 2, "price": 1.25}],
+        )
+        client.patch(f"/api/v1/orders/{first}/complete")
+
+        response = client.get("/api/v1/orders/export?format=ndjson")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="orders.ndjson"' in response.headers["content-disposition"]
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [(o["id"], o["status"], o["total"]) for o in lines] == [
+            (first, "completed", 25.00),
+            (second, "pending", 17.50),
+        ]
+        assert [i["name"] for i in lines[1]["items"]] == ["Pizza", "Soda"]
+
+    def test_export_csv(self, client: TestClient):
+        """Test one CSV row per item with the order columns repeated."""
+        order_id = _create_order(
+            client,
+            3,
+            [{"name": "Taco, al pastor", "amount": 3, "price": 2.00}, {"name": "Horchata", "amount": 1, "price": 1.50}],
+        )
+
+        response = client.get("/api/v1/orders/export?format=csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert tuple(rows[0]) == CSV_HEADER
+        assert [(r[0], r[4], r[6], r[7], r[8]) for r in rows[1:]] == [
+            (str(order_id), "7.50", "Taco, al pastor", "3", "2.00"),
+            (str(order_id), "7.50", "Horchata", "1", "1.50"),
+        ]
+
+    def test_export_date_range(self, client: TestClient, test_db: Session):
+        """Test that from is inclusive, to is exclusive, and offsets are honoured."""
+        base = datetime(2026, 1, 31, 12, 0)
+        for hours in range(3):
+            test_db.add(Order(table_number=1, status=OrderStatus.COMPLETED, created_at=base + timedelta(hours=hours)))
+        test_db.commit()
+
+        response = client.get(
+            "/api/v1/orders/export",
+            params={"from": "2026-01-31T13:00:00", "to": "2026-01-31T09:00:00-05:00"},
+        )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [o["created_at"] for o in lines] == ["2026-01-31T13:00:00"]
+        assert lines[0]["items"] == []
+
+    def test_export_empty(self, client: TestClient):
+        """Test that an empty export is an empty body (CSV keeps its header)."""
+        assert client.get("/api/v1/orders/export").text == ""
+        assert client.get("/api/v1/orders/export?format=csv").text.strip() == ",".join(CSV_HEADER)
+
+    def test_export_invalid_range(self, client: TestClient):
+        """Test that an empty or inverted range is rejected."""
+        response = client.get(
+            "/api/v1/orders/export",
+            params={"from": "2026-02-01T00:00:00Z", "to": "2026-01-01T00:00:00Z"},
+        )
+
+        assert response.status_code == 400
+
+    def test_export_invalid_format(self, client: TestClient):
+        """Test that unknown formats are rejected."""
+        assert client.get("/api/v1/orders/export?format=xml").status_code == 422
+
+
+class TestExportStreaming:
+    """Test the incremental read and encode helpers."""
+
+    def test_orders_span_fetch_batches(self, test_db: Session):
+        """Test that an order whose items straddle a fetch batch is folded correctly."""
+        for table_number in range(1, 4):
+            order = Order(table_number=table_number, status=OrderStatus.PENDING)
+            test_db.add(order)
+        test_db.commit()
+
+        for order_id in (1, 2, 3):
+            for n in range(3):
+                test_db.add(OrderItem(order_id=order_id, name=f"item{n}", amount=1, price_cents=100))
+        test_db.commit()
+
+        records = list(iter_orders_for_export(test_db, batch_size=2))
+
+        assert [(r.id, len(r.items), r.total_cents) for r in records] == [(1, 3, 300), (2, 3, 300), (3, 3, 300)]
+
+    def test_encode_coalesces_chunks(self):
+        """Test that output is yielded in bounded chunks, not per row or all at once."""
+        created_at = datetime(2026, 1, 31, tzinfo=timezone.utc)
+        orders = (
+            OrderRecord(i, 1, OrderStatus.PENDING, created_at, 100, [OrderItemRecord(i, "Tea", 1, 100)])
+            for i in range(1, 201)
+        )
+
+        chunks = list(encode_export(orders, ExportFormat.NDJSON, chunk_bytes=4096))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) < 4096 + 512 for chunk in chunks)
+        assert b"".join(chunks).count(b"\n") == 200
@@ -1,6 +1,12 @@
 """Tests for health check endpoints."""
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+
+from backend.database import init_db, use_wal
+from backend.models import OrderStatus, OrderStatusCount
+from backend.readiness import ReadinessProbe, get_readiness_probe
 
 
 def test_health_check(client: TestClient) -> None:
@@ -23,3 +29,103 @@ def test_root_endpoint(client: TestClient) -> None:
     data = response.json()
     assert "message" in data
     assert "Welcome" in data["message"]
+
+
+@pytest.fixture
+def probe(client: TestClient, test_engine) -> ReadinessProbe:
+    """Readiness probe bound to the test database."""
+    probe = ReadinessProbe(test_engine, ttl_seconds=60)
+    client.app.dependency_overrides[get_readiness_probe] = lambda: probe
+    return probe
+
+
+def test_liveness(client: TestClient) -> None:
+    """Test that the liveness probe answers without touching the database."""
+    response = client.get("/health/live")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "alive"
+
+
+def test_readiness_reports_database_and_pool(client: TestClient, probe: ReadinessProbe) -> None:
+    """Test that readiness runs the database check and reports SQLite figures."""
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["reasons"] == []
+    assert data["cached"] is False
+    assert data["database"]["ok"] is True
+    assert data["database"]["latency_ms"] >= 0
+    assert data["pool"]["limit"] == data["pool"]["size"] + 10
+    assert data["writer_queue_depth"] == 0
+    assert data["wal_bytes"] == 0
+    assert data["disk_free_bytes"] > 0
+
+
+def test_readiness_is_cached(client: TestClient, probe: ReadinessProbe) -> None:
+    """Test that probes within the TTL reuse the last check."""
+    first = client.get("/health/ready").json()
+    second = client.get("/health/ready").json()
+
+    assert second["cached"] is True
+    assert second["checked_at"] == first["checked_at"]
+
+
+def test_readiness_fails_when_database_is_unreachable(client: TestClient) -> None:
+    """Test that a failing database check returns 503 with a reason."""
+    engine = create_engine("sqlite:////nonexistent-dir/ready.db")
+    client.app.dependency_overrides[get_readiness_probe] = lambda: ReadinessProbe(engine)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "not_ready"
+    assert "database check failed" in data["reasons"]
+    assert data["database"] == {
+        "ok": False,
+        "latency_ms": None,
+        "error": "OperationalError",
+        "skipped": False,
+    }
+
+
+def test_readiness_counts_queued_writers(test_engine) -> None:
+    """Test that open write transactions show up as writer queue depth."""
+    probe = ReadinessProbe(test_engine, ttl_seconds=0, max_writer_queue=0)
+
+    with test_engine.connect() as conn:
+        conn.execute(insert(OrderStatusCount).values(status=OrderStatus.PENDING, count=1))
+        report, _ = probe.check()
+        conn.rollback()
+
+    assert report.writer_queue_depth == 1
+    assert report.ready is False
+    assert probe.check()[0].writer_queue_depth == 0
+
+
+def test_readiness_reports_wal_size(tmp_path) -> None:
+    """Test that the WAL size is reported for databases opened like the app's."""
+    engine = use_wal(create_engine(f"sqlite:///{tmp_path / 'wal.db'}"))
+    try:
+        init_db(engine)
+        with engine.begin() as conn:
+            conn.execute(insert(OrderStatusCount).values(status=OrderStatus.PENDING, count=1))
+
+        report, _ = ReadinessProbe(engine, ttl_seconds=0).check()
+
+        assert report.wal_bytes > 0
+    finally:
+        engine.dispose()
+
+
+def test_readiness_fails_for_unreachable_tenant_database(test_engine, tmp_path) -> None:
+    broken = create_engine(f"sqlite:///{tmp_path}/missing/dir/centro.db")
+    probe = ReadinessProbe(test_engine, ttl_seconds=0, tenant_engines=lambda: [("centro", broken)])
+
+    report, _ = probe.check()
+
+    assert report.ready is False
+    assert report.reasons == ["database check failed for tenant 'centro'"]
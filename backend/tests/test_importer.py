@@ -0,0 +1,177 @@
+"""Tests for the bulk order importer."""
+
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend import importer
+from backend.counters import read_prep_list, read_summary
+from backend.importer import OrderImporter, create_import_engine, main
+from backend.models.order import Order, OrderItem, OrderStatus
+
+
+def _write_ndjson(path: Path, records: list[dict]) -> Path:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return path
+
+
+def _orders(count: int, status: str = "completed") -> list[dict]:
+    return [
+        {
+            "table_number": i % 5 + 1,
+            "status": status,
+            "created_at": "2026-01-15T12:00:00Z",
+            "items": [{"name": "Pupusa", "amount": 2, "price": 1.50}],
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_import_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _count(engine, table) -> int:
+    with Session(engine) as db:
+        return db.scalar(select(func.count()).select_from(table))
+
+
+class TestOrderImporter:
+    """Test OrderImporter.import_file."""
+
+    def test_import_ndjson_in_chunks(self, engine, tmp_path: Path):
+        """Test that every order and item lands, chunk by chunk."""
+        path = _write_ndjson(tmp_path / "orders.ndjson", _orders(25))
+        progress = []
+
+        stats = OrderImporter(
+            engine, chunk_size=10, progress=lambda p, s: progress.append(s.orders)
+        ).import_file(path)
+
+        assert (stats.orders, stats.items, stats.rejected) == (25, 25, 0)
+        assert progress == [10, 20, 25]
+        assert _count(engine, Order) == 25
+        assert _count(engine, OrderItem) == 25
+        with Session(engine) as db:
+            order = db.get(Order, 1)
+            assert order.status == OrderStatus.COMPLETED
+            assert order.total_cents == 300
+            summary = read_summary(db)
+            assert summary["counts"][OrderStatus.COMPLETED] == 25
+            assert read_prep_list(db) == []
+
+    def test_active_orders_feed_prep_list(self, engine, tmp_path: Path):
+        """Test that only imported active orders are added to the kitchen prep list."""
+        path = _write_ndjson(
+            tmp_path / "orders.ndjson", _orders(3, status="pending") + _orders(2)
+        )
+
+        OrderImporter(engine, chunk_size=2).import_file(path)
+
+        with Session(engine) as db:
+            assert read_prep_list(db) == [("Pupusa", 6)]
+
+    def test_import_csv_groups_items_by_order_id(self, engine, tmp_path: Path):
+        """Test the export CSV layout: consecutive rows of an order_id form one order."""
+        path = tmp_path / "orders.csv"
+        path.write_text(
+            "order_id,table_number,status,created_at,order_total,item_id,item_name,amount,price\n"
+            "7,3,pending,2026-01-15T12:00:00,7.50,1,\"Taco, al pastor\",3,2.00\n"
+            "7,3,pending,2026-01-15T12:00:00,7.50,2,Horchata,1,1.50\n"
+            "8,4,completed,2026-01-15T13:00:00,5.00,3,Soda,2,2.50\n"
+        )
+
+        stats = OrderImporter(engine).import_file(path)
+
+        assert (stats.orders, stats.items) == (2, 3)
+        with Session(engine) as db:
+            first = db.get(Order, 1)
+            assert [i.name for i in first.items] == ["Taco, al pastor", "Horchata"]
+            assert first.total_cents == 750
+            assert first.status == OrderStatus.PENDING
+
+    def test_invalid_records_are_rejected(self, engine, tmp_path: Path):
+        """Test that schema violations are reported with line numbers and skipped."""
+        records = _orders(3)
+        records[1]["items"][0]["price"] = 1.505
+        records[2]["status"] = "eaten"
+        path = _write_ndjson(tmp_path / "orders.ndjson", records)
+        errors = []
+
+        stats = OrderImporter(engine, error=lambda p, line, msg: errors.append(line)).import_file(path)
+
+        assert (stats.orders, stats.rejected) == (1, 2)
+        assert errors == [2, 3]
+
+    def test_malformed_lines_are_rejected(self, engine, tmp_path: Path):
+        """Test that undecodable and non-object NDJSON lines do not abort the file."""
+        good = json.dumps(_orders(1)[0])
+        path = tmp_path / "orders.ndjson"
+        path.write_text(f"{good}\n{{not json\n[1, 2]\n{good}\n")
+        errors = []
+
+        stats = OrderImporter(engine, error=lambda p, line, msg: errors.append(line)).import_file(path)
+
+        assert (stats.orders, stats.rejected) == (2, 2)
+        assert errors == [2, 3]
+        assert _count(engine, Order) == 2
+
+    def test_target_is_initialised_like_the_app(self, engine):
+        """Test that imported databases get the app's WAL and auto_vacuum settings."""
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2
+
+    def test_history_skips_live_order_rules(self, engine, tmp_path: Path, monkeypatch):
+        """Test that the item limit and line merging do not apply to imported history."""
+        monkeypatch.setattr(importer.settings, "order_max_items", 2)
+        record = _orders(1)[0]
+        record["items"] = [{"name": "Pupusa", "amount": 1, "price": 1.50}] * 3
+        path = _write_ndjson(tmp_path / "orders.ndjson", [record])
+
+        stats = OrderImporter(engine).import_file(path)
+
+        assert (stats.orders, stats.items, stats.rejected) == (1, 3, 0)
+        assert _count(engine, OrderItem) == 3
+
+    def test_resume_after_failure(self, engine, tmp_path: Path, monkeypatch):
+        """Test that a re-run continues after the last committed chunk."""
+        path = _write_ndjson(tmp_path / "orders.ndjson", _orders(30))
+        real_insert = importer._insert_chunk
+        calls = []
+
+        def failing_insert(conn, chunk):
+            calls.append(len(chunk))
+            if len(calls) == 2:
+                raise RuntimeError("disk full")
+            return real_insert(conn, chunk)
+
+        monkeypatch.setattr(importer, "_insert_chunk", failing_insert)
+        with pytest.raises(RuntimeError):
+            OrderImporter(engine, chunk_size=10).import_file(path)
+        assert _count(engine, Order) == 10
+
+        monkeypatch.setattr(importer, "_insert_chunk", real_insert)
+        stats = OrderImporter(engine, chunk_size=10).import_file(path)
+
+        assert (stats.skipped, stats.orders) == (10, 20)
+        assert _count(engine, Order) == 30
+        # A finished file is not imported twice
+        assert OrderImporter(engine, chunk_size=10).import_file(path).orders == 0
+        assert _count(engine, Order) == 30
+
+
+def test_main_reports_missing_file(tmp_path: Path, capsys):
+    """Test the CLI exit code and messages."""
+    path = _write_ndjson(tmp_path / "orders.ndjson", _orders(2))
+    url = f"sqlite:///{tmp_path / 'cli.db'}"
+
+    assert main([str(path), "--database-url", url]) == 0
+    assert main([str(tmp_path / "missing.ndjson"), "--database-url", url]) == 1
+    assert "no such file" in capsys.readouterr().err
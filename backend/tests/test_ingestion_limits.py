@@ -0,0 +1,148 @@
+"""Tests for order line merging and request size limits at ingestion."""
+
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from backend.body_limit import BodySizeLimitMiddleware
+from backend.config import settings
+from backend.schemas.order import OrderCreate
+
+
+class TestMergeDuplicateItems:
+    """Test that identical order lines are merged."""
+
+    def test_merges_same_name_and_price(self):
+        order = OrderCreate.model_validate(
+            {
+                "table_number": 1,
+                "items": [
+                    {"name": "Burger", "amount": 1, "price": 12.5},
+                    {"name": "Fries", "amount": 1, "price": 5.0},
+                    {"name": "Burger", "amount": 2, "price": 12.50},
+                    {"name": "Burger", "amount": 1, "price": 13.0},
+                ],
+            }
+        )
+
+        assert [(i.name, i.amount, i.price) for i in order.items] == [
+            ("Burger", 3, 12.5),
+            ("Fries", 1, 5.0),
+            ("Burger", 1, 13.0),
+        ]
+        assert order.submitted_lines == 4
+
+    def test_merge_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "order_merge_duplicate_items", False)
+        items = [{"name": "Soda", "amount": 1, "price": 3.5}] * 2
+
+        order = OrderCreate.model_validate({"table_number": 1, "items": items})
+
+        assert len(order.items) == 2
+
+    def test_created_order_has_merged_lines(self, client):
+        response = client.post(
+            "/api/v1/orders",
+            json={
+                "table_number": 4,
+                "items": [
+                    {"name": "Soda", "amount": 1, "price": 3.5},
+                    {"name": "Soda", "amount": 1, "price": 3.5},
+                ],
+            },
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert [(i["name"], i["amount"]) for i in data["items"]] == [("Soda", 2)]
+        assert data["total"] == 7.0
+
+
+class TestMaxItems:
+    """Test the per-order line limit."""
+
+    def test_rejects_too_many_items(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "order_max_items", 2)
+        items = [{"name": f"Dish {i}", "amount": 1, "price": 1.0} for i in range(3)]
+
+        response = client.post("/api/v1/orders", json={"table_number": 1, "items": items})
+
+        assert response.status_code == 422
+        assert "at most 2 items" in response.json()["detail"][0]["msg"]
+
+    def test_limit_checked_before_lines(self, monkeypatch):
+        """Test that an oversized order fails once, not once per invalid line."""
+        monkeypatch.setattr(settings, "order_max_items", 2)
+        items = [{"name": "", "amount": 0, "price": -1}] * 3
+
+        with pytest.raises(ValidationError) as exc_info:
+            OrderCreate.model_validate({"table_number": 1, "items": items})
+
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ("items",)
+
+
+def _echo_app(max_bytes: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/v1/echo")
+    async def echo(request: Request) -> dict:
+        return {"size": len(await request.body())}
+
+    @app.post("/health/echo")
+    async def health_echo(request: Request) -> dict:
+        return {"size": len(await request.body())}
+
+    app.add_middleware(BodySizeLimitMiddleware, max_bytes=max_bytes)
+    return app
+
+
+class TestBodySizeLimit:
+    """Test BodySizeLimitMiddleware."""
+
+    def test_rejects_declared_length(self):
+        client = TestClient(_echo_app(max_bytes=10))
+
+        assert client.post("/api/v1/echo", content=b"x" * 10).json() == {"size": 10}
+        response = client.post("/api/v1/echo", content=b"x" * 11)
+
+        assert response.status_code == 413
+        assert response.json() == {"detail": "Request body exceeds 10 bytes"}
+
+    def test_passes_streamed_body_within_limit(self):
+        client = TestClient(_echo_app(max_bytes=10))
+
+        def chunks():
+            yield b"xxxx"
+            yield b"xxxx"
+
+        assert client.post("/api/v1/echo", content=chunks()).json() == {"size": 8}
+
+    def test_rejects_streamed_order(self, client):
+        """Test that a chunked order over the limit gets 413, not a parse error."""
+        limited = TestClient(BodySizeLimitMiddleware(client.app, max_bytes=64))
+        payload = json.dumps(
+            {"table_number": 1, "items": [{"name": "Burger", "amount": 1, "price": 12.5}] * 5}
+        ).encode()
+
+        def chunks():
+            for start in range(0, len(payload), 16):
+                yield payload[start:start + 16]
+
+        response = limited.post(
+            "/api/v1/orders",
+            content=chunks(),
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 413
+        assert response.json() == {"detail": "Request body exceeds 64 bytes"}
+
+    def test_ignores_paths_outside_api(self):
+        client = TestClient(_echo_app(max_bytes=10))
+
+        assert client.post("/health/echo", content=b"x" * 20).status_code == 200
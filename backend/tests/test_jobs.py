@@ -0,0 +1,181 @@
+"""Tests for the post-commit job queue."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.jobs import JobQueue
+from backend.routes import orders
+
+
+def _queue(**overrides) -> JobQueue:
+    options = {"max_size": 10, "workers": 2, "max_attempts": 3, "retry_base_seconds": 0.01}
+    return JobQueue(**(options | overrides))
+
+
+class TestJobQueue:
+    """Test JobQueue."""
+
+    def test_runs_jobs_and_drains_on_stop(self):
+        queue = _queue()
+        done = []
+
+        async def scenario():
+            queue.start()
+            for i in range(5):
+                assert queue.submit("work", lambda i=i: (time.sleep(0.01), done.append(i)))
+            await queue.stop(timeout_seconds=5)
+
+        asyncio.run(scenario())
+
+        assert sorted(done) == [0, 1, 2, 3, 4]
+        stats = queue.stats()
+        assert stats["succeeded"] == 5
+        assert stats["pending"] == 0
+        assert stats["running"] is False
+
+    def test_submit_from_other_threads(self):
+        queue = _queue()
+        done = []
+
+        async def scenario():
+            queue.start()
+            threads = [
+                threading.Thread(target=queue.submit, args=("work", done.append, i)) for i in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            await asyncio.to_thread(lambda: [thread.join() for thread in threads])
+            await queue.stop(timeout_seconds=5)
+
+        asyncio.run(scenario())
+
+        assert sorted(done) == [0, 1, 2, 3]
+
+    def test_retries_with_backoff_then_succeeds(self):
+        queue = _queue()
+        attempts = []
+
+        def flaky():
+            attempts.append(time.monotonic())
+            if len(attempts) < 3:
+                raise ConnectionError("printer offline")
+
+        async def scenario():
+            queue.start()
+            queue.submit("print_ticket", flaky)
+            await queue.stop(timeout_seconds=5)
+
+        asyncio.run(scenario())
+
+        assert len(attempts) == 3
+        assert attempts[2] - attempts[1] >= 0.02 > 0
+        assert queue.stats()["retried"] == 2
+        assert queue.stats()["succeeded"] == 1
+
+    def test_gives_up_after_max_attempts(self):
+        queue = _queue(max_attempts=2)
+
+        def broken():
+            raise ValueError("bad payload")
+
+        async def scenario():
+            queue.start()
+            queue.submit("notify", broken)
+            await queue.stop(timeout_seconds=5)
+
+        asyncio.run(scenario())
+
+        assert queue.stats()["failed"] == 1
+        assert queue.stats()["retried"] == 1
+
+    def test_drops_when_full(self):
+        queue = _queue(max_size=2, workers=1)
+        release = threading.Event()
+
+        async def scenario():
+            queue.start()
+            accepted = [queue.submit("slow", release.wait, 5) for _ in range(3)]
+            release.set()
+            await queue.stop(timeout_seconds=5)
+            return accepted
+
+        assert asyncio.run(scenario()) == [True, True, False]
+        assert queue.stats()["dropped"] == 1
+
+    def test_retry_delay_is_capped(self):
+        queue = _queue(retry_base_seconds=0.5, retry_max_seconds=3)
+
+        assert [queue.retry_delay(n) for n in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 3]
+
+    def test_rejects_jobs_after_stop(self):
+        """Test that submit() never dereferences a loop cleared by stop()."""
+        queue = _queue()
+
+        async def scenario():
+            queue.start()
+            await queue.stop(timeout_seconds=5)
+
+        asyncio.run(scenario())
+
+        assert queue.submit("late", lambda: None) is False
+        assert queue.stats()["dropped"] == 1
+
+    def test_concurrent_submit_and_stop(self):
+        queue = _queue(max_size=10_000)
+        results = []
+        stop_submitting = threading.Event()
+
+        def submitter():
+            while not stop_submitting.is_set():
+                results.append(queue.submit("work", lambda: None))
+
+        async def scenario():
+            queue.start()
+            thread = threading.Thread(target=submitter)
+            thread.start()
+            await asyncio.sleep(0.01)
+            await queue.stop(timeout_seconds=5)
+            stop_submitting.set()
+            await asyncio.to_thread(thread.join)
+
+        asyncio.run(scenario())
+
+        # The submitter never raised, every call is accounted for, and the
+        # queue keeps rejecting work once stopped
+        assert results
+        assert queue.submit("late", lambda: None) is False
+        stats = queue.stats()
+        assert stats["submitted"] + stats["dropped"] == len(results) + 1
+
+    def test_runs_inline_when_not_started(self):
+        queue = _queue()
+        done = []
+
+        queue.submit("work", done.append, 1)
+
+        assert done == [1]
+        assert queue.stats()["succeeded"] == 1
+
+
+class TestOrderEvents:
+    """Test that order mutations publish their events through the queue."""
+
+    def test_mutations_submit_events(self, client: TestClient, monkeypatch: pytest.MonkeyPatch):
+        submitted = []
+        monkeypatch.setattr(
+            orders.job_queue, "submit", lambda name, fn, *args: submitted.append(name)
+        )
+
+        order_id = client.post(
+            "/api/v1/orders",
+            json={"table_number": 2, "items": [{"name": "Horchata", "amount": 1, "price": 1.5}]},
+        ).json()["id"]
+        client.patch(f"/api/v1/orders/{order_id}/complete")
+        client.patch(f"/api/v1/orders/{order_id}/complete")
+
+        # The idempotent second completion changes nothing and publishes nothing
+        assert submitted == ["order_created", "order_completed"]
@@ -0,0 +1,77 @@
+"""Tests for the kitchen prep list endpoint."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from backend.counters import backfill_prep_list, read_prep_list
+from backend.models.order import Order, OrderItem, OrderStatus
+
+
+def _create(client: TestClient, table_number: int, *items: tuple[str, int]) -> int:
+    response = client.post(
+        "/api/v1/orders",
+        json={
+            "table_number": table_number,
+            "items": [{"name": name, "amount": amount, "price": 1.00} for name, amount in items],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_prep_list_empty(client: TestClient):
+    """Test that the prep list is empty without active orders."""
+    response = client.get("/api/v1/kitchen/prep-list")
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "total_quantity": 0}
+
+
+def test_prep_list_sums_active_orders(client: TestClient):
+    """Test that quantities are summed per dish and drop when orders close."""
+    first = _create(client, 1, ("Pupusa revuelta", 10), ("Horchata", 4))
+    _create(client, 2, ("Pupusa revuelta", 4), ("Pupusa de queso", 6), ("Horchata", 5))
+    cancelled = _create(client, 3, ("Pupusa de queso", 2))
+    client.delete(f"/api/v1/orders/{cancelled}")
+
+    data = client.get("/api/v1/kitchen/prep-list").json()
+    assert data["items"] == [
+        {"name": "Pupusa revuelta", "quantity": 14},
+        {"name": "Horchata", "quantity": 9},
+        {"name": "Pupusa de queso", "quantity": 6},
+    ]
+    assert data["total_quantity"] == 29
+
+    client.patch(f"/api/v1/orders/{first}/complete")
+
+    assert client.get("/api/v1/kitchen/prep-list").json()["items"] == [
+        {"name": "Pupusa de queso", "quantity": 6},
+        {"name": "Horchata", "quantity": 5},
+        {"name": "Pupusa revuelta", "quantity": 4},
+    ]
+
+
+def test_backfill_prep_list(test_db: Session):
+    """Test that an empty prep list is seeded from active orders only."""
+    test_db.add_all(
+        [
+            Order(
+                table_number=1,
+                status=OrderStatus.IN_PROGRESS,
+                items=[
+                    OrderItem(name="Queso", amount=2, price_cents=100),
+                    OrderItem(name="Queso", amount=1, price_cents=100),
+                ],
+            ),
+            Order(
+                table_number=2,
+                status=OrderStatus.COMPLETED,
+                items=[OrderItem(name="Queso", amount=5, price_cents=100)],
+            ),
+        ]
+    )
+    test_db.commit()
+
+    assert backfill_prep_list(test_db) is True
+    assert read_prep_list(test_db) == [("Queso", 3)]
+    assert backfill_prep_list(test_db) is False
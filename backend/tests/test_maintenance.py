@@ -0,0 +1,157 @@
+"""Tests for the SQLite maintenance scheduler."""
+
+from datetime import datetime, timedelta, timezone
+from datetime import time as dt_time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from backend.database import init_db, use_wal
+from backend.maintenance import (
+    MaintenanceJob,
+    MaintenanceScheduler,
+    QuietWindow,
+    incremental_vacuum,
+    parse_window,
+    wal_checkpoint,
+)
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'maint.db'}")
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.exec_driver_sql("CREATE TABLE t (id INTEGER PRIMARY KEY, payload TEXT)")
+        conn.commit()
+    yield engine
+    engine.dispose()
+
+
+class TestQuietWindow:
+    """Test window parsing and matching."""
+
+    def test_parse_and_contains(self):
+        """Test a same-day window; the end is exclusive."""
+        window = parse_window("03:00-05:30")
+
+        assert window == QuietWindow(dt_time(3, 0), dt_time(5, 30))
+        assert window.contains(dt_time(3, 0))
+        assert window.contains(dt_time(5, 29))
+        assert not window.contains(dt_time(5, 30))
+
+    def test_window_wrapping_midnight(self):
+        """Test a window that wraps past midnight."""
+        window = parse_window("23:00-01:00")
+
+        assert window.contains(dt_time(23, 30))
+        assert window.contains(dt_time(0, 30))
+        assert not window.contains(dt_time(12, 0))
+
+    def test_invalid_window(self):
+        """Test that malformed specs are rejected."""
+        with pytest.raises(ValueError):
+            parse_window("nightly")
+
+
+class TestMaintenanceScheduler:
+    """Test scheduling and the individual jobs."""
+
+    def test_jobs_run_only_in_window_and_after_interval(self, engine):
+        """Test that jobs wait for a window (in the business timezone) and their interval."""
+        calls = []
+        job = MaintenanceJob(
+            "noop", timedelta(hours=1), lambda conn, budget: calls.append(budget) or {}
+        )
+        scheduler = MaintenanceScheduler(
+            engine,
+            [parse_window("03:00-05:00")],
+            [job],
+            time_budget_ms=50,
+            timezone_name="America/El_Salvador",
+        )
+        # 09:30 UTC is 03:30 in El Salvador (UTC-6)
+        inside = datetime(2026, 2, 1, 9, 30, tzinfo=timezone.utc)
+
+        assert scheduler.run_due(datetime(2026, 2, 1, 3, 30, tzinfo=timezone.utc)) == []
+        results = scheduler.run_due(inside)
+        assert [(r["job"], r["outcome"]) for r in results] == [("noop", "ok")]
+        assert results[0]["duration_ms"] >= 0
+        assert calls == [0.05]
+        assert scheduler.run_due(inside + timedelta(minutes=30)) == []
+        assert len(scheduler.run_due(inside + timedelta(hours=1))) == 1
+
+    def test_jobs_run_on_open_tenant_databases(self, engine, tmp_path):
+        tenant_engine = create_engine(f"sqlite:///{tmp_path}/centro.db")
+        job = MaintenanceJob("noop", timedelta(hours=1), lambda conn, budget: {})
+        scheduler = MaintenanceScheduler(
+            engine,
+            [QuietWindow(dt_time(0, 0), dt_time(23, 59, 59))],
+            [job],
+            tenant_engines=lambda: [("centro", tenant_engine)],
+        )
+
+        results = scheduler.run_due(datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc))
+
+        assert [r.get("tenant") for r in results] == [None, "centro"]
+        tenant_engine.dispose()
+
+    def test_default_jobs_run(self, engine):
+        """Test that every default job succeeds and the busy timeout is restored."""
+        scheduler = MaintenanceScheduler(engine, [QuietWindow(dt_time(0, 0), dt_time(23, 59, 59))])
+
+        results = scheduler.run_due(datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc))
+
+        assert [r["job"] for r in results] == [
+            "optimize",
+            "analyze",
+            "incremental_vacuum",
+            "wal_checkpoint",
+        ]
+        assert all(r["outcome"] == "ok" for r in results)
+        with engine.connect() as conn:
+            # busy_timeout is restored on the pooled connection
+            assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+
+    def test_incremental_vacuum_frees_pages(self, engine):
+        """Test that free pages are released until none remain."""
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO t (payload) VALUES (:p)"), [{"p": "x" * 2000}] * 500)
+            conn.exec_driver_sql("DELETE FROM t")
+
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA freelist_count").scalar() > 0
+            result = incremental_vacuum(conn, budget_seconds=5)
+            assert result["pages_freed"] > 0
+            assert result["pages_remaining"] == 0
+
+    def test_wal_checkpoint(self, engine):
+        """Test that checkpoints only run in WAL mode and copy every frame back."""
+        with engine.connect() as conn:
+            assert wal_checkpoint(conn, 1) == {"skipped": "journal_mode is not WAL"}
+            conn.exec_driver_sql("PRAGMA journal_mode = WAL")
+            conn.exec_driver_sql("INSERT INTO t (payload) VALUES ('a')")
+            conn.commit()
+
+            result = wal_checkpoint(conn, 1)
+
+            assert result["busy"] is False
+            assert result["checkpointed_frames"] == result["wal_frames"]
+
+    def test_app_engines_use_wal(self, tmp_path: Path):
+        """Test that engines set up like the app's run in WAL, so checkpoints are not skipped."""
+        engine = use_wal(create_engine(f"sqlite:///{tmp_path / 'app.db'}"))
+        try:
+            init_db(engine)
+            with engine.connect() as conn:
+                assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+                # WAL must not cost new files incremental vacuum
+                assert conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2
+
+                result = wal_checkpoint(conn, 1)
+
+                assert "skipped" not in result
+                assert result["wal_frames"] > 0
+        finally:
+            engine.dispose()
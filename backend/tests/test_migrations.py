@@ -0,0 +1,101 @@
+"""Tests for in-place upgrades of databases created by earlier releases."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import Session
+
+from backend.database import init_db
+from backend.migrations import upgrade_schema
+from backend.models.order import Order, OrderChange, OrderChangeType, OrderStatus
+from backend.repositories import SqlAlchemyOrderRepository
+from backend.schemas.order import OrderItemCreate
+
+# The orders tables as the first release created them: decimal prices, no
+# version or transition timestamps
+OLD_SCHEMA = (
+    """
+    CREATE TABLE orders (
+        id INTEGER NOT NULL PRIMARY KEY,
+        table_number INTEGER NOT NULL,
+        status VARCHAR(11) NOT NULL,
+        created_at DATETIME NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE order_items (
+        id INTEGER NOT NULL PRIMARY KEY,
+        order_id INTEGER NOT NULL REFERENCES orders (id) ON DELETE CASCADE,
+        name VARCHAR(255) NOT NULL,
+        amount INTEGER NOT NULL,
+        price NUMERIC(10, 2) NOT NULL
+    )
+    """,
+    "INSERT INTO orders VALUES (1, 4, 'COMPLETED', '2026-01-15 12:00:00')",
+    "INSERT INTO orders VALUES (2, 5, 'PENDING', '2026-01-15 12:05:00')",
+    "INSERT INTO order_items VALUES (1, 1, 'Pupusa', 2, 1.15)",
+    "INSERT INTO order_items VALUES (2, 2, 'Horchata', 1, 2.50)",
+)
+
+
+@pytest.fixture
+def old_engine(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        for statement in OLD_SCHEMA:
+            conn.exec_driver_sql(statement)
+    yield engine
+    engine.dispose()
+
+
+def test_upgrades_old_tables_in_place(old_engine):
+    """Test that prices become cents and the new columns are added, keeping history."""
+    init_db(old_engine)
+
+    columns = {column["name"] for column in inspect(old_engine).get_columns("order_items")}
+    assert "price" not in columns
+    with Session(old_engine) as db:
+        repository = SqlAlchemyOrderRepository(db)
+        completed = repository.get(1)
+        assert completed.items[0].price_cents == 115
+        assert completed.total_cents == 230
+        assert completed.version == 1
+
+        # The upgraded tables accept writes through the current models
+        updated = repository.set_status(2, OrderStatus.IN_PROGRESS, expected_version=1)
+        assert updated.version == 2
+        created = repository.create(3, [OrderItemCreate(name="Pupusa", amount=1, price=1.15)])
+        assert created.total_cents == 115
+
+
+def test_transition_timestamps_come_from_the_change_log(old_engine):
+    """Test that orders get the time of their change log entry where there is one."""
+    OrderChange.__table__.create(old_engine)
+    changed_at = datetime(2026, 1, 15, 12, 30)
+    with Session(old_engine) as db:
+        db.add(
+            OrderChange(
+                order_id=1,
+                change=OrderChangeType.COMPLETED,
+                status=OrderStatus.COMPLETED,
+                changed_at=changed_at,
+            )
+        )
+        db.commit()
+
+    init_db(old_engine)
+
+    with Session(old_engine) as db:
+        assert db.get(Order, 1).completed_at.replace(tzinfo=None) == changed_at
+        assert db.get(Order, 2).completed_at is None
+
+
+def test_upgrade_is_idempotent(old_engine):
+    """Test that initialising an upgraded database again changes nothing."""
+    init_db(old_engine)
+    init_db(old_engine)
+
+    with old_engine.connect() as conn:
+        assert upgrade_schema(conn) == []
@@ -0,0 +1,164 @@
+"""Tests for the single-order endpoint and its read-through cache."""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from backend.models.order import OrderStatus
+from backend.order_cache import OrderCache, order_cache
+from backend.repositories import (
+    InMemoryOrderRepository,
+    OrderVersionConflictError,
+    get_order_repository,
+)
+from backend.schemas.order import OrderResponse
+
+
+def _order(version: int = 1, order_id: int = 1) -> OrderResponse:
+    return OrderResponse(
+        id=order_id,
+        table_number=1,
+        status="pending",
+        items=[],
+        total=0,
+        created_at="2026-01-31T19:45:00Z",
+        version=version,
+    )
+
+
+def _create(client: TestClient) -> int:
+    response = client.post(
+        "/api/v1/orders",
+        json={"table_number": 7, "items": [{"name": "Pupusa", "amount": 2, "price": 1.25}]},
+    )
+    return response.json()["id"]
+
+
+class TestGetOrder:
+    """Test GET /api/v1/orders/{order_id}."""
+
+    def test_miss_then_hit(self, client: TestClient):
+        """Test that the first read fills the cache and the second is served from it."""
+        order_id = _create(client)
+
+        first = client.get(f"/api/v1/orders/{order_id}")
+        second = client.get(f"/api/v1/orders/{order_id}")
+
+        assert first.status_code == 200
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.headers["ETag"] == '"1"'
+        assert second.json() == first.json()
+        assert first.json()["total"] == 2.50
+        assert first.json()["items"][0]["name"] == "Pupusa"
+
+    def test_not_found(self, client: TestClient):
+        response = client.get("/api/v1/orders/999")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Order with id 999 not found"
+
+    def test_mutations_write_through(self, client: TestClient):
+        """Test that a cached order reflects complete without a repository read."""
+        order_id = _create(client)
+        client.get(f"/api/v1/orders/{order_id}")
+
+        client.patch(f"/api/v1/orders/{order_id}/complete")
+        response = client.get(f"/api/v1/orders/{order_id}")
+
+        assert response.headers["X-Cache"] == "HIT"
+        assert response.json()["status"] == "completed"
+        assert response.json()["version"] == 2
+
+    def test_conflict_invalidates(self, client: TestClient, monkeypatch):
+        """Test that a write that lost a race drops the entry so the next read is fresh."""
+        repository = InMemoryOrderRepository()
+        client.app.dependency_overrides[get_order_repository] = lambda: repository
+        order_id = _create(client)
+        client.get(f"/api/v1/orders/{order_id}")
+
+        def lose_race(order_id, new_status, expected_version=None):
+            raise OrderVersionConflictError(order_id, expected_version, None)
+
+        monkeypatch.setattr(repository, "set_status", lose_race)
+        response = client.delete(f"/api/v1/orders/{order_id}")
+
+        assert response.status_code == 409
+        assert client.get(f"/api/v1/orders/{order_id}").headers["X-Cache"] == "MISS"
+        assert order_cache.stats()["invalidations"] == 1
+
+
+    def test_write_from_another_process_is_seen(self, client: TestClient):
+        """Test that a change this process did not make is never served from the cache."""
+        repository = InMemoryOrderRepository()
+        client.app.dependency_overrides[get_order_repository] = lambda: repository
+        order_id = _create(client)
+        client.get(f"/api/v1/orders/{order_id}")
+
+        repository.set_status(order_id, OrderStatus.CANCELLED)
+        response = client.get(f"/api/v1/orders/{order_id}")
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.json()["status"] == "cancelled"
+        assert client.get(f"/api/v1/orders/{order_id}").headers["X-Cache"] == "HIT"
+
+
+class TestOrderCache:
+    """Test OrderCache directly."""
+
+    def test_older_version_never_replaces_newer(self):
+        cache = OrderCache()
+        cache.put(1, _order(version=2))
+
+        cache.put(1, _order(version=1))
+
+        assert cache.get(1, 2).version == 2
+
+    def test_lru_eviction(self):
+        cache = OrderCache(max_entries=2)
+        cache.put(1, _order(order_id=1))
+        cache.put(2, _order(order_id=2))
+        cache.get(1, 1)
+
+        cache.put(3, _order(order_id=3))
+
+        assert cache.get(2, 1) is None
+        assert cache.get(1, 1) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_other_version_is_a_miss(self):
+        """Test that an entry built from another version is dropped, not served."""
+        cache = OrderCache()
+        cache.put(1, _order(version=1))
+
+        assert cache.get(1, 2) is None
+        assert cache.get(1, 1) is None
+        assert cache.stats()["misses"] == 2
+
+    def test_entries_expire(self):
+        cache = OrderCache(ttl_seconds=0.01)
+        cache.put(1, _order())
+        time.sleep(0.02)
+
+        assert cache.get(1, 1) is None
+
+    def test_stats_and_disabled_cache(self):
+        cache = OrderCache()
+        cache.get(1, 1)
+        cache.put(1, _order())
+        cache.get(1, 1)
+        assert cache.stats() | {"ttl_seconds": None} == {
+            "enabled": True,
+            "entries": 1,
+            "max_entries": 10_000,
+            "ttl_seconds": None,
+            "hits": 1,
+            "misses": 1,
+            "hit_ratio": 0.5,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+        disabled = OrderCache(max_entries=0)
+        disabled.put(1, _order())
+        assert disabled.get(1, 1) is None
@@ -0,0 +1,103 @@
+"""Tests for optimistic concurrency on order mutations."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.models.order import Order, OrderStatus
+from backend.repositories import OrderVersionConflictError, SqlAlchemyOrderRepository
+from backend.schemas.order import OrderItemCreate
+
+ITEMS = [OrderItemCreate(name="Pupusa", amount=2, price=1.50)]
+
+
+@pytest.fixture
+def order_id(client: TestClient) -> int:
+    response = client.post(
+        "/api/v1/orders",
+        json={"table_number": 4, "items": [{"name": "Pupusa", "amount": 2, "price": 1.50}]},
+    )
+    assert response.status_code == 201
+    assert response.json()["version"] == 1
+    assert response.headers["ETag"] == '"1"'
+    return response.json()["id"]
+
+
+class TestIfMatch:
+    """Test If-Match and expected_version on cancel and complete."""
+
+    def test_matching_version_applies_and_bumps_version(self, client: TestClient, order_id: int):
+        """Test that a current If-Match succeeds and returns the next version."""
+        response = client.patch(f"/api/v1/orders/{order_id}/complete", headers={"If-Match": '"1"'})
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "completed"
+        assert response.json()["version"] == 2
+        assert response.headers["ETag"] == '"2"'
+
+    def test_stale_if_match_conflicts(self, client: TestClient, order_id: int):
+        """Test that acting on an old version returns 409 and writes nothing."""
+        client.patch(f"/api/v1/orders/{order_id}/complete", headers={"If-Match": '"1"'})
+
+        response = client.delete(f"/api/v1/orders/{order_id}", headers={"If-Match": '"1"'})
+
+        assert response.status_code == 409
+        assert response.json()["detail"] == (
+            f"Order with id {order_id} was modified concurrently (expected version 1, current version 2)"
+        )
+        summary = client.get("/api/v1/orders/summary").json()
+        assert summary["counts"]["completed"] == 1
+        assert summary["counts"]["cancelled"] == 0
+
+    def test_stale_expected_version_conflicts(self, client: TestClient, order_id: int):
+        """Test the query parameter alternative to If-Match."""
+        response = client.patch(f"/api/v1/orders/{order_id}/complete?expected_version=3")
+
+        assert response.status_code == 409
+
+    @pytest.mark.parametrize("header", ['W/"1"', "1", "*"])
+    def test_accepted_if_match_forms(self, client: TestClient, order_id: int, header: str):
+        """Test weak tags, bare numbers and the wildcard."""
+        response = client.delete(f"/api/v1/orders/{order_id}", headers={"If-Match": header})
+
+        assert response.status_code == 200
+        assert response.json()["version"] == 2
+
+    def test_invalid_if_match(self, client: TestClient, order_id: int):
+        """Test that a malformed header is rejected before anything is read."""
+        response = client.delete(f"/api/v1/orders/{order_id}", headers={"If-Match": '"abc"'})
+
+        assert response.status_code == 400
+
+    def test_header_and_query_must_agree(self, client: TestClient, order_id: int):
+        """Test that contradictory preconditions are rejected."""
+        response = client.delete(
+            f"/api/v1/orders/{order_id}?expected_version=2", headers={"If-Match": '"1"'}
+        )
+
+        assert response.status_code == 400
+
+
+def test_concurrent_write_between_read_and_update(test_engine):
+    """Test that the versioned UPDATE catches a writer that commits after our read."""
+    factory = sessionmaker(autoflush=False, bind=test_engine)
+    with factory() as setup:
+        order_id = SqlAlchemyOrderRepository(setup).create(1, ITEMS).id
+
+    with factory() as tablet_a, factory() as tablet_b:
+        # Tablet A loads the order (version 1) ...
+        loaded = tablet_a.get(Order, order_id)
+        assert loaded.version == 1
+        # ... tablet B cancels it first ...
+        SqlAlchemyOrderRepository(tablet_b).set_status(order_id, OrderStatus.CANCELLED, expected_version=1)
+
+        # ... so A's write, still based on version 1, must not win
+        with pytest.raises(OrderVersionConflictError) as info:
+            SqlAlchemyOrderRepository(tablet_a).set_status(
+                order_id, OrderStatus.COMPLETED, expected_version=1
+            )
+        assert (info.value.expected, info.value.current) == (1, None)
+
+    with Session(test_engine) as db:
+        order = db.get(Order, order_id)
+        assert (order.status, order.version) == (OrderStatus.CANCELLED, 2)
@@ -19,14 +19,14 @@ class TestOrderModel:
         item1 = OrderItem(
             name="Burger",
             amount=2,
-            price=12.50,
+            price_cents=1250,
             order=order
         )
         
         item2 = OrderItem(
             name="Fries",
             amount=1,
-            price=5.00,
+            price_cents=500,
             order=order
         )
         
@@ -38,20 +38,20 @@ class TestOrderModel:
         assert order.table_number == 5
         assert order.status == OrderStatus.PENDING
         assert len(order.items) == 2
-        assert order.total == 30.00  # (2 * 12.50) + (1 * 5.00)
+        assert order.total_cents == 3000  # (2 * 12.50) + (1 * 5.00)
     
     def test_order_total_calculation(self, test_db: Session):
         """Test that order total is calculated correctly."""
         order = Order(table_number=3, status=OrderStatus.PENDING)
         
-        OrderItem(name="Pizza", amount=3, price=15.00, order=order)
-        OrderItem(name="Soda", amount=2, price=3.50, order=order)
+        OrderItem(name="Pizza", amount=3, price_cents=1500, order=order)
+        OrderItem(name="Soda", amount=2, price_cents=350, order=order)
         
         test_db.add(order)
         test_db.commit()
         test_db.refresh(order)
         
-        assert order.total == 52.00  # (3 * 15.00) + (2 * 3.50)
+        assert order.total_cents == 5200  # (3 * 15.00) + (2 * 3.50)
     
     def test_order_status_enum(self, test_db: Session):
         """Test order status transitions."""
@@ -160,6 +160,35 @@ class TestCreateOrderEndpoint:
         assert response.status_code == 422
 
 
+    def test_create_order_total_has_no_rounding_drift(self, client: TestClient):
+        """Test that totals are exact sums of integer cents."""
+        order_data = {
+            "table_number": 4,
+            "items": [
+                {"name": "Horchata", "amount": 3, "price": 0.10},
+                {"name": "Pupusa", "amount": 3, "price": 19.99}
+            ]
+        }
+        
+        response = client.post("/api/v1/orders", json=order_data)
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert data["total"] == 60.27
+        assert data["items"][0]["price"] == 0.10
+    
+    def test_create_order_price_too_precise(self, client: TestClient):
+        """Test that prices with more than 2 decimals fail validation."""
+        order_data = {
+            "table_number": 5,
+            "items": [{"name": "Salad", "amount": 1, "price": 1.005}]
+        }
+        
+        response = client.post("/api/v1/orders", json=order_data)
+        
+        assert response.status_code == 422
+
+
 class TestGetPendingOrdersEndpoint:
     """Test GET /api/v1/orders/pending endpoint."""
     
@@ -216,10 +245,10 @@ class TestGetPendingOrdersEndpoint:
         
         # Manually create orders with other statuses
         in_progress_order = Order(table_number=6, status=OrderStatus.IN_PROGRESS)
-        OrderItem(name="Pizza", amount=1, price=15.00, order=in_progress_order)
+        OrderItem(name="Pizza", amount=1, price_cents=1500, order=in_progress_order)
         
         ready_order = Order(table_number=7, status=OrderStatus.READY)
-        OrderItem(name="Pasta", amount=1, price=18.00, order=ready_order)
+        OrderItem(name="Pasta", amount=1, price_cents=1800, order=ready_order)
         
         test_db.add_all([in_progress_order, ready_order])
         test_db.commit()
@@ -262,6 +291,40 @@ class TestGetPendingOrdersEndpoint:
         assert len(order["items"]) == 2
 
 
+    def test_pending_orders_without_items(self, client: TestClient):
+        """Test the summary mode that skips item hydration."""
+        order_data = {
+            "table_number": 8,
+            "items": [
+                {"name": "Pupusa", "amount": 4, "price": 1.25},
+                {"name": "Horchata", "amount": 2, "price": 2.00}
+            ]
+        }
+        client.post("/api/v1/orders", json=order_data)
+        
+        response = client.get("/api/v1/orders/pending?include_items=false")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["items"] is None
+        assert data[0]["total"] == 9.00
+    
+    def test_pending_orders_totals_from_sql(self, client: TestClient, test_db: Session):
+        """Test that SQL-aggregated totals match per order, including empty orders."""
+        client.post("/api/v1/orders", json={
+            "table_number": 1,
+            "items": [{"name": "Coffee", "amount": 3, "price": 1.10}]
+        })
+        test_db.add(Order(table_number=2, status=OrderStatus.PENDING))
+        test_db.commit()
+        
+        response = client.get("/api/v1/orders/pending")
+        
+        totals = {order["table_number"]: order["total"] for order in response.json()}
+        assert totals == {1: 3.30, 2: 0.0}
+
+
 class TestCancelOrderEndpoint:
     """Test DELETE /api/v1/orders/{order_id} endpoint."""
     
@@ -296,7 +359,7 @@ class TestCancelOrderEndpoint:
         """Test that completed orders cannot be cancelled."""
         # Create and complete an order
         order = Order(table_number=5, status=OrderStatus.COMPLETED)
-        OrderItem(name="Burger", amount=1, price=12.50, order=order)
+        OrderItem(name="Burger", amount=1, price_cents=1250, order=order)
         test_db.add(order)
         test_db.commit()
         test_db.refresh(order)
@@ -311,7 +374,7 @@ class TestCancelOrderEndpoint:
         """Test that already cancelled orders cannot be cancelled again."""
         # Create a cancelled order
         order = Order(table_number=5, status=OrderStatus.CANCELLED)
-        OrderItem(name="Burger", amount=1, price=12.50, order=order)
+        OrderItem(name="Burger", amount=1, price_cents=1250, order=order)
         test_db.add(order)
         test_db.commit()
         test_db.refresh(order)
@@ -342,7 +405,7 @@ class TestCancelOrderEndpoint:
         """Test cancelling an in-progress order."""
         # Create an in-progress order
         order = Order(table_number=5, status=OrderStatus.IN_PROGRESS)
-        OrderItem(name="Burger", amount=1, price=12.50, order=order)
+        OrderItem(name="Burger", amount=1, price_cents=1250, order=order)
         test_db.add(order)
         test_db.commit()
         test_db.refresh(order)
@@ -379,7 +442,7 @@ class TestCompleteOrderEndpoint:
         """Test completing an order successfully."""
         # Create a ready order
         order = Order(table_number=5, status=OrderStatus.READY)
-        OrderItem(name="Burger", amount=1, price=12.50, order=order)
+        OrderItem(name="Burger", amount=1, price_cents=1250, order=order)
         test_db.add(order)
         test_db.commit()
         test_db.refresh(order)
@@ -404,7 +467,7 @@ class TestCompleteOrderEndpoint:
         """Test that already completed orders return success (idempotent)."""
         # Create a completed order
         order = Order(table_number=5, status=OrderStatus.COMPLETED)
-        OrderItem(name="Burger", amount=1, price=12.50, order=order)
+        OrderItem(name="Burger", amount=1, price_cents=1250, order=order)
         test_db.add(order)
         test_db.commit()
         test_db.refresh(order)
@@ -419,7 +482,7 @@ class TestCompleteOrderEndpoint:
         """Test that cancelled orders cannot be completed."""
         # Create a cancelled order
         order = Order(table_number=5, status=OrderStatus.CANCELLED)
-        OrderItem(name="Burger", amount=1, price=12.50, order=order)
+        OrderItem(name="Burger", amount=1, price_cents=1250, order=order)
         test_db.add(order)
         test_db.commit()
         test_db.refresh(order)
@@ -450,7 +513,7 @@ class TestCompleteOrderEndpoint:
         """Test completing an in-progress order."""
         # Create an in-progress order
         order = Order(table_number=5, status=OrderStatus.IN_PROGRESS)
-        OrderItem(name="Burger", amount=1, price=12.50, order=order)
+        OrderItem(name="Burger", amount=1, price_cents=1250, order=order)
         test_db.add(order)
         test_db.commit()
         test_db.refresh(order)
@@ -483,8 +546,8 @@ class TestCompleteOrderEndpoint:
         """Test that completing an order preserves all order data."""
         # Create an order with multiple items
         order = Order(table_number=10, status=OrderStatus.READY)
-        OrderItem(name="Burger", amount=2, price=12.50, order=order)
-        OrderItem(name="Fries", amount=1, price=5.00, order=order)
+        OrderItem(name="Burger", amount=2, price_cents=1250, order=order)
+        OrderItem(name="Fries", amount=1, price_cents=500, order=order)
         test_db.add(order)
         test_db.commit()
         test_db.refresh(order)
@@ -0,0 +1,108 @@
+"""Tests for opt-in request profiling."""
+
+import pstats
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.config import settings
+from backend.profiling import ProfileStore, ProfilingMiddleware
+from backend.routes import admin
+
+
+def _make_app(store: ProfileStore, enabled: bool, sample_rate: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/work", operation_id="do_work")
+    def do_work() -> dict[str, int]:
+        return {"total": sum(range(1000))}
+
+    app.add_middleware(
+        ProfilingMiddleware, store=store, enabled=enabled, sample_rate=sample_rate
+    )
+    return app
+
+
+class TestProfilingMiddleware:
+    """Test which requests get profiled."""
+
+    def test_sampled_request_writes_profile(self, tmp_path: Path):
+        """Test that a sampled request is dumped with its operation_id."""
+        store = ProfileStore(tmp_path, max_bytes=10_000_000)
+        client = TestClient(_make_app(store, enabled=True, sample_rate=1.0))
+
+        assert client.get("/api/v1/work").status_code == 200
+
+        profiles = store.list()
+        assert len(profiles) == 1
+        assert profiles[0].operation_id == "do_work"
+        stats = pstats.Stats(str(tmp_path / profiles[0].name))
+        assert any(func[2] == "do_work" for func in stats.stats)
+
+    def test_disabled_profiling_writes_nothing(self, tmp_path: Path):
+        """Test that nothing is written when sampling is off."""
+        store = ProfileStore(tmp_path, max_bytes=10_000_000)
+        client = TestClient(_make_app(store, enabled=False, sample_rate=1.0))
+
+        client.get("/api/v1/work")
+
+        assert store.list() == []
+
+    def test_header_requires_admin_token(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that X-Profile is only honored with a valid admin token."""
+        monkeypatch.setattr(settings, "admin_token", "secret")
+        store = ProfileStore(tmp_path, max_bytes=10_000_000)
+        client = TestClient(_make_app(store, enabled=False, sample_rate=0.0))
+
+        client.get("/api/v1/work", headers={"X-Profile": "1"})
+        client.get("/api/v1/work", headers={"X-Profile": "1", "X-Admin-Token": "wrong"})
+        assert store.list() == []
+
+        client.get("/api/v1/work", headers={"X-Profile": "1", "X-Admin-Token": "secret"})
+        assert len(store.list()) == 1
+
+
+class TestProfileStore:
+    """Test profile storage and rotation."""
+
+    def test_rotation_keeps_directory_under_limit(self, tmp_path: Path):
+        """Test that the oldest profiles are deleted first."""
+        for i in range(5):
+            (tmp_path / f"20260101T00000{i}000000Z_5ms_op{i}.prof").write_bytes(b"x" * 100)
+        store = ProfileStore(tmp_path, max_bytes=250)
+
+        assert store.rotate() == 3
+        assert [p.operation_id for p in store.list()] == ["op4", "op3"]
+
+    def test_path_for_rejects_traversal(self, tmp_path: Path):
+        """Test that only files inside the store resolve."""
+        store = ProfileStore(tmp_path / "profiles", max_bytes=1000)
+        (tmp_path / "secret.prof").write_bytes(b"x")
+
+        assert store.path_for("../secret.prof") is None
+        assert store.path_for("missing.prof") is None
+
+
+class TestProfileAdminEndpoints:
+    """Test GET /api/v1/admin/profiles endpoints."""
+
+    def test_list_and_download(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that stored profiles are listed and downloadable."""
+        name = "20260101T000000000000Z_12ms_create_order.prof"
+        (tmp_path / name).write_bytes(b"profile")
+        monkeypatch.setattr(admin.profile_store, "directory", tmp_path)
+        app = FastAPI()
+        app.include_router(admin.router, prefix="/api/v1")
+
+        with TestClient(app) as client:
+            listing = client.get("/api/v1/admin/profiles").json()
+            download = client.get(f"/api/v1/admin/profiles/{name}")
+            missing = client.get("/api/v1/admin/profiles/nope.prof")
+
+        assert listing[0]["operation_id"] == "create_order"
+        assert listing[0]["duration_ms"] == 12
+        assert download.status_code == 200
+        assert download.content == b"profile"
+        assert missing.status_code == 404
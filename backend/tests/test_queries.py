@@ -0,0 +1,51 @@
+"""Tests for the Core read path."""
+
+from sqlalchemy.orm import Session
+
+from backend.models.order import Order, OrderItem, OrderStatus
+from backend.queries import OrderRecord, fetch_orders_by_status
+
+
+def _add_order(db: Session, table_number: int, status: OrderStatus, items: list[tuple[str, int, int]]) -> Order:
+    order = Order(table_number=table_number, status=status)
+    for name, amount, price_cents in items:
+        OrderItem(name=name, amount=amount, price_cents=price_cents, order=order)
+    db.add(order)
+    db.commit()
+    return order
+
+
+class TestFetchOrdersByStatus:
+    """Test fetch_orders_by_status."""
+
+    def test_records_with_items_and_totals(self, test_db: Session):
+        """Test that items are attached to their orders and totals come from SQL."""
+        first = _add_order(test_db, 1, OrderStatus.PENDING, [("Pupusa", 2, 150), ("Horchata", 1, 200)])
+        second = _add_order(test_db, 2, OrderStatus.PENDING, [("Tamal", 3, 125)])
+        _add_order(test_db, 3, OrderStatus.COMPLETED, [("Atol", 1, 100)])
+
+        records = fetch_orders_by_status(test_db, OrderStatus.PENDING)
+
+        assert all(isinstance(record, OrderRecord) for record in records)
+        assert [r.id for r in records] == [first.id, second.id]
+        assert [r.total_cents for r in records] == [500, 375]
+        assert [item.name for item in records[0].items] == ["Pupusa", "Horchata"]
+        assert records[1].items[0].price_cents == 125
+
+    def test_without_items(self, test_db: Session):
+        """Test that include_items=False returns totals only."""
+        _add_order(test_db, 1, OrderStatus.PENDING, [("Pupusa", 2, 150)])
+
+        records = fetch_orders_by_status(test_db, OrderStatus.PENDING, include_items=False)
+
+        assert records[0].items == []
+        assert records[0].total_cents == 300
+
+    def test_does_not_populate_identity_map(self, test_db: Session):
+        """Test that the read path does not hydrate ORM instances."""
+        _add_order(test_db, 1, OrderStatus.PENDING, [("Pupusa", 1, 150)])
+        test_db.expunge_all()
+
+        fetch_orders_by_status(test_db, OrderStatus.PENDING)
+
+        assert len(test_db.identity_map) == 0
@@ -0,0 +1,113 @@
+"""Tests for SQL fingerprints, query timing aggregates and the slow-query log."""
+
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from backend.config import settings
+from backend.logging_config import JsonFormatter
+from backend.query_stats import QueryStats, fingerprint, query_stats
+from backend.request_context import current_operation_id
+from backend.routes import admin
+
+
+class TestFingerprint:
+    """Test SQL statement normalization."""
+
+    def test_literals_are_replaced(self):
+        """Test that string and number literals do not split fingerprints."""
+        assert fingerprint("SELECT * FROM orders WHERE id = 5 AND name = 'x''y'") == (
+            "SELECT * FROM orders WHERE id = ? AND name = ?"
+        )
+
+    def test_in_lists_collapse(self):
+        """Test that IN lists of any length share one fingerprint."""
+        short = fingerprint("SELECT * FROM order_items WHERE order_id IN (?, ?)")
+        long = fingerprint("SELECT *\n FROM order_items\n WHERE order_id IN (?, ?, ?, ?)")
+
+        assert short == long == "SELECT * FROM order_items WHERE order_id IN (...)"
+
+    def test_identifiers_with_digits_are_kept(self):
+        """Test that digits inside identifiers are not treated as literals."""
+        assert fingerprint("SELECT anon_1.id FROM t2") == "SELECT anon_1.id FROM t2"
+
+
+class TestQueryStats:
+    """Test per-fingerprint aggregates."""
+
+    def test_aggregates(self):
+        """Test count, total, max and p95."""
+        stats = QueryStats()
+        for duration in range(1, 101):
+            stats.record("SELECT ?", float(duration))
+
+        entry = stats.snapshot()[0]
+        assert entry["count"] == 100
+        assert entry["total_ms"] == 5050
+        assert entry["max_ms"] == 100
+        assert entry["p95_ms"] == 95
+
+    def test_sorted_by_total_and_bounded(self):
+        """Test ordering and the fingerprint cap."""
+        stats = QueryStats(max_fingerprints=2)
+        stats.record("a", 1.0)
+        stats.record("b", 10.0)
+        stats.record("c", 5.0)
+
+        assert [e["fingerprint"] for e in stats.snapshot()] == ["b", "c"]
+
+
+class TestQueryHooks:
+    """Test the SQLAlchemy cursor execute hooks."""
+
+    def test_statements_are_recorded(self, test_engine):
+        """Test that executed statements show up in the aggregates."""
+        query_stats.reset()
+        with test_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        entries = {e["fingerprint"]: e for e in query_stats.snapshot()}
+        assert entries["SELECT ?"]["count"] == 2
+
+    def test_slow_query_is_logged_with_route(
+        self, test_engine, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that statements over the threshold are logged with context."""
+        monkeypatch.setattr(settings, "slow_query_threshold_ms", 0.0)
+        token = current_operation_id.set("list_pending_orders")
+        try:
+            with caplog.at_level(logging.WARNING, logger="backend.slow_query"):
+                with test_engine.connect() as conn:
+                    conn.execute(text("SELECT 42"))
+        finally:
+            current_operation_id.reset(token)
+
+        record = next(r for r in caplog.records if r.name == "backend.slow_query")
+        assert record.fingerprint == "SELECT ?"
+        assert record.route == "list_pending_orders"
+        assert record.duration_ms >= 0
+        payload = json.loads(JsonFormatter().format(record))
+        assert payload["route"] == "list_pending_orders"
+        assert payload["fingerprint_id"] == record.fingerprint_id
+
+
+class TestQueryStatsAdminEndpoint:
+    """Test /api/v1/admin/queries endpoints."""
+
+    def test_list_and_reset(self):
+        """Test listing and resetting aggregates."""
+        query_stats.reset()
+        query_stats.record("SELECT ?", 3.0)
+        app = FastAPI()
+        app.include_router(admin.router, prefix="/api/v1")
+
+        with TestClient(app) as client:
+            data = client.get("/api/v1/admin/queries").json()
+            assert data[0]["fingerprint"] == "SELECT ?"
+            assert client.delete("/api/v1/admin/queries").status_code == 204
+            assert client.get("/api/v1/admin/queries").json() == []
@@ -0,0 +1,219 @@
+"""Tests for token-bucket rate limiting."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.config import settings
+from backend.main import create_app
+from backend.rate_limit import RateLimit, RateLimiter, RateLimitMiddleware
+from backend.routes import admin
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiter:
+    """Test the RateLimiter bucket logic."""
+
+    def test_burst_then_reject(self):
+        """Test that a client can spend its burst and is then limited."""
+        clock = FakeClock()
+        limiter = RateLimiter(RateLimit(rate=1.0, burst=2), clock=clock)
+
+        assert limiter.acquire("a", "create_order") == 0.0
+        assert limiter.acquire("a", "create_order") == 0.0
+        assert limiter.acquire("a", "create_order") == pytest.approx(1.0)
+
+    def test_refill_over_time(self):
+        """Test that tokens refill at the configured rate."""
+        clock = FakeClock()
+        limiter = RateLimiter(RateLimit(rate=2.0, burst=1), clock=clock)
+
+        assert limiter.acquire("a", "op") == 0.0
+        assert limiter.acquire("a", "op") == pytest.approx(0.5)
+        clock.now = 0.5
+        assert limiter.acquire("a", "op") == 0.0
+
+    def test_per_operation_limits_and_clients_are_independent(self):
+        """Test that buckets are keyed by client and operation."""
+        limiter = RateLimiter(
+            RateLimit(rate=1.0, burst=1),
+            limits={"list_pending_orders": RateLimit(rate=1.0, burst=3)},
+            clock=FakeClock(),
+        )
+
+        assert limiter.acquire("a", "create_order") == 0.0
+        assert limiter.acquire("a", "create_order") > 0
+        assert limiter.acquire("b", "create_order") == 0.0
+        for _ in range(3):
+            assert limiter.acquire("a", "list_pending_orders") == 0.0
+        assert limiter.acquire("a", "list_pending_orders") > 0
+
+    def test_zero_rate_disables_limit(self):
+        """Test that a rate of 0 lets every request through."""
+        limiter = RateLimiter(RateLimit(rate=0, burst=0), clock=FakeClock())
+
+        assert all(limiter.acquire("a", "op") == 0.0 for _ in range(100))
+
+    def test_idle_buckets_are_evicted(self):
+        """Test that idle buckets are dropped to bound memory."""
+        clock = FakeClock()
+        limiter = RateLimiter(RateLimit(rate=1.0, burst=1), idle_seconds=10, clock=clock)
+
+        limiter.acquire("a", "op")
+        limiter.acquire("b", "op")
+        clock.now = 11
+        limiter.acquire("c", "op")
+
+        stats = limiter.stats()
+        assert stats["active_buckets"] == 1
+        assert stats["evicted_buckets"] == 2
+
+    def test_max_buckets_evicts_least_recently_used(self):
+        """Test that the bucket count never exceeds the cap."""
+        limiter = RateLimiter(RateLimit(rate=1.0, burst=1), max_buckets=2, clock=FakeClock())
+
+        for client in ("a", "b", "c", "d"):
+            limiter.acquire(client, "op")
+
+        assert limiter.stats()["active_buckets"] == 2
+
+    def test_stats_counts_allowed_and_rejected(self):
+        """Test the exposed counters."""
+        limiter = RateLimiter(RateLimit(rate=1.0, burst=1), clock=FakeClock())
+        limiter.acquire("a", "op")
+        limiter.acquire("a", "op")
+
+        stats = limiter.stats()["operations"]["op"]
+        assert stats["allowed"] == 1
+        assert stats["rejected"] == 1
+
+
+@pytest.fixture
+def limited_client() -> TestClient:
+    """Create an app with a tight limit on one operation."""
+    app = FastAPI()
+
+    @app.get("/api/v1/ping", operation_id="ping")
+    def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/health")
+    def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    limiter = RateLimiter(
+        RateLimit(rate=100.0, burst=100),
+        limits={"ping": RateLimit(rate=0.5, burst=2)},
+    )
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=limiter,
+        api_keys=["tablet-1"],
+        trust_forwarded_for=True,
+    )
+    return TestClient(app)
+
+
+class TestRateLimitMiddleware:
+    """Test the ASGI middleware."""
+
+    def test_returns_429_with_retry_after(self, limited_client: TestClient):
+        """Test that an exhausted bucket returns 429 and Retry-After."""
+        assert limited_client.get("/api/v1/ping").status_code == 200
+        assert limited_client.get("/api/v1/ping").status_code == 200
+
+        response = limited_client.get("/api/v1/ping")
+
+        assert response.status_code == 429
+        assert response.json() == {"detail": "Rate limit exceeded"}
+        assert int(response.headers["Retry-After"]) >= 1
+
+    def test_api_key_gets_its_own_bucket(self, limited_client: TestClient):
+        """Test that clients are keyed by API key when one is sent."""
+        for _ in range(2):
+            limited_client.get("/api/v1/ping")
+
+        response = limited_client.get("/api/v1/ping", headers={"X-API-Key": "tablet-1"})
+
+        assert response.status_code == 200
+
+    def test_unknown_api_keys_share_the_ip_bucket(self, limited_client: TestClient):
+        """Test that inventing a key per request does not get around the limit."""
+        for attempt in range(2):
+            limited_client.get("/api/v1/ping", headers={"X-API-Key": f"made-up-{attempt}"})
+
+        response = limited_client.get("/api/v1/ping", headers={"X-API-Key": "made-up-2"})
+
+        assert response.status_code == 429
+
+    def test_forwarded_for_uses_entry_added_by_proxy(self, limited_client: TestClient):
+        """Test that client-supplied X-Forwarded-For entries are ignored."""
+        for attempt in range(2):
+            limited_client.get(
+                "/api/v1/ping", headers={"X-Forwarded-For": f"10.0.0.{attempt}, 203.0.113.7"}
+            )
+
+        spoofed = limited_client.get(
+            "/api/v1/ping", headers={"X-Forwarded-For": "10.0.0.9, 203.0.113.7"}
+        )
+        other_client = limited_client.get(
+            "/api/v1/ping", headers={"X-Forwarded-For": "203.0.113.8"}
+        )
+
+        assert spoofed.status_code == 429
+        assert other_client.status_code == 200
+
+    def test_paths_outside_api_are_not_limited(self, limited_client: TestClient):
+        """Test that health probes bypass the limiter."""
+        assert all(limited_client.get("/health").status_code == 200 for _ in range(5))
+
+
+def test_cors_exposes_retry_after():
+    """Test that browser clients may read the limiter's Retry-After header."""
+    # No lifespan: /health needs neither the database nor background tasks
+    client = TestClient(create_app())
+
+    response = client.get("/health", headers={"Origin": settings.cors_origins[0]})
+
+    exposed = response.headers["Access-Control-Expose-Headers"]
+    assert "Retry-After" in [name.strip() for name in exposed.split(",")]
+
+
+class TestRateLimitAdminEndpoint:
+    """Test GET /api/v1/admin/rate-limits endpoint."""
+
+    def test_stats_endpoint(self):
+        """Test that counters are exposed."""
+        app = FastAPI()
+        app.include_router(admin.router, prefix="/api/v1")
+
+        with TestClient(app) as client:
+            response = client.get("/api/v1/admin/rate-limits")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "active_buckets" in data
+        assert "create_order" in data["operations"]
+
+    def test_stats_endpoint_requires_admin_token(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that the admin token is enforced once configured."""
+        monkeypatch.setattr(settings, "admin_token", "secret")
+        app = FastAPI()
+        app.include_router(admin.router, prefix="/api/v1")
+
+        with TestClient(app) as client:
+            assert client.get("/api/v1/admin/rate-limits").status_code == 403
+            response = client.get(
+                "/api/v1/admin/rate-limits", headers={"X-Admin-Token": "secret"}
+            )
+
+        assert response.status_code == 200
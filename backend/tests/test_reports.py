@@ -0,0 +1,120 @@
+"""Tests for prep-time sketches and the prep-time report."""
+
+import random
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.prep_times import prep_seconds
+from backend.sketches import QuantileSketch
+
+
+def _exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    """Test QuantileSketch accuracy and merging."""
+
+    @pytest.mark.parametrize("q", [0.5, 0.9, 0.99])
+    def test_relative_accuracy(self, q: float):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(6.5, 0.6) for _ in range(20_000)]
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+
+        assert sketch.quantile(q) == pytest.approx(_exact(values, q), rel=0.01)
+
+    def test_merge_equals_union(self):
+        rng = random.Random(3)
+        lunch = [rng.uniform(300, 1500) for _ in range(500)]
+        dinner = [rng.uniform(600, 2400) for _ in range(500)]
+        merged, union = QuantileSketch(), QuantileSketch()
+        for values in (lunch, dinner):
+            part = QuantileSketch()
+            for value in values:
+                part.add(value)
+                union.add(value)
+            merged.merge(part)
+
+        assert merged.buckets == union.buckets
+        assert merged.count == 1000
+        assert merged.quantile(0.9) == union.quantile(0.9)
+
+    def test_small_values_and_empty(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) is None
+
+        sketch.add(0.0)
+        assert sketch.quantile(0.5) == pytest.approx(1.0, rel=0.01)
+
+    def test_round_trip_through_buckets(self):
+        sketch = QuantileSketch()
+        for value in (30, 300, 3000):
+            sketch.add(value)
+
+        rebuilt = QuantileSketch.from_buckets(sketch.buckets.items())
+        assert rebuilt.quantile(0.5) == sketch.quantile(0.5)
+        assert rebuilt.count == 3
+
+
+def test_prep_seconds_prefers_started_at():
+    created = datetime(2026, 1, 31, 12, 0)
+    started = datetime(2026, 1, 31, 12, 5, tzinfo=timezone.utc)
+    done = datetime(2026, 1, 31, 12, 20, tzinfo=timezone.utc)
+
+    assert prep_seconds(created, None, done) == 1200
+    assert prep_seconds(created, started, done) == 900
+    assert prep_seconds(created, None, created - timedelta(seconds=5)) == 0
+
+
+class TestPrepTimesEndpoint:
+    """Test GET /api/v1/reports/prep-times."""
+
+    def _complete_order(self, client: TestClient, *names: str) -> None:
+        order_id = client.post(
+            "/api/v1/orders",
+            json={"table_number": 4, "items": [{"name": n, "amount": 1, "price": 1.0} for n in names]},
+        ).json()["id"]
+        client.patch(f"/api/v1/orders/{order_id}/complete")
+
+    def test_report(self, client: TestClient):
+        self._complete_order(client, "Pupusa revuelta", "Horchata")
+        self._complete_order(client, "Pupusa revuelta")
+        cancelled = client.post(
+            "/api/v1/orders",
+            json={"table_number": 5, "items": [{"name": "Yuca frita", "amount": 1, "price": 3.0}]},
+        ).json()["id"]
+        client.delete(f"/api/v1/orders/{cancelled}")
+
+        response = client.get("/api/v1/reports/prep-times?from=2000-01-01&to=2100-01-01")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["from"] == "2000-01-01"
+        assert body["to"] == "2100-01-01"
+        assert body["overall"]["count"] == 2
+        assert body["overall"]["p50_seconds"] <= body["overall"]["p99_seconds"]
+        assert sum(hour["count"] for hour in body["by_hour"]) == 2
+        assert {item["name"]: item["count"] for item in body["by_item"]} == {
+            "Pupusa revuelta": 2,
+            "Horchata": 1,
+        }
+
+    def test_default_range_ends_today(self, client: TestClient):
+        body = client.get("/api/v1/reports/prep-times").json()
+
+        end = date.fromisoformat(body["to"])
+        assert date.fromisoformat(body["from"]) == end - timedelta(days=29)
+        assert body["overall"] is None
+        assert body["by_hour"] == []
+        assert body["by_item"] == []
+
+    def test_invalid_range(self, client: TestClient):
+        response = client.get("/api/v1/reports/prep-times?from=2026-02-01&to=2026-01-01")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "`from` must not be later than `to`"
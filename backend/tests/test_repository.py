@@ -0,0 +1,275 @@
+"""Contract tests run against every OrderRepository implementation."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from backend.models.order import OrderChangeType, OrderStatus
+from backend.repositories import (
+    InMemoryOrderRepository,
+    InvalidStatusTransitionError,
+    OrderNotFoundError,
+    OrderRepository,
+    OrderVersionConflictError,
+    SqlAlchemyOrderRepository,
+    get_order_repository,
+)
+from backend.schemas.order import OrderItemCreate
+
+
+@pytest.fixture(params=["sqlalchemy", "memory"])
+def repository(request, test_db: Session) -> OrderRepository:
+    if request.param == "memory":
+        return InMemoryOrderRepository()
+    return SqlAlchemyOrderRepository(test_db)
+
+
+def _items(*prices: float) -> list[OrderItemCreate]:
+    return [OrderItemCreate(name=f"Dish {i}", amount=2, price=price) for i, price in enumerate(prices)]
+
+
+class TestOrderRepositoryContract:
+    """Behaviour every repository must share."""
+
+    def test_create_and_get(self, repository: OrderRepository):
+        """Test that a created order round-trips with items and total."""
+        created = repository.create(5, _items(1.50, 2.25))
+
+        fetched = repository.get(created.id)
+
+        assert fetched == created
+        assert fetched.status == OrderStatus.PENDING
+        assert fetched.total_cents == 750
+        assert [(i.name, i.amount, i.price_cents) for i in fetched.items] == [
+            ("Dish 0", 2, 150),
+            ("Dish 1", 2, 225),
+        ]
+        assert repository.get(created.id + 100) is None
+
+    def test_list_by_status_oldest_first(self, repository: OrderRepository):
+        """Test status filtering, ordering and include_items."""
+        first = repository.create(1, _items(1.00))
+        second = repository.create(2, _items(2.00))
+        third = repository.create(3, _items(3.00))
+        repository.set_status(second.id, OrderStatus.CANCELLED)
+
+        pending = repository.list_by_status(OrderStatus.PENDING)
+        totals_only = repository.list_by_status(OrderStatus.PENDING, include_items=False)
+
+        assert [o.id for o in pending] == [first.id, third.id]
+        assert all(o.items for o in pending)
+        assert [(o.id, o.total_cents, o.items) for o in totals_only] == [
+            (first.id, 200, []),
+            (third.id, 600, []),
+        ]
+        assert [o.id for o in repository.list_by_status(OrderStatus.CANCELLED)] == [second.id]
+
+    def test_set_status(self, repository: OrderRepository):
+        """Test that transitions are applied and unknown orders raise."""
+        order = repository.create(1, _items(1.00))
+
+        completed = repository.set_status(order.id, OrderStatus.COMPLETED)
+
+        assert completed.status == OrderStatus.COMPLETED
+        assert repository.get(order.id).status == OrderStatus.COMPLETED
+        with pytest.raises(OrderNotFoundError):
+            repository.set_status(order.id + 100, OrderStatus.CANCELLED)
+
+    def test_versions(self, repository: OrderRepository):
+        """Test that each mutation bumps the version and stale writes conflict."""
+        order = repository.create(1, _items(1.00))
+        assert order.version == 1
+
+        cancelled = repository.set_status(order.id, OrderStatus.CANCELLED, expected_version=1)
+
+        assert cancelled.version == 2
+        assert repository.get(order.id).version == 2
+        assert repository.get_version(order.id) == 2
+        assert repository.get_version(order.id + 100) is None
+        with pytest.raises(OrderVersionConflictError) as info:
+            repository.set_status(order.id, OrderStatus.COMPLETED, expected_version=1)
+        assert (info.value.expected, info.value.current) == (1, 2)
+        assert repository.get(order.id).status == OrderStatus.CANCELLED
+
+    def test_kitchen_transitions(self, repository: OrderRepository):
+        """Test that every forward status is supported and moving back to pending is rejected."""
+        order = repository.create(1, _items(1.00))
+
+        started = repository.set_status(order.id, OrderStatus.IN_PROGRESS)
+        ready = repository.set_status(order.id, OrderStatus.READY, expected_version=2)
+
+        assert (started.status, ready.status, ready.version) == (
+            OrderStatus.IN_PROGRESS,
+            OrderStatus.READY,
+            3,
+        )
+        changes = [c.change for c in repository.list_changes(0, 10)]
+        assert changes[-2:] == [OrderChangeType.STARTED, OrderChangeType.READY]
+        assert sum(s.count for s in repository.prep_time_sketches(date.min, date.max).values()) > 0
+        with pytest.raises(InvalidStatusTransitionError):
+            repository.set_status(order.id, OrderStatus.PENDING)
+        assert repository.get(order.id).status == OrderStatus.READY
+
+    def test_returned_records_are_copies(self, repository: OrderRepository):
+        """Test that callers cannot mutate stored state through a record."""
+        order = repository.create(1, _items(1.00))
+        order.items.clear()
+        order.status = OrderStatus.CANCELLED
+
+        assert len(repository.get(order.id).items) == 1
+        assert repository.get(order.id).status == OrderStatus.PENDING
+
+    def test_tables(self, repository: OrderRepository):
+        """Test per-table open orders and open tabs."""
+        a = repository.create(4, _items(1.00))
+        b = repository.create(4, _items(2.00))
+        repository.create(9, _items(5.00))
+        closed = repository.create(4, _items(7.00))
+        repository.set_status(closed.id, OrderStatus.COMPLETED)
+        only_closed = repository.create(6, _items(1.00))
+        repository.set_status(only_closed.id, OrderStatus.CANCELLED)
+
+        assert [o.id for o in repository.list_for_table(4)] == [a.id, b.id]
+        assert repository.list_for_table(6) == []
+        tabs = repository.open_tabs()
+        assert [(t.table_number, t.order_count, t.total_cents) for t in tabs] == [
+            (4, 2, 600),
+            (9, 1, 1000),
+        ]
+        assert tabs[0].oldest_created_at == a.created_at
+
+    def test_change_log(self, repository: OrderRepository):
+        """Test that every mutation appends a change with a contiguous cursor."""
+        assert repository.oldest_change_seq() is None
+        assert list(repository.list_changes(0, 10)) == []
+
+        first = repository.create(1, _items(1.00))
+        second = repository.create(2, _items(1.00))
+        repository.set_status(first.id, OrderStatus.CANCELLED)
+        repository.set_status(second.id, OrderStatus.COMPLETED)
+
+        changes = list(repository.list_changes(0, 10))
+        assert [(c.order_id, c.change, c.status) for c in changes] == [
+            (first.id, OrderChangeType.CREATED, OrderStatus.PENDING),
+            (second.id, OrderChangeType.CREATED, OrderStatus.PENDING),
+            (first.id, OrderChangeType.CANCELLED, OrderStatus.CANCELLED),
+            (second.id, OrderChangeType.COMPLETED, OrderStatus.COMPLETED),
+        ]
+        assert changes[0].payload["total"] == 2.00
+        assert changes[2].payload is None
+        assert repository.oldest_change_seq() == changes[0].seq
+        assert [c.seq for c in repository.list_changes(changes[1].seq, 1)] == [changes[2].seq]
+
+    def test_summary(self, repository: OrderRepository):
+        """Test counters, oldest active order and today's revenue."""
+        first = repository.create(1, _items(1.00))
+        second = repository.create(2, _items(4.50))
+        repository.set_status(first.id, OrderStatus.CANCELLED)
+        repository.create(3, _items(1.00))
+        repository.set_status(second.id, OrderStatus.COMPLETED)
+
+        summary = repository.summary()
+
+        assert summary["counts"][OrderStatus.PENDING] == 1
+        assert summary["counts"][OrderStatus.CANCELLED] == 1
+        assert summary["counts"][OrderStatus.COMPLETED] == 1
+        assert summary["counts"][OrderStatus.READY] == 0
+        assert summary["revenue_cents"] == 900
+        assert summary["completed_orders"] == 1
+        assert summary["oldest_active_created_at"] == repository.list_by_status(OrderStatus.PENDING)[0].created_at
+
+    def test_iter_export(self, repository: OrderRepository):
+        """Test that export streams every order by id, honouring the range."""
+        orders = [repository.create(i, _items(1.00, 2.00)) for i in range(1, 6)]
+        repository.set_status(orders[0].id, OrderStatus.COMPLETED)
+
+        exported = list(repository.iter_export(None, None, batch_size=2))
+
+        assert [o.id for o in exported] == [o.id for o in orders]
+        assert all(len(o.items) == 2 for o in exported)
+        assert exported[0].status == OrderStatus.COMPLETED
+        after_all = orders[-1].created_at + timedelta(seconds=1)
+        assert list(repository.iter_export(after_all, None, batch_size=2)) == []
+        assert len(list(repository.iter_export(None, after_all, batch_size=2))) == 5
+
+    def test_prep_list(self, repository: OrderRepository):
+        """Test that dish quantities follow orders in and out of the active statuses."""
+        first = repository.create(
+            1,
+            [
+                OrderItemCreate(name="Revuelta", amount=4, price=1.00),
+                OrderItemCreate(name="Horchata", amount=2, price=1.50),
+            ],
+        )
+        second = repository.create(
+            2,
+            [
+                OrderItemCreate(name="Revuelta", amount=3, price=1.00),
+                OrderItemCreate(name="Queso", amount=3, price=1.00),
+            ],
+        )
+        assert repository.prep_list() == [("Revuelta", 7), ("Queso", 3), ("Horchata", 2)]
+
+        repository.set_status(first.id, OrderStatus.COMPLETED)
+        assert repository.prep_list() == [("Queso", 3), ("Revuelta", 3)]
+
+        repository.set_status(second.id, OrderStatus.CANCELLED)
+        assert repository.prep_list() == []
+
+    def test_prep_time_sketches(self, repository: OrderRepository):
+        """Test that finished orders feed the prep-time sketches and cancelled ones do not."""
+        done = repository.create(
+            1,
+            [
+                OrderItemCreate(name="Revuelta", amount=4, price=1.00),
+                OrderItemCreate(name="Horchata", amount=2, price=1.50),
+            ],
+        )
+        cancelled = repository.create(2, [OrderItemCreate(name="Queso", amount=1, price=1.00)])
+        repository.set_status(done.id, OrderStatus.COMPLETED)
+        repository.set_status(cancelled.id, OrderStatus.CANCELLED)
+
+        sketches = repository.prep_time_sketches(date.min, date.max)
+        assert sorted(key for dimension, key in sketches if dimension == "item") == [
+            "Horchata",
+            "Revuelta",
+        ]
+        assert [dimension for dimension, _ in sketches].count("hour") == 1
+        assert ("all", "") in sketches
+        assert all(sketch.count == 1 for sketch in sketches.values())
+        assert sketches[("all", "")].quantile(0.5) < 60
+        assert repository.prep_time_sketches(date(2000, 1, 1), date(2000, 1, 2)) == {}
+
+
+def test_memory_change_log_retention():
+    """Test that the in-memory log compacts old entries but keeps the newest."""
+    repository = InMemoryOrderRepository(change_log_retention=timedelta(0))
+    repository.create(1, _items(1.00))
+    repository.create(2, _items(1.00))
+
+    assert [c.seq for c in repository.list_changes(0, 10)] == [2]
+
+
+def test_api_on_memory_repository(client: TestClient):
+    """Test that the HTTP API runs unchanged on the in-memory repository."""
+    memory = InMemoryOrderRepository()
+    client.app.dependency_overrides[get_order_repository] = lambda: memory
+
+    created = client.post(
+        "/api/v1/orders",
+        json={"table_number": 3, "items": [{"name": "Pupusa", "amount": 3, "price": 1.25}]},
+    )
+    assert created.status_code == 201
+    order_id = created.json()["id"]
+
+    assert client.get("/api/v1/orders/pending").json()[0]["total"] == 3.75
+    assert client.get("/api/v1/tables/3/orders").json()["total"] == 3.75
+    assert client.patch(f"/api/v1/orders/{order_id}/complete").json()["status"] == "completed"
+    assert client.delete(f"/api/v1/orders/{order_id}").status_code == 400
+    assert client.delete("/api/v1/orders/999").status_code == 404
+    assert client.get("/api/v1/orders/summary").json()["revenue_today"] == 3.75
+    assert len(client.get("/api/v1/orders/changes").json()["changes"]) == 2
+    assert client.get("/api/v1/orders/export").text.count("\n") == 1
+    assert isinstance(memory.get(order_id).created_at, datetime)
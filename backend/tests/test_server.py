@@ -0,0 +1,74 @@
+"""Tests for the production server configuration."""
+
+import pytest
+
+from backend import server
+from backend.config import Settings
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(_env_file=None, **overrides)
+
+
+class TestBuildConfig:
+    """Test build_config and its resolvers."""
+
+    def test_defaults(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(server.os, "process_cpu_count", lambda: 6)
+
+        config = server.build_config(_settings(port=9000, server_limit_concurrency=200))
+
+        assert config["workers"] == 1
+        assert config["port"] == 9000
+        assert config["reload"] is False
+        assert config["backlog"] == 2048
+        assert config["timeout_keep_alive"] == 5
+        assert config["limit_concurrency"] == 200
+        assert config["h11_max_incomplete_event_size"] == 16 * 1024
+        assert config["log_config"] is None
+
+    def test_explicit_workers(self):
+        assert server.resolve_workers(_settings(server_workers=3)) == 3
+
+    def test_auto_workers(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that 0 means one per usable CPU, except on SQLite."""
+        monkeypatch.setattr(server, "usable_cpus", lambda: 6)
+
+        assert server.resolve_workers(_settings(server_workers=0)) == 1
+        postgres = _settings(server_workers=0, database_url="postgresql://db/orders")
+        assert server.resolve_workers(postgres) == 6
+
+    def test_usable_cpus_honours_cgroup_quota(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+        monkeypatch.setattr(server.os, "process_cpu_count", lambda: 64)
+        cpu_max = tmp_path / "cpu.max"
+        real_open = open
+
+        def fake_open(path, *args, **kwargs):
+            if path == "/sys/fs/cgroup/cpu.max":
+                return real_open(cpu_max, *args, **kwargs)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", fake_open)
+
+        cpu_max.write_text("200000 100000\n")
+        assert server.usable_cpus() == 2
+        cpu_max.write_text("max 100000\n")
+        assert server.usable_cpus() == 64
+
+    def test_single_worker_for_memory_repository_and_reload(self):
+        assert server.resolve_workers(_settings(server_workers=4, order_repository="memory")) == 1
+        assert server.resolve_workers(_settings(server_workers=4, debug=True)) == 1
+
+    def test_auto_prefers_fast_implementations(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(server, "_installed", lambda module: True)
+        assert server.resolve_implementation("auto", "uvloop", "asyncio") == "uvloop"
+
+        monkeypatch.setattr(server, "_installed", lambda module: False)
+        assert server.resolve_implementation("auto", "httptools", "h11") == "h11"
+        assert server.resolve_implementation("h11", "httptools", "h11") == "h11"
+
+    def test_explicit_missing_implementation_fails(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(server, "_installed", lambda module: False)
+
+        with pytest.raises(RuntimeError, match="uvloop"):
+            server.resolve_implementation("uvloop", "uvloop", "asyncio")
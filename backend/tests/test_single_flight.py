@@ -0,0 +1,168 @@
+"""Tests for single-flight coalescing of the pending-orders list."""
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.config import settings
+from backend.single_flight import SingleFlight, pending_orders_flight
+
+
+def _run_concurrently(flight: SingleFlight, fn, callers: int) -> list:
+    results = [None] * callers
+
+    def worker(index: int) -> None:
+        try:
+            results[index] = flight.do("key", fn)
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    """Test the SingleFlight primitive."""
+
+    def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            release.wait(timeout=5)
+            return "body"
+
+        threading.Timer(0.2, release.set).start()
+        results = _run_concurrently(flight, slow, callers=8)
+
+        assert len(calls) == 1
+        assert [result for result, _ in results] == ["body"] * 8
+        outcomes = sorted(outcome for _, outcome in results)
+        assert outcomes == ["joined"] * 7 + ["leader"]
+        assert flight.stats()["executions"] == 1
+        assert flight.stats()["joined"] == 7
+        assert flight.stats()["in_flight"] == 0
+
+    def test_error_reaches_every_waiter(self):
+        flight = SingleFlight(ttl_seconds=10)
+        release = threading.Event()
+
+        def failing():
+            release.wait(timeout=5)
+            raise RuntimeError("database is locked")
+
+        threading.Timer(0.2, release.set).start()
+        results = _run_concurrently(flight, failing, callers=4)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        # Failures are never kept
+        assert flight.do("key", lambda: "ok") == ("ok", "leader")
+
+    def test_result_kept_for_ttl(self):
+        flight = SingleFlight(ttl_seconds=0.1)
+
+        assert flight.do("key", lambda: 1) == (1, "leader")
+        assert flight.do("key", lambda: 2) == (1, "cached")
+        assert flight.do("other", lambda: 3) == (3, "leader")
+        time.sleep(0.15)
+        assert flight.do("key", lambda: 4) == (4, "leader")
+
+    def test_without_ttl_nothing_is_kept(self):
+        flight = SingleFlight()
+
+        assert flight.do("key", lambda: 1) == (1, "leader")
+        assert flight.do("key", lambda: 2) == (2, "leader")
+
+    def test_invalidate_during_flight_discards_result(self):
+        """Test that a result computed across a write answers its caller but is not kept."""
+        flight = SingleFlight(ttl_seconds=10)
+
+        def racing_write():
+            flight.invalidate()
+            return "stale"
+
+        assert flight.do("key", racing_write) == ("stale", "leader")
+        assert flight.do("key", lambda: "fresh") == ("fresh", "leader")
+        assert flight.do("key", lambda: "later") == ("fresh", "cached")
+
+    def test_write_during_flight_starts_new_leader(self):
+        """Test that a caller arriving after a write does not join a call that read before it."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        results = {}
+
+        def before_write():
+            started.set()
+            release.wait(timeout=5)
+            return "before"
+
+        old_leader = threading.Thread(
+            target=lambda: results.setdefault("old", flight.do("key", before_write))
+        )
+        old_leader.start()
+        started.wait(timeout=5)
+
+        flight.invalidate()
+        results["new"] = flight.do("key", lambda: "after")
+        release.set()
+        old_leader.join()
+
+        assert results["new"] == ("after", "leader")
+        assert results["old"] == ("before", "leader")
+        assert flight.stats()["in_flight"] == 0
+
+
+class TestPendingOrdersCoalescing:
+    """Test coalescing on GET /api/v1/orders/pending."""
+
+    @pytest.fixture(autouse=True)
+    def _ttl(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "pending_orders_coalescing", True)
+        monkeypatch.setattr(pending_orders_flight, "ttl_seconds", 10.0)
+
+    def test_repeated_poll_is_served_from_result(self, client: TestClient):
+        first = client.get("/api/v1/orders/pending")
+        second = client.get("/api/v1/orders/pending")
+
+        assert first.headers["X-Single-Flight"] == "leader"
+        assert second.headers["X-Single-Flight"] == "cached"
+        assert second.content == first.content
+
+    def test_include_items_is_a_separate_key(self, client: TestClient):
+        client.get("/api/v1/orders/pending")
+        response = client.get("/api/v1/orders/pending?include_items=false")
+
+        assert response.headers["X-Single-Flight"] == "leader"
+
+    def test_writes_are_visible_immediately(self, client: TestClient):
+        """Test that create, cancel and complete invalidate the kept result."""
+        assert client.get("/api/v1/orders/pending").json() == []
+
+        created = client.post(
+            "/api/v1/orders",
+            json={"table_number": 3, "items": [{"name": "Pupusa", "amount": 1, "price": 1.0}]},
+        ).json()
+        listed = client.get("/api/v1/orders/pending")
+        assert listed.headers["X-Single-Flight"] == "leader"
+        assert [order["id"] for order in listed.json()] == [created["id"]]
+        assert listed.json()[0]["total"] == 1.0
+
+        client.delete(f"/api/v1/orders/{created['id']}")
+        assert client.get("/api/v1/orders/pending").json() == []
+
+    def test_disabled(self, client: TestClient, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "pending_orders_coalescing", False)
+
+        client.get("/api/v1/orders/pending")
+        response = client.get("/api/v1/orders/pending")
+
+        assert response.headers["X-Single-Flight"] == "leader"
@@ -0,0 +1,121 @@
+"""Tests for the kitchen dashboard summary counters."""
+
+from datetime import date, datetime, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from backend.config import settings
+from backend.counters import backfill_status_counts, business_day, read_summary
+from backend.models.order import Order, OrderStatus
+
+
+def _create_order(client: TestClient, price: float = 2.50, amount: int = 2) -> int:
+    response = client.post(
+        "/api/v1/orders",
+        json={"table_number": 4, "items": [{"name": "Taco", "amount": amount, "price": price}]},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+class TestOrderSummaryEndpoint:
+    """Test GET /api/v1/orders/summary endpoint."""
+
+    def test_summary_empty(self, client: TestClient):
+        """Test that every status is reported even with no orders."""
+        response = client.get("/api/v1/orders/summary")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["counts"] == {s.value: 0 for s in OrderStatus}
+        assert data["active_orders"] == 0
+        assert data["oldest_active_created_at"] is None
+        assert data["oldest_active_age_seconds"] is None
+        assert data["revenue_today"] == 0
+        assert data["completed_today"] == 0
+
+    def test_summary_follows_transitions(self, client: TestClient):
+        """Test that create, cancel and complete move the counters."""
+        first = _create_order(client)
+        second = _create_order(client, price=10.25, amount=3)
+        third = _create_order(client)
+        client.delete(f"/api/v1/orders/{first}")
+        client.patch(f"/api/v1/orders/{second}/complete")
+        # Idempotent completion must not count revenue twice
+        client.patch(f"/api/v1/orders/{second}/complete")
+
+        data = client.get("/api/v1/orders/summary").json()
+
+        assert data["counts"]["pending"] == 1
+        assert data["counts"]["cancelled"] == 1
+        assert data["counts"]["completed"] == 1
+        assert data["active_orders"] == 1
+        assert data["revenue_today"] == 30.75
+        assert data["completed_today"] == 1
+        assert data["oldest_active_age_seconds"] >= 0
+
+        oldest = client.get("/api/v1/orders/pending").json()[0]
+        assert oldest["id"] == third
+        assert datetime.fromisoformat(data["oldest_active_created_at"]) == datetime.fromisoformat(
+            oldest["created_at"]
+        ).replace(tzinfo=timezone.utc)
+
+    def test_failed_transition_leaves_counters(self, client: TestClient):
+        """Test that rejected transitions do not touch the counters."""
+        order_id = _create_order(client)
+        client.delete(f"/api/v1/orders/{order_id}")
+
+        assert client.patch(f"/api/v1/orders/{order_id}/complete").status_code == 400
+        assert client.delete(f"/api/v1/orders/{order_id}").status_code == 400
+
+        data = client.get("/api/v1/orders/summary").json()
+        assert data["counts"]["cancelled"] == 1
+        assert data["counts"]["completed"] == 0
+        assert data["counts"]["pending"] == 0
+
+
+class TestCounters:
+    """Test counter helpers."""
+
+    def test_backfill_from_existing_orders(self, test_db: Session):
+        """Test that counters are seeded once from orders written before them."""
+        test_db.add_all(
+            [
+                Order(table_number=1, status=OrderStatus.PENDING),
+                Order(table_number=2, status=OrderStatus.READY),
+                Order(table_number=3, status=OrderStatus.READY),
+            ]
+        )
+        test_db.commit()
+
+        assert backfill_status_counts(test_db) is True
+        assert backfill_status_counts(test_db) is False
+
+        summary = read_summary(test_db)
+        assert summary["counts"][OrderStatus.PENDING] == 1
+        assert summary["counts"][OrderStatus.READY] == 2
+        assert summary["counts"][OrderStatus.COMPLETED] == 0
+        assert summary["oldest_active_created_at"] is not None
+
+    def test_backfill_tolerates_concurrent_seed(self, test_db: Session, monkeypatch):
+        """Test that a worker losing the seeding race backs off instead of failing."""
+        test_db.add(Order(table_number=1, status=OrderStatus.PENDING))
+        test_db.commit()
+        assert backfill_status_counts(test_db) is True
+
+        # Another worker saw the table empty too and inserts after the winner
+        monkeypatch.setattr(test_db, "scalar", lambda *args, **kwargs: 0)
+
+        assert backfill_status_counts(test_db) is False
+        monkeypatch.undo()
+        assert read_summary(test_db)["counts"][OrderStatus.PENDING] == 1
+
+    def test_business_day_uses_timezone(self, monkeypatch):
+        """Test that the revenue day follows the configured timezone."""
+        now = datetime(2026, 2, 1, 3, 0, tzinfo=timezone.utc)
+
+        monkeypatch.setattr(settings, "business_timezone", "UTC")
+        assert business_day(now) == date(2026, 2, 1)
+        monkeypatch.setattr(settings, "business_timezone", "America/El_Salvador")
+        assert business_day(now) == date(2026, 1, 31)
@@ -0,0 +1,100 @@
+"""Tests for the per-table open tab endpoints."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend.models.order import Order, OrderStatus
+
+
+def _create_order(client: TestClient, table_number: int, price: float = 2.50) -> int:
+    response = client.post(
+        "/api/v1/orders",
+        json={"table_number": table_number, "items": [{"name": "Taco", "amount": 2, "price": price}]},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+class TestTableOrdersEndpoint:
+    """Test GET /api/v1/tables/{table_number}/orders endpoint."""
+
+    def test_table_orders_only_open_of_that_table(self, client: TestClient):
+        """Test that only the table's open orders are returned with their total."""
+        first = _create_order(client, 5)
+        second = _create_order(client, 5, price=4.00)
+        cancelled = _create_order(client, 5)
+        completed = _create_order(client, 5)
+        _create_order(client, 7)
+        client.delete(f"/api/v1/orders/{cancelled}")
+        client.patch(f"/api/v1/orders/{completed}/complete")
+
+        response = client.get("/api/v1/tables/5/orders")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["table_number"] == 5
+        assert [o["id"] for o in data["orders"]] == [first, second]
+        assert data["orders"][0]["items"][0]["name"] == "Taco"
+        assert data["total"] == 13.00
+
+    def test_table_orders_without_items(self, client: TestClient):
+        """Test include_items=false keeps totals but skips items."""
+        _create_order(client, 2)
+
+        data = client.get("/api/v1/tables/2/orders?include_items=false").json()
+
+        assert data["orders"][0]["items"] is None
+        assert data["orders"][0]["total"] == 5.00
+
+    def test_table_orders_empty(self, client: TestClient):
+        """Test a table without open orders."""
+        response = client.get("/api/v1/tables/9/orders")
+
+        assert response.status_code == 200
+        assert response.json() == {"table_number": 9, "orders": [], "total": 0.0}
+
+    def test_table_orders_invalid_table(self, client: TestClient):
+        """Test that table numbers must be positive."""
+        assert client.get("/api/v1/tables/0/orders").status_code == 422
+
+
+class TestOpenTabsEndpoint:
+    """Test GET /api/v1/tables endpoint."""
+
+    def test_open_tabs(self, client: TestClient):
+        """Test one entry per table with open orders, sorted by table."""
+        _create_order(client, 8)
+        _create_order(client, 3)
+        _create_order(client, 8, price=1.25)
+        closed = _create_order(client, 4)
+        client.patch(f"/api/v1/orders/{closed}/complete")
+
+        response = client.get("/api/v1/tables")
+
+        assert response.status_code == 200
+        tabs = response.json()
+        assert [(t["table_number"], t["order_count"], t["total"]) for t in tabs] == [
+            (3, 1, 5.00),
+            (8, 2, 7.50),
+        ]
+        assert tabs[0]["oldest_order_at"] is not None
+
+    def test_open_tabs_counts_orders_without_items_once(self, test_db: Session, client: TestClient):
+        """Test that orders are counted once regardless of their number of items."""
+        test_db.add(Order(table_number=6, status=OrderStatus.READY))
+        test_db.commit()
+
+        assert client.get("/api/v1/tables").json()[0]["order_count"] == 1
+
+
+def test_table_lookup_uses_index(test_db: Session):
+    """Test that per-table lookups seek the (table_number, status) index."""
+    plan = test_db.execute(
+        text(
+            "EXPLAIN QUERY PLAN SELECT id FROM orders "
+            "WHERE table_number = 5 AND status IN ('PENDING', 'READY')"
+        )
+    ).all()
+
+    assert any("ix_orders_table_number_status" in row[-1] for row in plan)
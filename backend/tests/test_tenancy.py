@@ -0,0 +1,209 @@
+"""Tests for per-tenant database routing."""
+
+import threading
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy import inspect
+
+from backend import changes, tenancy
+from backend.config import Settings, settings
+from backend.routes import orders
+from backend.tenancy import (
+    InvalidTenantError,
+    TenantEngineRegistry,
+    resolve_tenant,
+    validate_tenant,
+)
+
+
+class TestResolveTenant:
+    """Test tenant resolution from headers and host."""
+
+    def test_header_wins(self):
+        headers = {"x-tenant-id": "centro", "host": "norte.pupas.app"}
+        assert resolve_tenant(headers, "x-tenant-id", "pupas.app", "main") == "centro"
+
+    def test_subdomain(self):
+        headers = {"host": "norte.pupas.app:8000"}
+        assert resolve_tenant(headers, "x-tenant-id", "pupas.app", None) == "norte"
+
+    def test_nested_subdomain_and_bare_domain_fall_back_to_default(self):
+        assert resolve_tenant({"host": "a.b.pupas.app"}, "x-tenant-id", "pupas.app", "main") == "main"
+        assert resolve_tenant({"host": "pupas.app"}, "x-tenant-id", "pupas.app", None) is None
+
+    @pytest.mark.parametrize("raw", ["../etc", "a_b", "", "-a", "x" * 64])
+    def test_invalid_ids(self, raw: str):
+        with pytest.raises(InvalidTenantError):
+            validate_tenant(raw)
+
+    def test_ids_are_normalised(self):
+        assert validate_tenant(" Centro ") == "centro"
+
+
+class TestTenantEngineRegistry:
+    """Test lazy creation and LRU eviction."""
+
+    def test_creates_initialised_database_on_first_use(self, tmp_path: Path):
+        registry = TenantEngineRegistry(f"sqlite:///{tmp_path}/tenants/{{tenant}}.db")
+        assert registry.tenants() == []
+
+        database = registry.get("centro")
+
+        assert (tmp_path / "tenants" / "centro.db").exists()
+        assert "orders" in inspect(database.engine).get_table_names()
+        assert registry.get("centro") is database
+        assert registry.created == 1
+        registry.dispose_all()
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        registry = TenantEngineRegistry(f"sqlite:///{tmp_path}/{{tenant}}.db", max_engines=2)
+        registry.get("a")
+        registry.get("b")
+        registry.get("a")
+
+        registry.get("c")
+
+        assert registry.tenants() == ["a", "c"]
+        assert registry.evicted == 1
+        # Evicted tenants come back (with their data) on next use
+        registry.get("b")
+        assert registry.tenants() == ["c", "b"]
+        assert registry.created == 4
+        registry.dispose_all()
+
+    def test_reopening_evicted_tenant_skips_initialisation(self, tmp_path: Path, monkeypatch):
+        registry = TenantEngineRegistry(f"sqlite:///{tmp_path}/{{tenant}}.db", max_engines=1)
+        initialised = []
+        monkeypatch.setattr(tenancy, "_initialise", lambda engine: initialised.append(engine))
+
+        registry.get("a")
+        registry.get("b")
+        registry.get("a")
+
+        assert len(initialised) == 2
+        registry.dispose_all()
+
+    def test_slow_tenant_does_not_block_others(self, tmp_path: Path, monkeypatch):
+        """Test that creating one tenant's database happens outside the registry lock."""
+        registry = TenantEngineRegistry(f"sqlite:///{tmp_path}/{{tenant}}.db")
+        registry.get("fast")
+        registry.dispose_all()
+        started = threading.Event()
+        release = threading.Event()
+        initialise = tenancy._initialise
+
+        def slow_initialise(engine):
+            started.set()
+            release.wait(timeout=5)
+            initialise(engine)
+
+        monkeypatch.setattr(tenancy, "_initialise", slow_initialise)
+        slow = threading.Thread(target=registry.get, args=("slow",))
+        slow.start()
+        started.wait(timeout=5)
+
+        registry.get("fast")
+        assert registry.tenants() == ["fast"]
+        release.set()
+        slow.join()
+        assert registry.tenants() == ["fast", "slow"]
+        registry.dispose_all()
+
+
+@pytest.fixture
+def tenant_client(tmp_path: Path, monkeypatch) -> TestClient:
+    """Client whose get_db routes to per-tenant SQLite files under tmp_path."""
+    registry = TenantEngineRegistry(f"sqlite:///{tmp_path}/{{tenant}}.db")
+    monkeypatch.setattr(tenancy, "tenant_registry", registry)
+    monkeypatch.setattr(settings, "tenancy_enabled", True)
+    monkeypatch.setattr(settings, "tenant_base_domain", "pupas.app")
+    monkeypatch.setattr(settings, "default_tenant", None)
+    monkeypatch.setattr(settings, "tenant_allowlist", ["centro", "norte"])
+    monkeypatch.setattr(settings, "tenant_auto_create", False)
+
+    app = FastAPI()
+    app.include_router(orders.router, prefix="/api/v1")
+    with TestClient(app) as client:
+        yield client
+    registry.dispose_all()
+
+
+def _create(client: TestClient, **kwargs) -> int:
+    response = client.post(
+        "/api/v1/orders",
+        json={"table_number": 1, "items": [{"name": "Pupusa", "amount": 1, "price": 1.00}]},
+        **kwargs,
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_memory_repository_rejected_with_tenancy():
+    with pytest.raises(ValidationError, match="ORDER_REPOSITORY=sqlalchemy"):
+        Settings(_env_file=None, tenancy_enabled=True, order_repository="memory")
+
+
+def test_tenancy_requires_allowlist_or_auto_create():
+    with pytest.raises(ValidationError, match="TENANT_ALLOWLIST"):
+        Settings(_env_file=None, tenancy_enabled=True)
+
+    assert Settings(_env_file=None, tenancy_enabled=True, tenant_allowlist=["centro"])
+    assert Settings(_env_file=None, tenancy_enabled=True, tenant_auto_create=True)
+
+
+def test_background_tasks_cover_open_tenants(tenant_client: TestClient, monkeypatch):
+    """Test that compaction reaches tenant databases, not just the default one."""
+    for _ in range(2):
+        _create(tenant_client, headers={"X-Tenant-ID": "centro"})
+    # Stand-in for the default database, so the test never touches it
+    monkeypatch.setattr(changes, "SessionLocal", tenancy.tenant_registry.get("norte").session_factory)
+
+    assert [tenant for tenant, _ in tenancy.live_tenant_engines()] == ["centro", "norte"]
+    # Every database keeps its newest entry; centro had two
+    assert changes._compact_once(timedelta(0)) == 1
+
+
+def test_tenants_are_isolated(tenant_client: TestClient):
+    """Test that each tenant reads and writes only its own database."""
+    _create(tenant_client, headers={"X-Tenant-ID": "centro"})
+    _create(tenant_client, headers={"X-Tenant-ID": "centro"})
+    _create(tenant_client, headers={"Host": "norte.pupas.app"})
+
+    centro = tenant_client.get("/api/v1/orders/pending", headers={"X-Tenant-ID": "centro"})
+    norte = tenant_client.get("/api/v1/orders/pending", headers={"X-Tenant-ID": "norte"})
+
+    assert [o["id"] for o in centro.json()] == [1, 2]
+    assert [o["id"] for o in norte.json()] == [1]
+
+
+def test_missing_tenant(tenant_client: TestClient):
+    """Test that requests without a tenant are rejected."""
+    response = tenant_client.get("/api/v1/orders/pending")
+
+    assert response.status_code == 400
+    assert "X-Tenant-ID" in response.json()["detail"]
+
+
+def test_invalid_and_unknown_tenants(tenant_client: TestClient):
+    """Test malformed ids (400) and ids outside the allowlist (404)."""
+    invalid = tenant_client.get("/api/v1/orders/pending", headers={"X-Tenant-ID": "../x"})
+    unknown = tenant_client.get("/api/v1/orders/pending", headers={"X-Tenant-ID": "sur"})
+
+    assert invalid.status_code == 400
+    assert unknown.status_code == 404
+    assert tenancy.tenant_registry.tenants() == []
+
+
+def test_auto_create_accepts_any_tenant(tenant_client: TestClient, monkeypatch):
+    """Test that TENANT_AUTO_CREATE serves ids outside the allowlist."""
+    monkeypatch.setattr(settings, "tenant_auto_create", True)
+
+    response = tenant_client.get("/api/v1/orders/pending", headers={"X-Tenant-ID": "sur"})
+
+    assert response.status_code == 200
+    assert tenancy.tenant_registry.tenants() == ["sur"]
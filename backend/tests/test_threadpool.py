@@ -0,0 +1,99 @@
+"""Tests for threadpool sizing and wait metrics."""
+
+import threading
+
+import anyio
+import anyio.to_thread
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.request_context import current_operation_id
+from backend.routes import admin
+from backend.threadpool import (
+    MeteredLimiter,
+    ThreadpoolStats,
+    install,
+    threadpool_snapshot,
+    threadpool_stats,
+)
+
+
+class TestInstall:
+    """Test install() on a fresh event loop."""
+
+    def test_sizes_and_meters_default_limiter(self):
+        threadpool_stats.reset()
+
+        async def scenario():
+            install(1)
+            install(2)  # Resizing keeps the existing wrapper
+            limiter = anyio.to_thread.current_default_thread_limiter()
+            release = threading.Event()
+            current_operation_id.set("list_pending_orders")
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(4):
+                    tg.start_soon(anyio.to_thread.run_sync, release.wait, 5)
+                await anyio.sleep(0.05)
+                during = threadpool_snapshot()
+                release.set()
+            return limiter, during
+
+        limiter, during = anyio.run(scenario)
+
+        assert isinstance(limiter, MeteredLimiter)
+        assert during["metered"] is True
+        assert during["total_tokens"] == 2
+        assert during["borrowed_tokens"] == 2
+        assert during["waiting"] == 2
+        assert during["peak_waiting"] == 2
+        wait = threadpool_stats.snapshot()["waits"][0]
+        assert wait["operation_id"] == "list_pending_orders"
+        assert wait["count"] == 4
+        assert wait["max_ms"] > 0
+
+
+class TestThreadpoolStats:
+    """Test ThreadpoolStats aggregation."""
+
+    def test_aggregates_and_reset(self):
+        stats = ThreadpoolStats(sample_size=10)
+        stats.record("create_order", 1.0, queued=False)
+        for wait_ms in (2.0, 30.0):
+            stats.enter_queue()
+            stats.record("create_order", wait_ms, queued=True)
+        stats.enter_queue()
+        stats.enter_queue()
+        stats.record("get_order", 5.0, queued=True)
+
+        snapshot = stats.snapshot()
+        assert snapshot["waiting"] == 1
+        assert snapshot["peak_waiting"] == 2
+        assert snapshot["waits"][0] == {
+            "operation_id": "create_order",
+            "count": 3,
+            "total_ms": 33.0,
+            "mean_ms": 11.0,
+            "max_ms": 30.0,
+            "p95_ms": 30.0,
+        }
+
+        stats.reset()
+        assert stats.snapshot() == {"waiting": 1, "peak_waiting": 1, "waits": []}
+
+
+class TestThreadpoolEndpoint:
+    """Test GET /api/v1/admin/threadpool."""
+
+    def test_reports_limiter(self):
+        app = FastAPI()
+        app.include_router(admin.router, prefix="/api/v1")
+
+        with TestClient(app) as client:
+            body = client.get("/api/v1/admin/threadpool").json()
+            reset = client.delete("/api/v1/admin/threadpool")
+
+        assert body["total_tokens"] > 0
+        assert body["borrowed_tokens"] >= 0
+        assert isinstance(body["waits"], list)
+        assert reset.status_code == 204
@@ -0,0 +1,139 @@
+"""Tests for request tracing spans, Server-Timing and OTLP export."""
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import get_db
+from backend.routes import orders
+from backend.tracing import (
+    SPAN_KIND_SERVER,
+    Span,
+    Trace,
+    TraceExporter,
+    TracingMiddleware,
+    is_tracing,
+    span,
+)
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path) -> Path:
+    return tmp_path / "traces.jsonl"
+
+
+@pytest.fixture
+def exporter(trace_file: Path) -> Generator[TraceExporter, None, None]:
+    exporter = TraceExporter(str(trace_file), max_bytes=10_000_000)
+    yield exporter
+    exporter.close()
+
+
+@pytest.fixture
+def traced_client(test_engine, exporter: TraceExporter) -> Generator[TestClient, None, None]:
+    """Create an orders app that traces every request."""
+    app = FastAPI()
+    app.include_router(orders.router, prefix="/api/v1")
+    app.add_middleware(TracingMiddleware, sample_rate=1.0, exporter=exporter)
+
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as client:
+        yield client
+
+
+def _exported_spans(exporter: TraceExporter, trace_file: Path) -> list[dict]:
+    exporter.flush()
+    lines = trace_file.read_text().splitlines()
+    payload = json.loads(lines[-1])
+    return payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+
+class TestTracingMiddleware:
+    """Test traced requests end to end."""
+
+    def test_create_order_phases(self, traced_client: TestClient, exporter: TraceExporter, trace_file: Path):
+        """Test that create_order records each phase and DB statements."""
+        response = traced_client.post(
+            "/api/v1/orders",
+            json={"table_number": 1, "items": [{"name": "Pupusa", "amount": 1, "price": 1.00}]},
+        )
+
+        assert response.status_code == 201
+        timing = response.headers["Server-Timing"]
+        for phase in ("validation", "handler", "db-commit", "db-refresh", "db", "serialization", "app"):
+            assert f"{phase};dur=" in timing
+
+        spans = _exported_spans(exporter, trace_file)
+        by_name = {s["name"]: s for s in spans}
+        root = by_name["POST create_order"]
+        assert "parentSpanId" not in root
+        assert by_name["handler"]["parentSpanId"] == root["spanId"]
+        assert by_name["db.commit"]["parentSpanId"] == by_name["handler"]["spanId"]
+        db_spans = [s for s in spans if s["name"] == "db.query"]
+        assert any(
+            a["value"]["stringValue"].startswith("INSERT INTO orders")
+            for s in db_spans
+            for a in s["attributes"]
+            if a["key"] == "db.statement"
+        )
+        assert len({s["traceId"] for s in spans}) == 1
+
+    def test_validation_error_is_traced(self, traced_client: TestClient, exporter: TraceExporter, trace_file: Path):
+        """Test that a 422 still gets a validation span and no handler span."""
+        response = traced_client.post("/api/v1/orders", json={"table_number": 0, "items": []})
+
+        assert response.status_code == 422
+        names = {s["name"] for s in _exported_spans(exporter, trace_file)}
+        assert "validation" in names
+        assert "handler" not in names
+
+    def test_unsampled_requests_have_no_header(self, test_engine):
+        """Test that a zero sample rate disables tracing."""
+        app = FastAPI()
+
+        @app.get("/ping")
+        def ping() -> dict[str, bool]:
+            return {"tracing": is_tracing()}
+
+        app.add_middleware(TracingMiddleware, sample_rate=0.0)
+        response = TestClient(app).get("/ping")
+
+        assert "Server-Timing" not in response.headers
+        assert response.json() == {"tracing": False}
+
+
+def test_export_happens_off_the_caller_and_drops_when_full(trace_file: Path):
+    """Test that export() only enqueues, and a full queue drops instead of blocking."""
+    exporter = TraceExporter(str(trace_file), max_bytes=10_000_000, queue_size=1)
+    exporter._listener.stop()  # Nothing drains the queue
+    trace = Trace()
+    trace.add(Span(trace, "GET /ping", None, SPAN_KIND_SERVER))
+
+    exporter.export(trace, "test")
+    exporter.export(trace, "test")
+
+    assert exporter.dropped == 1
+    assert not trace_file.exists()
+    exporter._listener.start()
+    exporter.close()
+    assert len(trace_file.read_text().splitlines()) == 1
+
+
+def test_span_is_noop_without_trace():
+    """Test that span() yields None outside a sampled request."""
+    with span("anything") as s:
+        assert s is None